@@ -2,21 +2,33 @@
 Defines the Agent class for interacting with the Google Gemini API and MCP server.
 """
 
+import asyncio
 import json
 
 import discord
 from google import genai
-from google.genai.types import Content, GenerateContentConfig
-from mcp import ClientSession, types
-from mcp.client.streamable_http import streamablehttp_client
-
+from google.genai.types import (
+    AutomaticFunctionCallingConfig,
+    FunctionCall,
+    GenerateContentConfig,
+    Part,
+)
+from mcp import types
+
+from bot.agents.context_builder import ContextBuilder
+from bot.agents.conversation_cache import ConversationCache, ThreadHistory
 from bot.agents.instructions import AGENT_INSTRUCTIONS
 from bot.agents.tools.get_service_health import get_service_health
+from bot.agents.tools.mcp_client import READ_ONLY_TOOLS, mcp_session
 from bot.agents.tools.restart_service import restart_service
 from bot.agents.tools.trigger_user import trigger_user
 from bot.config.command_center import command_center_config
 from bot.models.prompt import Prompt
 from bot.utils.console_logger import console_logger
+from bot.utils.tracing import span, traced
+
+# tools exposed to Gemini, keyed by the name it uses to call them
+AGENT_TOOLS = {tool.__name__: tool for tool in (get_service_health, restart_service, trigger_user)}
 
 
 class CommandCenterAgent:
@@ -35,84 +47,95 @@ class CommandCenterAgent:
         """
         Initialize the CommandCenterAgent.
 
-        Sets up authentication headers and internal data structures used to manage
-        prompt templates retrieved from the MCP server. These include:
+        Sets up the Gemini client and internal data structures used to manage
+        prompt templates retrieved from the MCP server and conversation history.
         """
         # Holds all user‐role prompt templates for client‐side selection
         self.system_context: str = ""
+        self.services: list[str] = []
         self.user_prompts: list[Prompt] = []
-        self.headers = {"Authorization": f"Bearer {command_center_config.mcp_server_token}"}
         self.client = genai.Client()
+        self.tool_semaphore = asyncio.Semaphore(command_center_config.agent_tool_concurrency)
+        self.conversation_cache = ConversationCache(
+            max_threads=command_center_config.agent_cache_max_threads,
+            max_messages=command_center_config.agent_history_size,
+        )
+        self.context_builder = ContextBuilder(
+            history_token_budget=command_center_config.agent_history_token_budget,
+            summary_token_budget=command_center_config.agent_summary_token_budget,
+            max_messages=command_center_config.agent_history_size,
+        )
 
     async def load_all_prompts(self):
         """
         Load all prompts from the MCP server.
+
+        The prompt definitions are fetched concurrently and swapped in at once, so
+        readers never see a partially loaded list.
         """
         console_logger.info("Initializing prompts from MCP server...")
-        async with streamablehttp_client(command_center_config.mcp_server_url, headers=self.headers) as (
-            read_stream,
-            write_stream,
-            _,
-        ):
-            # create session
-            async with ClientSession(read_stream, write_stream) as session:
-                await session.initialize()
-
-                # fetch available prompts
-                prompts_response = await session.list_prompts()
-                console_logger.info(
-                    "Available prompts: %s",
-                    [p.name for p in prompts_response.prompts],
+        async with mcp_session() as session:
+
+            # fetch available prompts
+            prompts_response = await session.list_prompts()
+            console_logger.info(
+                "Available prompts: %s",
+                [p.name for p in prompts_response.prompts],
+            )
+
+            results = await asyncio.gather(
+                *(session.get_prompt(prompt_def.name) for prompt_def in prompts_response.prompts)
+            )
+
+        # populate user prompts
+        user_prompts = []
+        for prompt_def, result in zip(prompts_response.prompts, results):
+            for msg in result.messages:
+                txt = msg.content.text if isinstance(msg.content, types.TextContent) else str(msg.content)
+                user_prompts.append(
+                    Prompt(
+                        custom_id=prompt_def.name,
+                        title=prompt_def.name,
+                        description=prompt_def.description[:100],
+                        content=txt or "",
+                    )
                 )
-
-                # reset any existing prompts
-                self.user_prompts = []
-
-                # populate user prompts
-                for prompt_def in prompts_response.prompts:
-                    result = await session.get_prompt(prompt_def.name)
-                    for msg in result.messages:
-                        txt = msg.content.text if isinstance(msg.content, types.TextContent) else str(msg.content)
-                        self.user_prompts.append(
-                            Prompt(
-                                custom_id=prompt_def.name,
-                                title=prompt_def.name,
-                                description=prompt_def.description[:100],
-                                content=txt or "",
-                            )
-                        )
+        self.user_prompts = user_prompts
 
     async def set_system_context(self):
         """
         Set system context after fetching list of services from the MCP server.
+
+        The system context is only rebuilt when the list of services has changed.
         """
         console_logger.info("Initializing resources from MCP server...")
-        async with streamablehttp_client(command_center_config.mcp_server_url, headers=self.headers) as (
-            read_stream,
-            write_stream,
-            _,
-        ):
-            # create session
-            async with ClientSession(read_stream, write_stream) as session:
-                await session.initialize()
-                result = await session.read_resource("system://services")
+        async with mcp_session() as session:
+            result = await session.read_resource("system://services")
 
-                # Extract and parse the JSON text
-                services_json = json.loads(result.contents[0].text)
-                services_list = services_json["services"]
+        # Extract and parse the JSON text
+        services_json = json.loads(result.contents[0].text)
+        services_list = services_json["services"]
+        if self.system_context and services_list == self.services:
+            return
+        self.services = services_list
 
-                # Join services into a comma-separated string
-                services_string = ", ".join(services_list)
+        # Join services into a comma-separated string
+        services_string = ", ".join(services_list)
 
-                # Replace in SYSTEM_CONTEXT
-                self.system_context = AGENT_INSTRUCTIONS["system_context"].replace("{services}", services_string)
+        # Replace in SYSTEM_CONTEXT
+        self.system_context = AGENT_INSTRUCTIONS["system_context"].replace("{services}", services_string)
 
-                console_logger.info("Final System Context:")
-                console_logger.info(self.system_context)
+        console_logger.info("Final System Context:")
+        console_logger.info(self.system_context)
 
+    @traced("agent.turn")
     async def get_agent_response(self, user_input: str, thread: discord.Thread) -> tuple[str, list[dict]]:
         """
-        Send the user's request to Gemini with automatic function‐calling.
+        Send the user's request to Gemini and run the tool calls it requests.
+
+        The function-calling loop is driven manually: independent tool calls requested
+        in the same step are run concurrently over a shared MCP session, and their
+        results are sent back to Gemini together before the next model call.
 
         Args:
             user_input (str): The user input to the agent.
@@ -121,105 +144,172 @@ class CommandCenterAgent:
         Returns:
             tuple[str, list[dict]]: A tuple of:
                 1) the assistant's final text
-                2) a list of all actions taken, e.g. [{"name": ..., "args": ...}, {"tool": ..., "result": ...}, ...]
-
-        """
-        async with streamablehttp_client(command_center_config.mcp_server_url, headers=self.headers) as (
-            read_stream,
-            write_stream,
-            _,
-        ):
-            async with ClientSession(read_stream, write_stream) as session:
-                await session.initialize()
-
-                history = await self._get_thread_history(thread)
-
-                # set up Gemini with auto function‐calling
-                chat = self.client.aio.chats.create(
-                    model=command_center_config.gemini_model,
-                    history=history,
-                    config=GenerateContentConfig(
-                        temperature=0,
-                        tools=[get_service_health, restart_service, trigger_user],
-                        system_instruction=self.system_context,
-                    ),
-                )
+                2) a list of all actions taken, e.g. [{"name": ..., "args": ..., "result": ...}, ...]
 
-                try:
-                    # send the user message and await the final assistant reply
+        """
+        async with mcp_session():
+            thread_history = await self._get_thread_history(thread, user_input)
+            history, summary = self.context_builder.build(thread_history)
+
+            # the input joins the cached history now, so messages arriving mid-turn are recorded after it
+            self.conversation_cache.append(thread.id, "user", user_input)
+
+            # older messages that no longer fit the token budget are passed as a summary
+            system_instruction = self.system_context
+            if summary:
+                system_instruction += f"\nSummary of earlier messages in this conversation:\n{summary}\n"
+
+            # set up Gemini with tools, function calls are handled by the loop below
+            chat = self.client.aio.chats.create(
+                model=command_center_config.gemini_model,
+                history=history,
+                config=GenerateContentConfig(
+                    temperature=0,
+                    tools=list(AGENT_TOOLS.values()),
+                    system_instruction=system_instruction,
+                    automatic_function_calling=AutomaticFunctionCallingConfig(disable=True),
+                ),
+            )
+
+            actions: list[dict] = []
+            try:
+                # send the user message, then keep answering tool calls until the model replies with text
+                with span("gemini.send_message"):
                     response = await chat.send_message(user_input)
+                for _ in range(command_center_config.agent_max_tool_steps):
+                    if not response.function_calls:
+                        break
+                    step_actions = await self._run_tool_calls(response.function_calls)
+                    actions.extend(step_actions)
+                    with span("gemini.send_message", function_responses=len(step_actions)):
+                        response = await chat.send_message(
+                            [
+                                Part.from_function_response(name=act["name"], response=act["result"])
+                                for act in step_actions
+                            ]
+                        )
 
-                except Exception as e:
-                    console_logger.error(f"A 500 Internal Server Error occurred with the Gemini API: {e}")
+            except Exception as e:
+                console_logger.error(f"A 500 Internal Server Error occurred with the Gemini API: {e}")
 
-                    # return user-friendly message for unexpected errors
-                    error_message = (
-                        "I'm sorry, but I encountered a temporary problem with the AI service "
-                        "while processing your request. This is usually a transient issue. "
-                        "Please try again in a moment."
-                    )
-                    return error_message, []
+                # return user-friendly message for unexpected errors
+                error_message = (
+                    "I'm sorry, but I encountered a temporary problem with the AI service "
+                    "while processing your request. This is usually a transient issue. "
+                    "Please try again in a moment."
+                )
+                self._record_output(thread.id, actions, error_message)
+                return error_message, actions
+
+            if response.function_calls:
+                # the model still wants to call tools, but it has used up its steps
+                max_steps = command_center_config.agent_max_tool_steps
+                console_logger.warning(f"🚫 Agent reached its limit of {max_steps} tool steps in thread {thread.id}.")
+                response_text = (
+                    f"⚠️ I reached my limit of {max_steps} tool steps before finishing this request. "
+                    "The actions I took so far are listed above, please ask me to continue or narrow the request."
+                )
+            else:
+                response_text = response.text or ""
 
-                # retrieve actions performed by the agent
-                actions = self._extract_actions_from_history(chat.get_history())
+            # record the output of the turn so the next one can reuse the cached history
+            self._record_output(thread.id, actions, response_text)
 
-                return response.text, actions
+            return response_text, actions
 
-    async def _get_thread_history(self, thread: discord.Thread) -> list[dict]:
+    def _record_output(self, thread_id: int, actions: list[dict], response_text: str):
         """
-        Fetch and format the message history from a discord thread.
+        Append the actions and response sent to a thread in a turn to its cached history.
 
         Args:
-            thread: The thread to get history for.
+            thread_id (int): The id of the thread.
+            actions (list[dict]): The actions taken in the turn.
+            response_text (str): The response sent for the turn.
+
+        """
+        if actions:
+            action_lines = [f"- Tool `{act['name']}` with args {act['args']}: {act['result']}" for act in actions]
+            self.conversation_cache.append(thread_id, "model", "Agent actions:\n" + "\n".join(action_lines))
+        self.conversation_cache.append(thread_id, "model", response_text)
+
+    async def _run_tool_calls(self, function_calls: list[FunctionCall]) -> list[dict]:
+        """
+        Run the tool calls requested by the model in a single step.
+
+        Read-only calls are independent of each other and run concurrently (bounded by
+        the tool semaphore). A mutating call acts as a barrier: calls before it finish
+        first and calls after it only start once it is done, preserving the model's order.
+
+        Args:
+            function_calls (list[FunctionCall]): The function calls requested by the model.
 
         Returns:
-            list[dict]: A list of dictionaries representing the message history.
+            list[dict]: The actions taken, in the same order as the function calls.
 
         """
-        history = []
-        async for msg in thread.history(limit=command_center_config.agent_history_size):
-            if msg.content.strip() == "":
+        actions: list[dict] = []
+        batch: list[FunctionCall] = []
+        for call in function_calls:
+            if call.name in READ_ONLY_TOOLS:
+                batch.append(call)
                 continue
-            role = "user" if msg.author.id != thread.me.id else "model"
-            history.append({"role": role, "parts": [{"text": msg.content}]})
+            actions.extend(await asyncio.gather(*(self._run_tool_call(c) for c in batch)))
+            actions.append(await self._run_tool_call(call))
+            batch = []
+        actions.extend(await asyncio.gather(*(self._run_tool_call(c) for c in batch)))
+        return actions
 
-        # reverse the history to have the oldest message first
-        history.reverse()
-        return history
+    async def _run_tool_call(self, call: FunctionCall) -> dict:
+        """
+        Run a single tool call, capturing errors as part of its result.
+
+        Args:
+            call (FunctionCall): The function call requested by the model.
+
+        Returns:
+            dict: The action taken, with the name, args and result of the call.
 
-    def _extract_actions_from_history(self, history: list[Content]) -> list[dict]:
         """
-        Parse the chat history to extract all function calls and their results.
+        args = dict(call.args or {})
+        tool = AGENT_TOOLS.get(call.name)
+        if tool is None:
+            return {"name": call.name, "args": args, "result": {"error": f"Unknown tool: {call.name}"}}
+
+        async with self.tool_semaphore:
+            try:
+                result = {"result": await tool(**args)}
+            except Exception as e:
+                console_logger.error(f"❌ Tool call {call.name} failed: {e}")
+                result = {"error": str(e)}
+        return {"name": call.name, "args": args, "result": result}
+
+    async def _get_thread_history(self, thread: discord.Thread, user_input: str) -> ThreadHistory:
+        """
+        Get the conversation history of a discord thread.
+
+        The history is served from the conversation cache, and only fetched from
+        Discord (and used to seed the cache) on a cache miss.
 
         Args:
-            history: The conversation history from the Gemini chat session.
+            thread: The thread to get history for.
+            user_input: The input of the current turn, excluded from the history.
 
         Returns:
-            A list of dictionaries, where each dictionary represents an action taken.
+            ThreadHistory: The cached conversation history of the thread.
 
         """
-        actions: list[dict] = []
-        for i, msg in enumerate(history):
-            # a function call is initiated by the 'model', and the results are in the next message
-            if msg.role == "model" and msg.parts and (i + 1) < len(history):
-                next_msg = history[i + 1]
-
-                # ensure the next message is the tool response, which has a 'user' role
-                if next_msg.role == "user" and next_msg.parts:
-
-                    # extract function calls, skip any parts that don't contain a valid function_call object
-                    function_calls = [part.function_call for part in msg.parts if part.function_call]
-
-                    # extract function responses, skip any parts that don't contain a valid function_response object
-                    function_responses = [part.function_response for part in next_msg.parts if part.function_response]
-
-                    # pair up the calls and responses
-                    for call, response_part in zip(function_calls, function_responses):
-                        if call.name == response_part.name:
-                            action = {
-                                "name": call.name,
-                                "args": dict(call.args),
-                                "result": response_part.response,
-                            }
-                            actions.append(action)
-        return actions
+        history = self.conversation_cache.get(thread.id)
+        if history is not None:
+            return history
+
+        messages = [msg async for msg in thread.history(limit=command_center_config.agent_history_size)]
+
+        # reverse the history to have the oldest message first
+        messages.reverse()
+
+        # the message that triggered this turn is sent separately, so leave it out of the history
+        if messages and messages[-1].author.id != thread.me.id and messages[-1].content == user_input:
+            messages.pop()
+
+        self.conversation_cache.seed(thread.id, messages, thread.me.id)
+        return self.conversation_cache.get(thread.id)
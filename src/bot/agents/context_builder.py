@@ -0,0 +1,130 @@
+"""
+Token-budgeted context builder for agent turns.
+
+Fits the cached history of a thread into a token budget: the most recent
+messages are kept in full, and older messages are compacted into a rolling
+summary that is cached with the thread. Token counts are rough estimates
+(about four characters per token), which is enough to keep prompt sizes
+bounded without calling a tokenizer.
+"""
+
+from typing import List, Tuple
+
+from google.genai.types import Content
+
+from bot.agents.conversation_cache import ThreadHistory
+
+# maximum number of characters of a single message kept in the summary
+SUMMARY_LINE_LENGTH = 160
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Roughly estimate the number of tokens in a text.
+
+    Args:
+        text (str): The text to estimate.
+
+    Returns:
+        int: The estimated number of tokens.
+
+    """
+    return len(text) // 4 + 1
+
+
+class ContextBuilder:
+    """
+    Builds the conversation context sent to Gemini for a thread.
+
+    Attributes:
+        history_token_budget (int): The token budget for messages kept in full.
+        summary_token_budget (int): The token budget for the rolling summary.
+        max_messages (int): The maximum number of messages kept in full.
+
+    """
+
+    def __init__(self, history_token_budget: int, summary_token_budget: int, max_messages: int):
+        """
+        Initialize the ContextBuilder.
+
+        Args:
+            history_token_budget (int): The token budget for messages kept in full.
+            summary_token_budget (int): The token budget for the rolling summary.
+            max_messages (int): The maximum number of messages kept in full.
+
+        """
+        self.history_token_budget = history_token_budget
+        self.summary_token_budget = summary_token_budget
+        self.max_messages = max_messages
+
+    def build(self, thread_history: ThreadHistory) -> Tuple[List[Content], str]:
+        """
+        Build the context for a thread, compacting older messages into its summary.
+
+        Messages that no longer fit are removed from the thread history and folded
+        into its summary, so the work is only done once per message.
+
+        Args:
+            thread_history (ThreadHistory): The cached history of the thread.
+
+        Returns:
+            Tuple[List[Content], str]: The recent messages (oldest first) and the rolling summary.
+
+        """
+        messages = thread_history.messages
+
+        # walk back from the latest message until the count or token budget is reached
+        kept = 0
+        used_tokens = 0
+        for content in reversed(messages):
+            tokens = estimate_tokens(_get_text(content))
+            if kept >= self.max_messages or (kept and used_tokens + tokens > self.history_token_budget):
+                break
+            kept += 1
+            used_tokens += tokens
+
+        overflow = [messages.popleft() for _ in range(len(messages) - kept)]
+        if overflow:
+            thread_history.summary = self._summarize(thread_history.summary, overflow)
+
+        return list(messages), thread_history.summary
+
+    def _summarize(self, summary: str, contents: List[Content]) -> str:
+        """
+        Fold messages into a rolling summary, dropping the oldest lines past the budget.
+
+        Args:
+            summary (str): The existing summary.
+            contents (List[Content]): The messages to fold in, oldest first.
+
+        Returns:
+            str: The updated summary.
+
+        """
+        lines = summary.splitlines() if summary else []
+        for content in contents:
+            text = " ".join(_get_text(content).split())
+            if len(text) > SUMMARY_LINE_LENGTH:
+                text = text[:SUMMARY_LINE_LENGTH] + "..."
+            author = "Assistant" if content.role == "model" else "User"
+            lines.append(f"- {author}: {text}")
+
+        used_tokens = sum(estimate_tokens(line) for line in lines)
+        while lines and used_tokens > self.summary_token_budget:
+            used_tokens -= estimate_tokens(lines.pop(0))
+
+        return "\n".join(lines)
+
+
+def _get_text(content: Content) -> str:
+    """
+    Get the concatenated text of a content object.
+
+    Args:
+        content (Content): The content object.
+
+    Returns:
+        str: The text of all its parts.
+
+    """
+    return "".join(part.text or "" for part in content.parts or [])
@@ -0,0 +1,145 @@
+"""
+In-memory conversation cache for agent threads.
+
+Keeps the Gemini-ready conversation history of recently active threads so
+that each agent turn can reuse it instead of paging the thread history from
+Discord and rebuilding the content list. The number of cached threads is
+bounded by an LRU policy. Alongside the recent messages, each thread keeps a
+rolling summary of older messages that no longer fit the context window.
+Cached threads are kept up to date as messages arrive: the agent appends each
+input when its turn starts along with its actions and response, and messages
+of other bots in the thread are appended by the command center cog.
+"""
+
+from collections import OrderedDict, deque
+from typing import Deque, List, Optional
+
+import discord
+from google.genai.types import Content, Part
+
+
+class ThreadHistory:
+    """
+    Conversation state of a single thread.
+
+    Attributes:
+        messages (Deque[Content]): The recent messages kept in full, oldest first.
+        summary (str): A rolling summary of older messages that were compacted away.
+
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty ThreadHistory.
+        """
+        self.messages: Deque[Content] = deque()
+        self.summary: str = ""
+
+
+class ConversationCache:
+    """
+    LRU cache of conversation history keyed by thread id.
+
+    At most `max_threads` threads are cached (least recently used evicted first).
+    Seeding a thread keeps at most its `max_messages` latest messages; compaction of
+    the history into the context window is left to the context builder.
+
+    Attributes:
+        max_threads (int): The maximum number of threads to keep in the cache.
+        max_messages (int): The maximum number of messages kept when seeding a thread.
+
+    """
+
+    def __init__(self, max_threads: int, max_messages: int):
+        """
+        Initialize the ConversationCache.
+
+        Args:
+            max_threads (int): The maximum number of threads to keep in the cache.
+            max_messages (int): The maximum number of messages kept when seeding a thread.
+
+        """
+        self.max_threads = max_threads
+        self.max_messages = max_messages
+        self._threads: OrderedDict[int, ThreadHistory] = OrderedDict()
+
+    def get(self, thread_id: int) -> Optional[ThreadHistory]:
+        """
+        Get the cached history of a thread and mark it as recently used.
+
+        Args:
+            thread_id (int): The id of the thread.
+
+        Returns:
+            Optional[ThreadHistory]: The thread history, or None on a cache miss.
+
+        """
+        history = self._threads.get(thread_id)
+        if history is None:
+            return None
+        self._threads.move_to_end(thread_id)
+        return history
+
+    def seed(self, thread_id: int, messages: List[discord.Message], bot_user_id: int):
+        """
+        Populate the history of a thread from its Discord messages.
+
+        Args:
+            thread_id (int): The id of the thread.
+            messages (List[discord.Message]): The thread messages, oldest first.
+            bot_user_id (int): The id of the bot, used to attribute messages to the model.
+
+        """
+        history = ThreadHistory()
+        for msg in messages[-self.max_messages :]:
+            if msg.content.strip() == "":
+                continue
+            history.messages.append(_to_content("user" if msg.author.id != bot_user_id else "model", msg.content))
+
+        self._threads[thread_id] = history
+        self._threads.move_to_end(thread_id)
+        while len(self._threads) > self.max_threads:
+            self._threads.popitem(last=False)
+
+    def append(self, thread_id: int, role: str, text: str):
+        """
+        Append a message to the history of a cached thread.
+
+        Messages for threads that are not cached are ignored, since the history
+        will be seeded from Discord on the next miss anyway.
+
+        Args:
+            thread_id (int): The id of the thread.
+            role (str): The role of the author, either "user" or "model".
+            text (str): The message text.
+
+        """
+        history = self._threads.get(thread_id)
+        if history is None or text.strip() == "":
+            return
+        history.messages.append(_to_content(role, text))
+
+    def evict(self, thread_id: int):
+        """
+        Remove a thread from the cache.
+
+        Args:
+            thread_id (int): The id of the thread.
+
+        """
+        self._threads.pop(thread_id, None)
+
+
+def _to_content(role: str, text: str) -> Content:
+    """
+    Build a Gemini content object for a single text message.
+
+    Args:
+        role (str): The role of the author, either "user" or "model".
+        text (str): The message text.
+
+    Returns:
+        Content: The content object.
+
+    """
+    return Content(role=role, parts=[Part(text=text)])
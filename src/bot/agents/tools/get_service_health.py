@@ -11,13 +11,7 @@ todo: revisit this
 
 from typing import Dict
 
-from mcp import ClientSession
-from mcp.client.streamable_http import streamablehttp_client
-
-from bot.config.command_center import command_center_config
-from bot.utils.console_logger import console_logger
-
-headers = {"Authorization": f"Bearer {command_center_config.mcp_server_token}"}
+from bot.agents.tools.mcp_client import call_mcp_tool
 
 
 async def get_service_health(service_name: str) -> Dict:
@@ -32,17 +26,4 @@ async def get_service_health(service_name: str) -> Dict:
         result_dict (Dict): Dictionary containing result e.g. {'gallery-website': {'status': 'ok'}}
 
     """
-    async with streamablehttp_client(command_center_config.mcp_server_url, headers=headers) as (
-        read_stream,
-        write_stream,
-        _,
-    ):
-        async with ClientSession(read_stream, write_stream) as session:
-            await session.initialize()
-            mcp_response = await session.call_tool("get_service_health", arguments={"service_name": service_name})
-            console_logger.debug(f"Received raw MCP response object: {mcp_response}")
-
-            result_dict = mcp_response.structuredContent["result"]
-            console_logger.debug(f"Extracted result passed to Gemini: {result_dict}")
-
-            return result_dict
+    return await call_mcp_tool("get_service_health", arguments={"service_name": service_name})
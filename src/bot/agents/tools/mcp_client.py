@@ -0,0 +1,220 @@
+"""
+Shared MCP client helpers for agent tools.
+
+Tool stubs call the remote MCP server through `call_mcp_tool`. When an agent
+turn is running inside `mcp_session`, all tool calls made during the turn
+(including concurrent ones) share that single session instead of each opening
+its own connection to the MCP server.
+
+Results of read-only tools are cached for a short time, and concurrent identical
+calls share a single in-flight request, made over a session of its own so it
+does not depend on the session of the caller that started it. Mutating tools always reach the server
+and invalidate the cached results they may have made stale.
+"""
+
+import asyncio
+import contextvars
+import copy
+import json
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Awaitable, Callable, Dict, Optional, Tuple
+
+from mcp import ClientSession
+from mcp.client.streamable_http import streamablehttp_client
+
+from bot.config.command_center import command_center_config
+from bot.utils.console_logger import console_logger
+from bot.utils.tracing import span
+
+headers = {"Authorization": f"Bearer {command_center_config.mcp_server_token}"}
+
+# tools that only read state; any other tool is treated as mutating
+READ_ONLY_TOOLS = {"get_service_health"}
+
+# read-only tools whose cached results are made stale by each mutating tool
+INVALIDATED_TOOLS = {"restart_service": {"get_service_health"}}
+
+# session shared by tool calls made within an `mcp_session` context
+_active_session: ContextVar[Optional[ClientSession]] = ContextVar("active_mcp_session", default=None)
+
+
+class ToolResultCache:
+    """
+    TTL cache with single-flight coalescing for read-only tool results.
+
+    Attributes:
+        ttl (float): The number of seconds a result stays cached, 0 disables caching.
+
+    """
+
+    def __init__(self, ttl: float):
+        """
+        Initialize the ToolResultCache.
+
+        Args:
+            ttl (float): The number of seconds a result stays cached, 0 disables caching.
+
+        """
+        self.ttl = ttl
+        self._entries: Dict[Tuple[str, str], Tuple[float, Dict]] = {}
+        self._in_flight: Dict[Tuple[str, str], asyncio.Task] = {}
+
+    async def get_or_call(self, tool_name: str, arguments: Dict, call: Callable[[], Awaitable[Dict]]) -> Dict:
+        """
+        Get a cached result, join an identical in-flight call, or make the call.
+
+        Args:
+            tool_name (str): The name of the tool.
+            arguments (Dict): The arguments of the call.
+            call (Callable[[], Awaitable[Dict]]): Makes the call when there is no usable result.
+
+        Returns:
+            Dict: The result of the tool call, a copy that the caller is free to modify.
+
+        """
+        if self.ttl <= 0:
+            return await call()
+
+        key = (tool_name, json.dumps(arguments, sort_keys=True))
+        entry = self._entries.get(key)
+        if entry and entry[0] > time.monotonic():
+            return copy.deepcopy(entry[1])
+
+        task = self._in_flight.get(key)
+        if task is None:
+            # run the shared call outside the caller's context, so it opens (and closes) its own mcp session
+            # instead of using the caller's, which closes if that caller is cancelled
+            task = asyncio.create_task(call(), context=contextvars.Context())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda t: self._store(key, t))
+
+        # shield the shared call so one cancelled caller does not cancel it for the others
+        return copy.deepcopy(await asyncio.shield(task))
+
+    def invalidate(self, tool_name: str, service_name: Optional[str] = None):
+        """
+        Drop cached and in-flight results of a tool.
+
+        Args:
+            tool_name (str): The name of the tool.
+            service_name (Optional[str]): Only drop results for this service (and "all"), defaults to every result.
+
+        """
+        for cached in (self._entries, self._in_flight):
+            for key in list(cached):
+                name, args = key
+                if name != tool_name:
+                    continue
+                if service_name is None or json.loads(args).get("service_name") in (service_name, "all"):
+                    del cached[key]
+
+    def _store(self, key: Tuple[str, str], task: asyncio.Task):
+        """
+        Cache the result of a finished call unless it was invalidated in the meantime.
+
+        Args:
+            key (Tuple[str, str]): The cache key of the call.
+            task (asyncio.Task): The finished call.
+
+        """
+        if self._in_flight.get(key) is not task:
+            return
+        del self._in_flight[key]
+        if not task.cancelled() and task.exception() is None:
+            self._entries[key] = (time.monotonic() + self.ttl, task.result())
+
+
+tool_result_cache = ToolResultCache(command_center_config.mcp_tool_cache_ttl)
+
+
+@asynccontextmanager
+async def mcp_session() -> AsyncIterator[ClientSession]:
+    """
+    Open a session to the MCP server and share it with tool calls made within the context.
+
+    Yields:
+        ClientSession: The initialized MCP client session.
+
+    """
+    async with streamablehttp_client(command_center_config.mcp_server_url, headers=headers) as (
+        read_stream,
+        write_stream,
+        _,
+    ):
+        async with ClientSession(read_stream, write_stream) as session:
+            await session.initialize()
+            token = _active_session.set(session)
+            try:
+                yield session
+            finally:
+                _active_session.reset(token)
+
+
+async def call_mcp_tool(tool_name: str, arguments: Dict) -> Dict:
+    """
+    Call a tool on the MCP server and extract its result.
+
+    Reuses the session of the surrounding `mcp_session` context if there is one,
+    otherwise opens a session just for this call. Read-only tools go through the
+    result cache, mutating tools invalidate the results they may affect.
+
+    Args:
+        tool_name (str): The name of the tool to call.
+        arguments (Dict): The arguments to pass to the tool.
+
+    Returns:
+        Dict: The result of the tool call, as expected by Gemini.
+
+    """
+    with span("mcp.call_tool", tool=tool_name):
+        if tool_name in READ_ONLY_TOOLS:
+            return await tool_result_cache.get_or_call(tool_name, arguments, lambda: _call_remote(tool_name, arguments))
+
+        try:
+            return await _call_remote(tool_name, arguments)
+        finally:
+            for invalidated_tool in INVALIDATED_TOOLS.get(tool_name, ()):
+                tool_result_cache.invalidate(invalidated_tool, arguments.get("service_name"))
+
+
+async def _call_remote(tool_name: str, arguments: Dict) -> Dict:
+    """
+    Call a tool on the MCP server, using the active session if there is one.
+
+    Args:
+        tool_name (str): The name of the tool to call.
+        arguments (Dict): The arguments to pass to the tool.
+
+    Returns:
+        Dict: The result of the tool call.
+
+    """
+    session = _active_session.get()
+    if session is None:
+        async with mcp_session() as session:
+            return await _call_tool(session, tool_name, arguments)
+    return await _call_tool(session, tool_name, arguments)
+
+
+async def _call_tool(session: ClientSession, tool_name: str, arguments: Dict) -> Dict:
+    """
+    Call a tool over an open MCP session.
+
+    Args:
+        session (ClientSession): The MCP session to use.
+        tool_name (str): The name of the tool to call.
+        arguments (Dict): The arguments to pass to the tool.
+
+    Returns:
+        Dict: The result of the tool call.
+
+    """
+    mcp_response = await session.call_tool(tool_name, arguments=arguments)
+    console_logger.debug(f"Received raw MCP response object: {mcp_response}")
+
+    result_dict = mcp_response.structuredContent["result"]
+    console_logger.debug(f"Extracted result passed to Gemini: {result_dict}")
+
+    return result_dict
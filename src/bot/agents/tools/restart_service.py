@@ -11,13 +11,7 @@ todo: revisit this
 
 from typing import Dict
 
-from mcp import ClientSession
-from mcp.client.streamable_http import streamablehttp_client
-
-from bot.config.command_center import command_center_config
-from bot.utils.console_logger import console_logger
-
-headers = {"Authorization": f"Bearer {command_center_config.mcp_server_token}"}
+from bot.agents.tools.mcp_client import call_mcp_tool
 
 
 async def restart_service(service_name: str) -> Dict:
@@ -31,17 +25,4 @@ async def restart_service(service_name: str) -> Dict:
         Dict: A dictionary containing the result of the operation.
 
     """
-    async with streamablehttp_client(command_center_config.mcp_server_url, headers=headers) as (
-        read_stream,
-        write_stream,
-        _,
-    ):
-        async with ClientSession(read_stream, write_stream) as session:
-            await session.initialize()
-            mcp_response = await session.call_tool("restart_service", arguments={"service_name": service_name})
-            console_logger.debug(f"Received raw MCP response object: {mcp_response}")
-
-            result_dict = mcp_response.structuredContent["result"]
-            console_logger.debug(f"Extracted result passed to Gemini: {result_dict}")
-
-            return result_dict
+    return await call_mcp_tool("restart_service", arguments={"service_name": service_name})
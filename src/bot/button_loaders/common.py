@@ -33,7 +33,8 @@ class CommonButtonLoader:
         """
         # register callbacks
         ButtonsManager.register_callback(confirm_close_ticket_btn["custom_id"], on_confirm_close_ticket)
-        ButtonsManager.register_callback(cancel_close_ticket_btn["custom_id"], on_cancel_close_ticket)
+        # cancel responds right away and deletes its own prompt, so it must not be deferred by the router
+        ButtonsManager.register_callback(cancel_close_ticket_btn["custom_id"], on_cancel_close_ticket, auto_defer=False)
         ButtonsManager.register_callback(close_ticket_btn["custom_id"], on_close_ticket)
         ButtonsManager.register_callback(export_ticket_btn["custom_id"], on_export_ticket)
 
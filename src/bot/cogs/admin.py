@@ -14,12 +14,17 @@ from discord.ext import commands
 
 from bot.button_loaders.common import CommonButtonLoader
 from bot.cogs.cogs_manager import CogsManager
-from bot.core.admin import process_list_modules, process_sync_commands
+from bot.core.admin import (
+    process_interaction_stats,
+    process_list_modules,
+    process_module_timings,
+    process_open_tickets,
+    process_sync_commands,
+)
 from bot.utils.console_logger import console_logger
 from bot.utils.decorators import admin_only
 
 # todo: logic should ideally all be moved into core
-# todo: currently, the bot does not persist the enabled/disabled states of modules - it'll be ideal to persist
 
 
 class AdminCog(commands.Cog):
@@ -43,9 +48,21 @@ class AdminCog(commands.Cog):
         /module disable <name>:
             - Disable a specific bot module.
 
+        /module reload <name>:
+            - Reload an enabled bot module in place.
+
+        /module timings:
+            - Show how long each bot module took to load.
+
         /sync_commands:
             - Syncs slash commands to the Discord API for this server.
 
+        /interaction_stats:
+            - Show latency and error counts of interaction handlers.
+
+        /open_tickets:
+            - List the open tickets and their owners.
+
     """
 
     def __init__(self, bot: commands.Bot):
@@ -138,6 +155,36 @@ class AdminCog(commands.Cog):
         message = await self.cogs_manager.disable_cog(module)
         await interaction.response.send_message(message, ephemeral=True)
 
+    @module_group.command(name="reload", description="Reload an enabled bot module in place")
+    @app_commands.describe(module="The name of the module to reload")
+    @app_commands.autocomplete(module=_module_name_autocomplete)
+    @admin_only()
+    @commands.guild_only()
+    async def module_reload(self, interaction: discord.Interaction, module: str):
+        """
+        Reload an enabled bot module in place.
+
+        Args:
+            interaction (discord.Interaction): The interaction instance.
+            module (str): The name of the module to reload.
+
+        """
+        message = await self.cogs_manager.reload_cog(module)
+        await interaction.response.send_message(message, ephemeral=True)
+
+    @module_group.command(name="timings", description="Show how long each bot module took to load")
+    @admin_only()
+    @commands.guild_only()
+    async def module_timings(self, interaction: discord.Interaction):
+        """
+        Show how long each bot module took to load.
+
+        Args:
+            interaction (discord.Interaction): The interaction instance.
+
+        """
+        await process_module_timings(interaction)
+
     @app_commands.command(
         name="sync_commands",
         description="Sync slash commands to this server (Admin Only)",
@@ -155,6 +202,38 @@ class AdminCog(commands.Cog):
         ctx = await commands.Context.from_interaction(interaction)
         await process_sync_commands(ctx)
 
+    @app_commands.command(
+        name="interaction_stats",
+        description="Show latency and error counts of interaction handlers (Admin Only)",
+    )
+    @admin_only()
+    @commands.guild_only()
+    async def interaction_stats(self, interaction: discord.Interaction):
+        """
+        Show latency and error counts of interaction handlers.
+
+        Args:
+            interaction (discord.Interaction): The interaction instance.
+
+        """
+        await process_interaction_stats(interaction)
+
+    @app_commands.command(
+        name="open_tickets",
+        description="List the open tickets and their owners (Admin Only)",
+    )
+    @admin_only()
+    @commands.guild_only()
+    async def open_tickets(self, interaction: discord.Interaction):
+        """
+        List the open tickets and their owners.
+
+        Args:
+            interaction (discord.Interaction): The interaction instance.
+
+        """
+        await process_open_tickets(interaction)
+
     @commands.Cog.listener()
     async def on_guild_join(self, guild: discord.Guild):
         """
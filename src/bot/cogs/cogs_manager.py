@@ -3,14 +3,28 @@ CogsManager module for dynamic loading and management of bot extensions.
 
 This module defines the CogsManager class, which allows the bot to load,
 enable, and disable cog modules at runtime. It helps manage core bot
-functionality and modular feature sets.
+functionality and modular feature sets. Cogs are loaded concurrently at
+startup, respecting the dependencies declared between them, and the time
+taken to load each cog is recorded. Cogs enabled or disabled at runtime have
+their state persisted, and the persisted states override the configured
+modules at startup. The admin cog, which hosts the module commands, cannot be
+disabled, and neither can a cog that another loaded cog depends on.
 """
 
+import asyncio
+import time
+from graphlib import CycleError, TopologicalSorter
+from typing import Dict, List
+
 from discord.ext import commands
 
 from bot.config.cogs_manager import cogs_manager_config
+from bot.database.mysql.module_states import get_module_states, set_module_state
 from bot.utils.console_logger import console_logger
 
+# cogs that are always loaded and cannot be disabled, since they host the commands to enable cogs again
+PROTECTED_COGS = {"admin"}
+
 
 class CogsManager:
     """
@@ -21,9 +35,14 @@ class CogsManager:
 
     Attributes:
         bot (commands.Bot): The bot instance that manages the cogs.
+        load_timings (Dict[str, float]): Seconds taken to load each cog, shared by all instances.
+        module_states (Dict[str, bool]): The persisted enabled state of each cog, shared by all instances.
 
     """
 
+    load_timings: Dict[str, float] = {}
+    module_states: Dict[str, bool] = {}
+
     def __init__(self, bot: commands.Bot):
         """
         Initialize the CogsManager.
@@ -33,26 +52,100 @@ class CogsManager:
 
         """
         self.bot = bot
-        self.cogs = cogs_manager_config.loaded_modules
+
+    @property
+    def cogs(self) -> List[str]:
+        """
+        Get the available cogs: the configured modules and the ones enabled or disabled at runtime.
+
+        Returns:
+            List[str]: The names of the available cogs.
+
+        """
+        configured = cogs_manager_config.loaded_modules
+        return configured + [cog for cog in CogsManager.module_states if cog not in configured]
 
     async def load_all_cogs(self):
         """
         Load all cogs at bot startup.
 
-        Iterates over the configured list of cog modules and attempts to
-        load each one. Logs success or failure to the console.
+        The persisted module states are read first, so cogs disabled at runtime stay
+        disabled, except for the protected cogs. Cogs are loaded as soon as the cogs they depend on are loaded, so
+        independent cogs load concurrently. Cogs whose dependencies failed to load are
+        skipped. Logs success or failure and the time taken to the console.
+        """
+        try:
+            CogsManager.module_states = await get_module_states()
+        except Exception as e:
+            console_logger.error(f"❌ Failed to read the persisted module states, using the configured modules: {e}")
+
+        cogs = [cog for cog in self.cogs if cog in PROTECTED_COGS or CogsManager.module_states.get(cog, True)]
+        dependencies = {
+            cog: [dep for dep in cogs_manager_config.module_dependencies.get(cog, []) if dep in cogs] for cog in cogs
+        }
+        sorter = TopologicalSorter(dependencies)
+        try:
+            sorter.prepare()
+        except CycleError as e:
+            console_logger.error(f"❌ Cyclic module dependencies {e.args[1]}, loading modules without ordering.")
+            dependencies = {cog: [] for cog in cogs}
+            sorter = TopologicalSorter(dependencies)
+            sorter.prepare()
+
+        start = time.perf_counter()
+        failed = set()
+        loading: Dict[asyncio.Task, str] = {}
+        while sorter.is_active():
+            for cog in sorter.get_ready():
+                failed_dependencies = [dep for dep in dependencies[cog] if dep in failed]
+                if failed_dependencies:
+                    console_logger.info(f"🚫 Skipped bot.cogs.{cog}: dependencies {failed_dependencies} not loaded")
+                    failed.add(cog)
+                    sorter.done(cog)
+                    continue
+                loading[asyncio.create_task(self._load_cog(cog))] = cog
+
+            if not loading:
+                continue
+
+            done, _ = await asyncio.wait(loading, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                cog = loading.pop(task)
+                if not task.result():
+                    failed.add(cog)
+                sorter.done(cog)
+
+        console_logger.info(
+            f"✅ Loaded {len(cogs) - len(failed)}/{len(cogs)} modules in {time.perf_counter() - start:.2f}s"
+        )
+
+    async def _load_cog(self, cog_name: str) -> bool:
+        """
+        Load a single cog and record the time taken.
+
+        Args:
+            cog_name (str): The name of the cog to load (e.g. 'games').
+
+        Returns:
+            bool: True if the cog was loaded, False otherwise.
+
         """
-        for cog in self.cogs:
-            cog = f"bot.cogs.{cog}"
-            try:
-                await self.bot.load_extension(cog)
-                console_logger.info(f"✅ Loaded {cog}")
-            except Exception as e:
-                console_logger.info(f"❌ Failed to load {cog}: {e}")
+        cog = f"bot.cogs.{cog_name}"
+        start = time.perf_counter()
+        try:
+            await self.bot.load_extension(cog)
+        except Exception as e:
+            console_logger.info(f"❌ Failed to load {cog}: {e}")
+            return False
+        finally:
+            CogsManager.load_timings[cog_name] = time.perf_counter() - start
+
+        console_logger.info(f"✅ Loaded {cog} in {CogsManager.load_timings[cog_name]:.2f}s")
+        return True
 
     async def enable_cog(self, cog_name: str):
         """
-        Enable a cog dynamically by name.
+        Enable a cog dynamically by name, keeping it enabled across restarts.
 
         Args:
             cog_name (str): The name of the cog to enable (e.g. 'games').
@@ -66,13 +159,13 @@ class CogsManager:
             return f"Cog `{cog_name}` is already enabled."
         try:
             await self.bot.load_extension(cog_path)
-            return f"✅ Enabled `{cog_name}`"
         except Exception as e:
             return f"❌ Failed to enable `{cog_name}`: {e}"
+        return f"✅ Enabled `{cog_name}`" + await self._save_module_state(cog_name, True)
 
     async def disable_cog(self, cog_name: str):
         """
-        Disable a cog dynamically by name.
+        Disable a cog dynamically by name, keeping it disabled across restarts.
 
         Args:
             cog_name (str): The name of the cog to disable (e.g. 'games').
@@ -81,11 +174,65 @@ class CogsManager:
             str: A status message indicating success or failure.
 
         """
+        if cog_name in PROTECTED_COGS:
+            return f"❌ Cog `{cog_name}` hosts the module commands and cannot be disabled."
         cog_path = f"bot.cogs.{cog_name}"
         if cog_path not in self.bot.extensions:
             return f"Cog `{cog_name}` is not enabled."
+        dependents = [
+            cog
+            for cog, dependencies in cogs_manager_config.module_dependencies.items()
+            if cog_name in dependencies and f"bot.cogs.{cog}" in self.bot.extensions
+        ]
+        if dependents:
+            names = ", ".join(f"`{cog}`" for cog in dependents)
+            return f"❌ Cannot disable `{cog_name}`, the enabled cogs {names} depend on it. Disable them first."
         try:
             await self.bot.unload_extension(cog_path)
-            return f"🚫 Disabled `{cog_name}`"
         except Exception as e:
             return f"❌ Failed to disable `{cog_name}`: {e}"
+        return f"🚫 Disabled `{cog_name}`" + await self._save_module_state(cog_name, False)
+
+    async def reload_cog(self, cog_name: str):
+        """
+        Reload an enabled cog in place by name, e.g. to pick up code or configuration changes.
+
+        If the new version fails to load, the previous version is kept.
+
+        Args:
+            cog_name (str): The name of the cog to reload (e.g. 'games').
+
+        Returns:
+            str: A status message indicating success or failure.
+
+        """
+        cog_path = f"bot.cogs.{cog_name}"
+        if cog_path not in self.bot.extensions:
+            return f"Cog `{cog_name}` is not enabled."
+        start = time.perf_counter()
+        try:
+            await self.bot.reload_extension(cog_path)
+        except Exception as e:
+            return f"❌ Failed to reload `{cog_name}`: {e}"
+        CogsManager.load_timings[cog_name] = time.perf_counter() - start
+        return f"🔄 Reloaded `{cog_name}`"
+
+    async def _save_module_state(self, cog_name: str, enabled: bool) -> str:
+        """
+        Persist whether a cog is enabled.
+
+        Args:
+            cog_name (str): The name of the cog (e.g. 'games').
+            enabled (bool): Whether the cog is enabled.
+
+        Returns:
+            str: A note to append to the status message if the state could not be saved, or an empty string.
+
+        """
+        CogsManager.module_states[cog_name] = enabled
+        try:
+            await set_module_state(cog_name, enabled)
+        except Exception as e:
+            console_logger.error(f"❌ Failed to save the state of module {cog_name}: {e}")
+            return "\n⚠️ The change could not be saved and will be lost on restart."
+        return ""
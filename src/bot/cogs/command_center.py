@@ -6,14 +6,17 @@ to communicate with Google Gemini, which in turn has access to a remote MCP
 (Model Context Protocol) server.
 """
 
+import asyncio
 import traceback
+from typing import List, Optional
 
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 
 from bot.agents.command_center_agent import CommandCenterAgent
 from bot.config.command_center import command_center_config
 from bot.core.command_center import handle_message_input
+from bot.models.prompt import Prompt
 from bot.prompt_loaders.mcp import McpPromptLoader
 from bot.utils.console_logger import console_logger
 
@@ -36,10 +39,18 @@ class CommandCenter(commands.Cog):
         self.agent = CommandCenterAgent()
         self._prompts_initialized = False
 
+        # true until the mcp state needed by the agent has been loaded, `ready` is set once it has
+        self.warming = True
+        self.ready = asyncio.Event()
+        self._warmup_task: Optional[asyncio.Task] = None
+
     def cog_unload(self):
         """
         Unload the cog and release embedded resources.
         """
+        if self._warmup_task:
+            self._warmup_task.cancel()
+        self.refresh_mcp_state.cancel()
         McpPromptLoader.unload_prompts(self.agent.user_prompts)
         self.agent = None
         self._prompts_initialized = False
@@ -54,10 +65,6 @@ class CommandCenter(commands.Cog):
             message (discord.Message): The message that triggered the event.
 
         """
-        # Ignore bot's own messages
-        if message.author.bot:
-            return
-
         # Only act in the command center channel or its threads
         if not (
             message.channel.id == int(command_center_config.command_center_channel_id)
@@ -68,12 +75,106 @@ class CommandCenter(commands.Cog):
         ):
             return
 
+        # Ignore messages from bots, keeping those of other bots in the thread's cached history
+        # (the agent records its own output and the inputs it answers as part of its turns)
+        if message.author.bot:
+            if isinstance(message.channel, discord.Thread) and message.author.id != self.bot.user.id:
+                text = message.content or "\n".join(embed.description or "" for embed in message.embeds)
+                self.agent.conversation_cache.append(message.channel.id, "user", text)
+            return
+
         # Only proceed if the bot is mentioned or message is in a command center thread
         if self.bot.user not in message.mentions and not isinstance(message.channel, discord.Thread):
             return
 
         await handle_message_input(self.bot, message)
 
+    @commands.Cog.listener()
+    async def on_thread_delete(self, thread: discord.Thread):
+        """
+        Drop the cached conversation history of a deleted command center thread.
+
+        Args:
+            thread (discord.Thread): The thread that was deleted.
+
+        """
+        if self.agent and thread.parent_id == int(command_center_config.command_center_channel_id):
+            self.agent.conversation_cache.evict(thread.id)
+
+    async def warm_up(self):
+        """
+        Load the MCP state in the background, retrying with backoff until it succeeds.
+
+        Once the system context is available the cog leaves its warming state and
+        starts the periodic refresh.
+        """
+        delay = 1
+        while True:
+            await self._refresh_mcp_state()
+            if self.agent.system_context:
+                break
+            console_logger.warning(f"🚫 Command center is not ready yet, retrying MCP warmup in {delay}s.")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 60)
+
+        self.warming = False
+        self.ready.set()
+        console_logger.info("✅ Command center is ready.")
+        self.refresh_mcp_state.start()
+
+    @tasks.loop(seconds=command_center_config.mcp_refresh_interval)
+    async def refresh_mcp_state(self):
+        """
+        Refresh prompts and system context from the MCP server in the background.
+        """
+        # the first iteration runs right away, but warmup has just loaded the state
+        if self.refresh_mcp_state.current_loop == 0:
+            return
+        await self._refresh_mcp_state()
+
+    async def _refresh_mcp_state(self):
+        """
+        Fetch prompts and system context from the MCP server, bounded by a timeout.
+
+        Only prompts that were added, changed or removed since the last refresh are
+        re-registered, and the system context is only rebuilt when the services change.
+        """
+        timeout = command_center_config.mcp_timeout
+        try:
+            previous_prompts = self.agent.user_prompts
+            await asyncio.wait_for(self.agent.load_all_prompts(), timeout=timeout)
+            removed, added = _diff_prompts(previous_prompts, self.agent.user_prompts)
+            McpPromptLoader.unload_prompts(removed)
+            McpPromptLoader.load_prompts(added)
+            self._prompts_initialized = True
+        except Exception:
+            console_logger.error(f"❌ Failed to load prompts:\n{traceback.format_exc()}")
+
+        try:
+            await asyncio.wait_for(self.agent.set_system_context(), timeout=timeout)
+        except Exception:
+            console_logger.error(f"❌ Failed to set system context:\n{traceback.format_exc()}")
+
+
+def _diff_prompts(previous: List[Prompt], current: List[Prompt]) -> tuple[List[Prompt], List[Prompt]]:
+    """
+    Compare two sets of prompts by their custom id.
+
+    Args:
+        previous (List[Prompt]): The prompts currently registered.
+        current (List[Prompt]): The prompts just fetched from the MCP server.
+
+    Returns:
+        tuple[List[Prompt], List[Prompt]]: The prompts to unregister (removed or changed)
+            and the prompts to register (added or changed).
+
+    """
+    previous_by_id = {prompt.custom_id: prompt for prompt in previous}
+    current_by_id = {prompt.custom_id: prompt for prompt in current}
+    removed = [prompt for custom_id, prompt in previous_by_id.items() if current_by_id.get(custom_id) != prompt]
+    added = [prompt for custom_id, prompt in current_by_id.items() if previous_by_id.get(custom_id) != prompt]
+    return removed, added
+
 
 async def setup(bot: commands.Bot):
     """
@@ -86,15 +187,5 @@ async def setup(bot: commands.Bot):
     cog = CommandCenter(bot)
     await bot.add_cog(cog)  # Add cog first, so it's fully registered
 
-    # Now manually trigger loading of prompts and setting system context
-    try:
-        await cog.agent.load_all_prompts()
-        McpPromptLoader.load_prompts(cog.agent.user_prompts)
-        cog._prompts_initialized = True
-    except Exception:
-        console_logger.error(f"❌ Failed to load prompts:\n{traceback.format_exc()}")
-
-    try:
-        await cog.agent.set_system_context()
-    except Exception:
-        console_logger.error(f"❌ Failed to set system context:\n{traceback.format_exc()}")
+    # prompts and system context are loaded (and kept fresh) in the background to keep cog load fast
+    cog._warmup_task = bot.loop.create_task(cog.warm_up())
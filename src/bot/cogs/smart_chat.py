@@ -11,7 +11,13 @@ import discord
 from discord.ext import commands
 
 from bot.config.smart_chat import smart_chat_config
-from bot.core.smart_chat import close_session, get_ai_response, start_session
+from bot.core.smart_chat import (
+    SmartChatFilter,
+    close_session,
+    get_ai_response,
+    start_session,
+)
+from bot.utils.decorators import admin_only
 
 
 class SmartChatCog(commands.Cog):
@@ -21,6 +27,10 @@ class SmartChatCog(commands.Cog):
     This cog sends user messages from specific channels to an external AI API
     and replies with generated responses.
 
+    Commands:
+        /smart_chat_stats:
+            - Shows how many messages were forwarded to or skipped by the pre-filter (Admin only).
+
     Listeners:
         on_message:
             - Sends messages to the AI API for processing and replies with the generated response.
@@ -36,6 +46,7 @@ class SmartChatCog(commands.Cog):
         """
         self.bot = bot
         self.session = start_session()
+        self.message_filter = SmartChatFilter()
 
     def cog_unload(self):
         """
@@ -62,6 +73,10 @@ class SmartChatCog(commands.Cog):
         if message.channel.id not in smart_chat_config.smart_chat_channel_ids:
             return
 
+        # Skip messages that are unlikely to need a response
+        if smart_chat_config.smart_chat_filter_enabled and not self.message_filter.should_forward(message):
+            return
+
         # Get AI response from the service
         response = await get_ai_response(self.session, message.content)
 
@@ -69,6 +84,29 @@ class SmartChatCog(commands.Cog):
         if response:
             await message.reply(response)
 
+    @admin_only()
+    @commands.guild_only()
+    @commands.hybrid_command(
+        name="smart_chat_stats",
+        description="Show smart chat pre-filter counters (Admin Only)",
+        with_app_command=True,
+    )
+    async def smart_chat_stats(self, ctx: commands.Context):
+        """
+        Show the number of messages forwarded to and skipped by the pre-filter.
+
+        Args:
+            ctx (commands.Context): The command context.
+
+        """
+        counters = self.message_filter.counters
+        message = "**📊 Smart Chat Filter:**\n\n"
+        message += f"• **passed**: {counters['passed']}\n"
+        for outcome, count in sorted(counters.items()):
+            if outcome != "passed":
+                message += f"• **{outcome}**: {count}\n"
+        await ctx.send(message, ephemeral=True)
+
 
 async def setup(bot: commands.Bot):
     """
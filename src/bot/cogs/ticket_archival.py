@@ -0,0 +1,71 @@
+"""
+TicketArchivalCog module for archiving idle ticket channels.
+
+This module defines a Discord bot cog that periodically sweeps open tickets
+and archives those that have been idle for too long, so ticket categories do
+not fill up with stale channels (Discord allows at most 50 channels per
+category).
+"""
+
+import traceback
+
+from discord.ext import commands, tasks
+
+from bot.config.ticket_archival import ticket_archival_config
+from bot.core.ticket_archival import archive_idle_tickets
+from bot.utils.console_logger import console_logger
+
+
+class TicketArchivalCog(commands.Cog):
+    """
+    A Discord bot cog that archives idle tickets in the background.
+
+    Tasks:
+        sweep_idle_tickets:
+            - Exports and closes tickets idle for longer than the configured threshold.
+    """
+
+    def __init__(self, bot: commands.Bot):
+        """
+        Initialize the TicketArchivalCog and start the sweeper.
+
+        Args:
+            bot (commands.Bot): The Discord bot instance.
+
+        """
+        self.bot = bot
+        self.sweep_idle_tickets.start()
+
+    def cog_unload(self):
+        """
+        Stop the sweeper when the cog is unloaded.
+        """
+        self.sweep_idle_tickets.cancel()
+
+    @tasks.loop(minutes=ticket_archival_config.ticket_archival_interval)
+    async def sweep_idle_tickets(self):
+        """
+        Archive the tickets that have been idle for too long.
+        """
+        try:
+            await archive_idle_tickets(self.bot)
+        except Exception:
+            console_logger.error(f"❌ Failed to archive idle tickets:\n{traceback.format_exc()}")
+
+    @sweep_idle_tickets.before_loop
+    async def before_sweep_idle_tickets(self):
+        """
+        Wait until the bot is ready, so channels are cached before the first sweep.
+        """
+        await self.bot.wait_until_ready()
+
+
+async def setup(bot: commands.Bot):
+    """
+    Set up the TicketArchivalCog by adding it to the bot.
+
+    Args:
+        bot (commands.Bot): The bot instance to which the cog is added.
+
+    """
+    await bot.add_cog(TicketArchivalCog(bot))
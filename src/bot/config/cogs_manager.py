@@ -6,7 +6,7 @@ It uses Pydantic for validation and loading of environment- based or
 default values related to the loading of modules.
 """
 
-from typing import Annotated, List
+from typing import Annotated, Dict, List
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, NoDecode
@@ -20,6 +20,8 @@ class CogsManagerConfig(BaseSettings):
 
     Attributes:
         loaded_modules (List[str]): The list of modules to be loaded.
+        module_dependencies (Dict[str, List[str]]): The modules each module must be loaded after, set in the
+            environment as comma-separated module:dependency pairs (e.g. 'alerts:command_center,games:admin').
 
     """
 
@@ -48,5 +50,39 @@ class CogsManagerConfig(BaseSettings):
             return [module.strip() for module in v.split(",") if module.strip()]
         return v
 
+    module_dependencies: Annotated[Dict[str, List[str]], NoDecode] = Field(
+        # alerts are handled by the command center, so it must be loaded first
+        default_factory=lambda: {"alerts": ["command_center"]},
+        description=(
+            "The modules each module must be loaded after, as comma-separated module:dependency pairs. "
+            "A module is skipped if one of its dependencies fails to load, modules without dependencies "
+            "load concurrently."
+        ),
+    )
+
+    @field_validator("module_dependencies", mode="before")
+    @classmethod
+    def split_module_dependencies(cls, v):
+        """
+        Convert a comma-separated string of module:dependency pairs to a mapping.
+
+        Args:
+            v (str | dict): The raw value from the environment or settings.
+
+        Returns:
+            dict[str, list[str]]: A mapping of module names to the modules they depend on.
+
+        """
+        if isinstance(v, str):
+            dependencies = {}
+            for pair in v.split(","):
+                if ":" not in pair:
+                    continue
+                module, dependency = (part.strip() for part in pair.split(":", 1))
+                if module and dependency:
+                    dependencies.setdefault(module, []).append(dependency)
+            return dependencies
+        return v
+
 
 cogs_manager_config = CogsManagerConfig()
@@ -20,6 +20,15 @@ class CommandCenterConfig(BaseSettings):
     Attributes:
         command_center_channel_id (int): The Discord channel ID for the command center.
         mcp_server_url (str, optional): The URL for the MCP server.
+        agent_cache_max_threads (int): The maximum number of threads whose history is cached in memory.
+        agent_history_token_budget (int): The estimated token budget for history messages kept in full.
+        agent_summary_token_budget (int): The estimated token budget for the summary of older messages.
+        agent_tool_concurrency (int): The maximum number of tool calls run concurrently by the agent.
+        agent_max_tool_steps (int): The maximum number of tool-calling rounds in a single agent turn.
+        mcp_tool_cache_ttl (float): The number of seconds results of read-only MCP tools are cached.
+        mcp_refresh_interval (float): The number of seconds between refreshes of MCP prompts and system context.
+        mcp_timeout (float): The number of seconds to wait for the MCP server when loading prompts or context.
+        agent_alert_ready_timeout (float): The number of seconds an alert waits for the command center to start.
 
     """
 
@@ -43,6 +52,42 @@ class CommandCenterConfig(BaseSettings):
         default=30,
         description="The maximum number of messages to keep in the agent's history.",
     )
+    agent_cache_max_threads: int = Field(
+        default=100,
+        description="The maximum number of threads whose conversation history is cached in memory.",
+    )
+    agent_history_token_budget: int = Field(
+        default=4000,
+        description="The estimated token budget for the most recent messages sent to the agent in full.",
+    )
+    agent_summary_token_budget: int = Field(
+        default=500,
+        description="The estimated token budget for the rolling summary of older messages.",
+    )
+    agent_tool_concurrency: int = Field(
+        default=4,
+        description="The maximum number of independent tool calls the agent runs concurrently.",
+    )
+    agent_max_tool_steps: int = Field(
+        default=10,
+        description="The maximum number of tool-calling rounds in a single agent turn.",
+    )
+    mcp_tool_cache_ttl: float = Field(
+        default=15,
+        description="The number of seconds results of read-only MCP tools are cached (0 to disable).",
+    )
+    mcp_refresh_interval: float = Field(
+        default=300,
+        description="The number of seconds between background refreshes of MCP prompts and system context.",
+    )
+    mcp_timeout: float = Field(
+        default=15,
+        description="The number of seconds to wait for the MCP server when loading prompts or system context.",
+    )
+    agent_alert_ready_timeout: float = Field(
+        default=120,
+        description="The number of seconds an alert waits for the command center to start before it is skipped.",
+    )
 
 
 command_center_config = CommandCenterConfig()
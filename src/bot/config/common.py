@@ -28,6 +28,7 @@ class CommonConfig(BaseSettings):
         sponsor_tickets_category_id (int): Category ID where sponsor tickets are created.
         report_tickets_category_id (int): Category ID where report tickets are created.
         admin_role_id (int): Role ID for users with admin access.
+        member_roles_cache_enabled (bool): Whether the resolved roles of members are cached until they change.
         one_off_sponsor_tiers (Dict[str, SponsorTier]): One-time sponsorship tier definitions.
         recurring_sponsor_tiers (Dict[str, SponsorTier]): Recurring sponsorship tier definitions.
 
@@ -49,6 +50,10 @@ class CommonConfig(BaseSettings):
         default=0,
         description="The Discord role ID that designates admin users.",
     )
+    member_roles_cache_enabled: bool = Field(
+        default=False,
+        description="Whether the resolved admin and sponsor roles of members are cached until their roles change.",
+    )
 
     one_off_sponsor_tiers: Dict[str, SponsorTier] = {
         "community": SponsorTier(
@@ -25,6 +25,7 @@ class DatabaseConfig(BaseSettings):
         mysql_password (str): The password for the MySQL user.
         mysql_database (str): The name of the database to use.
         autocommit (bool): Whether to enable autocommit on MySQL connections.
+        mysql_echo (bool): Whether to log the SQL statements sent to MySQL.
 
     """
 
@@ -52,6 +53,10 @@ class DatabaseConfig(BaseSettings):
         default=True,
         description="Whether MySQL connections should autocommit transactions.",
     )
+    mysql_echo: bool = Field(
+        default=False,
+        description="Whether the SQL statements sent to MySQL are logged.",
+    )
 
 
 database_config = DatabaseConfig()
@@ -0,0 +1,66 @@
+"""
+ExportsConfig module for configuring background channel exports.
+
+This module defines the settings of the background jobs that export the
+message history of ticket channels, such as how many exports run at once and
+how often their progress is saved and shown, and of the archival of the
+attachments referenced by exports. Export files and archived attachments are
+kept under the bot's data directory, which is mounted as a volume so they
+survive redeploys.
+"""
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class ExportsConfig(BaseSettings):
+    """
+    Configuration settings for background channel exports.
+
+    Attributes:
+        export_max_concurrent (int): The maximum number of exports running at once.
+        export_checkpoint_interval (int): The number of messages exported between checkpoints.
+        export_progress_interval (float): The minimum number of seconds between progress updates.
+        export_directory (str): The directory where export files are written.
+        export_archive_attachments (bool): Whether exports download and archive the attachments of messages.
+        export_attachment_directory (str): The content-addressed directory where attachments are archived.
+        export_attachment_max_bytes (int): The maximum size of an archived attachment in bytes.
+        export_attachment_max_concurrent (int): The maximum number of attachments downloaded at once.
+
+    """
+
+    export_max_concurrent: int = Field(
+        default=2,
+        description="The maximum number of channel exports running at once.",
+    )
+    export_checkpoint_interval: int = Field(
+        default=200,
+        description="The number of messages exported between checkpoints an interrupted export resumes from.",
+    )
+    export_progress_interval: float = Field(
+        default=5,
+        description="The minimum number of seconds between edits of an export's progress message.",
+    )
+    export_directory: str = Field(
+        default="/app/data/exports",
+        description="The directory where export files (and the checkpoints of interrupted exports) are written.",
+    )
+    export_archive_attachments: bool = Field(
+        default=True,
+        description="Whether exports download the attachments of messages, so they survive channel deletion.",
+    )
+    export_attachment_directory: str = Field(
+        default="/app/data/attachments",
+        description="The directory where attachments are archived, stored by the SHA-256 of their content.",
+    )
+    export_attachment_max_bytes: int = Field(
+        default=25 * 1024 * 1024,
+        description="The maximum size in bytes of an archived attachment, larger ones are only referenced by URL.",
+    )
+    export_attachment_max_concurrent: int = Field(
+        default=4,
+        description="The maximum number of attachments downloaded at once.",
+    )
+
+
+exports_config = ExportsConfig()
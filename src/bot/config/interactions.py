@@ -0,0 +1,31 @@
+"""
+InteractionsConfig module for configuring interaction handling.
+
+This module defines settings used when dispatching Discord component
+interactions to their handlers, such as how long a handler may run before
+the interaction is deferred to stay within Discord's response deadline.
+"""
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class InteractionsConfig(BaseSettings):
+    """
+    Configuration settings for interaction handling.
+
+    Attributes:
+        interaction_defer_budget (float): Seconds after an interaction is created before it is deferred.
+
+    """
+
+    interaction_defer_budget: float = Field(
+        default=2.0,
+        description=(
+            "Seconds after an interaction is created before a handler that has not responded is deferred "
+            "(Discord requires a response within 3 seconds)."
+        ),
+    )
+
+
+interactions_config = InteractionsConfig()
@@ -26,6 +26,7 @@ class LoggingConfig(BaseSettings):
         logger_prefix (str): The logger name/prefix used in log entries.
         logger_format (str): The format string for log messages.
         logged_actions (List[str]): The list of actions to be logged.
+        logger_json_enabled (bool): Whether log messages are formatted as JSON.
 
     """
 
@@ -48,6 +49,10 @@ class LoggingConfig(BaseSettings):
     logged_actions: Annotated[List[str], NoDecode] = Field(
         default_factory=list, description="The list of actions to be logged."
     )
+    logger_json_enabled: bool = Field(
+        default=False,
+        description="Whether log messages are formatted as structured JSON instead of the logger format.",
+    )
     otel_enabled: bool = Field(
         default=False,
         description="Whether OpenTelemetry logging is enabled.",
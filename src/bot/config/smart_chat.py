@@ -23,6 +23,11 @@ class SmartChatConfig(BaseSettings):
     Attributes:
         smart_chat_api_url (str): The base URL of the smart chat API.
         smart_chat_channel_ids (List[int]): The list of channel ids where smart chat is enabled.
+        smart_chat_filter_enabled (bool): Whether messages are pre-filtered before reaching the API.
+        smart_chat_min_length (int): The minimum number of text characters for a message to be forwarded.
+        smart_chat_cooldown (int): The number of seconds a user must wait between forwarded messages.
+        smart_chat_keywords (List[str]): Keywords that mark a message as a likely question.
+        smart_chat_ignored_user_ids (List[int]): The list of user ids whose messages are never forwarded.
 
     """
 
@@ -34,23 +39,76 @@ class SmartChatConfig(BaseSettings):
         default_factory=list,
         description="Comma-separated channel IDs where smart chat is enabled.",
     )
+    smart_chat_filter_enabled: bool = Field(
+        default=True,
+        description="Whether messages are pre-filtered locally before being sent to the smart chat API.",
+    )
+    smart_chat_min_length: int = Field(
+        default=10,
+        description="The minimum number of text characters (excluding links, mentions and emojis) to forward.",
+    )
+    smart_chat_cooldown: int = Field(
+        default=10,
+        description="The number of seconds a user must wait between messages forwarded to the smart chat API.",
+    )
+    smart_chat_keywords: Annotated[List[str], NoDecode] = Field(
+        default_factory=lambda: [
+            "help",
+            "error",
+            "bug",
+            "issue",
+            "problem",
+            "not working",
+            "doesn't work",
+            "unable",
+            "how to",
+            "install",
+            "configure",
+            "plugin",
+            "theme",
+            "flow",
+            "settings",
+        ],
+        description="Comma-separated keywords that mark a message as a likely question.",
+    )
+    smart_chat_ignored_user_ids: Annotated[List[int], NoDecode] = Field(
+        default_factory=list,
+        description="Comma-separated user IDs whose messages are never sent to the smart chat API.",
+    )
 
-    @field_validator("smart_chat_channel_ids", mode="before")
+    @field_validator("smart_chat_channel_ids", "smart_chat_ignored_user_ids", mode="before")
     @classmethod
     def parse_channel_ids(cls, v):
         """
-        Convert a comma-separated string to a list of smart channel ids.
+        Convert a comma-separated string to a list of ids.
 
         Args:
             v (str | list): The raw value from the environment or settings.
 
         Returns:
-            list[int]: A list of cleaned smart channel ids.
+            list[int]: A list of cleaned ids.
 
         """
         if isinstance(v, str):
             return [int(cid.strip()) for cid in v.split(",") if cid.strip().isdigit()]
         return v
 
+    @field_validator("smart_chat_keywords", mode="before")
+    @classmethod
+    def split_keywords(cls, v):
+        """
+        Convert a comma-separated string to a list of lowercase keywords.
+
+        Args:
+            v (str | list): The raw value from the environment or settings.
+
+        Returns:
+            list[str]: A list of cleaned keywords.
+
+        """
+        if isinstance(v, str):
+            return [keyword.strip().lower() for keyword in v.split(",") if keyword.strip()]
+        return v
+
 
 smart_chat_config = SmartChatConfig()
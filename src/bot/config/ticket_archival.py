@@ -0,0 +1,49 @@
+"""
+TicketArchivalConfig module for configuring the archival of idle tickets.
+
+This module defines the settings of the ticket archival sweeper, which
+exports the transcript of tickets that have been idle for too long and then
+closes them, so ticket categories do not fill up with stale channels.
+"""
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class TicketArchivalConfig(BaseSettings):
+    """
+    Configuration settings for the archival of idle tickets.
+
+    Attributes:
+        ticket_archive_channel_id (int): The Discord channel ID where transcripts of archived and closed tickets
+            are sent.
+        ticket_idle_hours (float): The number of hours without messages after which a ticket is archived.
+        ticket_archival_interval (float): The number of minutes between sweeps for idle tickets.
+        ticket_archival_batch_size (int): The number of tickets archived concurrently in a batch.
+        ticket_archival_batch_delay (float): The number of seconds between batches.
+
+    """
+
+    ticket_archive_channel_id: int = Field(
+        default=0,
+        description="The Discord channel ID where transcripts of archived and closed tickets are sent.",
+    )
+    ticket_idle_hours: float = Field(
+        default=72,
+        description="The number of hours without new messages after which a ticket is archived.",
+    )
+    ticket_archival_interval: float = Field(
+        default=60,
+        description="The number of minutes between sweeps for idle tickets.",
+    )
+    ticket_archival_batch_size: int = Field(
+        default=5,
+        description="The number of idle tickets exported and closed concurrently in a batch.",
+    )
+    ticket_archival_batch_delay: float = Field(
+        default=10,
+        description="The number of seconds between batches, to stay within Discord's rate limits.",
+    )
+
+
+ticket_archival_config = TicketArchivalConfig()
@@ -0,0 +1,64 @@
+"""
+TicketCreationConfig module for configuring how tickets are created under load.
+
+This module defines the settings shared by the support, sponsor and report
+ticket flows that limit how quickly ticket channels are created, such as the
+number of creation workers, the global and per-user rate limits, and how
+failed creations are retried.
+"""
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class TicketCreationConfig(BaseSettings):
+    """
+    Configuration settings for ticket creation.
+
+    Attributes:
+        ticket_creation_workers (int): The number of tickets created concurrently.
+        ticket_creation_queue_size (int): The maximum number of tickets waiting to be created.
+        ticket_creation_rate (float): The number of tickets created per second across all users.
+        ticket_creation_burst (int): The number of tickets that can be created at once across all users.
+        ticket_creation_user_burst (int): The number of tickets a user can create at once.
+        ticket_creation_user_interval (float): Seconds until a user can create another ticket after their burst.
+        ticket_creation_max_retries (int): The number of times a failed ticket creation is retried.
+        ticket_creation_retry_backoff (float): Seconds before the first retry, doubled for each further retry.
+
+    """
+
+    ticket_creation_workers: int = Field(
+        default=2,
+        description="The number of ticket channels created concurrently.",
+    )
+    ticket_creation_queue_size: int = Field(
+        default=100,
+        description="The maximum number of tickets waiting to be created before new ones are turned away.",
+    )
+    ticket_creation_rate: float = Field(
+        default=0.5,
+        description="The number of ticket channels created per second across all users.",
+    )
+    ticket_creation_burst: int = Field(
+        default=5,
+        description="The number of ticket channels that can be created at once across all users.",
+    )
+    ticket_creation_user_burst: int = Field(
+        default=3,
+        description="The number of tickets a single user can create at once.",
+    )
+    ticket_creation_user_interval: float = Field(
+        default=60,
+        description="The number of seconds until a user can create another ticket after using up their burst.",
+    )
+    ticket_creation_max_retries: int = Field(
+        default=3,
+        description="The number of times a failed ticket channel creation is retried.",
+    )
+    ticket_creation_retry_backoff: float = Field(
+        default=2,
+        description="The number of seconds before the first retry, doubled for each further retry.",
+    )
+
+
+ticket_creation_config = TicketCreationConfig()
@@ -0,0 +1,35 @@
+"""
+TranscriptsConfig module for configuring the transcript journal of tickets.
+
+This module defines the settings of the optional journal that records the
+messages of ticket channels as they are sent, edited and deleted, so ticket
+transcripts can be produced without reading the channel history from Discord.
+"""
+
+from typing import Literal
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class TranscriptsConfig(BaseSettings):
+    """
+    Configuration settings for the transcript journal.
+
+    Attributes:
+        transcript_journal_backend (str): Where messages are journaled: 'off', 'mysql' or 'file'.
+        transcript_journal_directory (str): The directory of the journal files when using the 'file' backend.
+
+    """
+
+    transcript_journal_backend: Literal["off", "mysql", "file"] = Field(
+        default="off",
+        description="Where ticket messages are journaled as they arrive: 'off', 'mysql' or 'file' (append-only).",
+    )
+    transcript_journal_directory: str = Field(
+        default="/app/data/transcripts",
+        description="The directory of the append-only journal files when using the 'file' backend.",
+    )
+
+
+transcripts_config = TranscriptsConfig()
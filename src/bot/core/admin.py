@@ -4,13 +4,18 @@ Admin command processing module for module listing and slash command sync.
 This module provides utility functions used by admin-level commands for
 managing the bot’s modules and synchronizing slash commands with
 Discord’s API. It includes functions for listing currently loaded
-extensions and triggering per-guild command syncs.
+extensions, reporting module load timings and interaction handler
+statistics, listing open tickets, and triggering per-guild command syncs.
 """
 
+from datetime import timezone
+
 import discord
 from discord.ext import commands
 
 from bot.cogs.cogs_manager import CogsManager
+from bot.services.ticket_registry_svc import list_open_tickets
+from bot.ui.interaction_router import InteractionRouter
 
 
 async def process_list_modules(interaction: discord.Interaction, bot: commands.Bot, cogs_manager: CogsManager):
@@ -43,6 +48,75 @@ async def process_list_modules(interaction: discord.Interaction, bot: commands.B
     await interaction.response.send_message(message, ephemeral=True)
 
 
+async def process_module_timings(interaction: discord.Interaction):
+    """
+    Show how long each bot module took to load, slowest first.
+
+    Args:
+        interaction (discord.Interaction): The interaction that triggered the command.
+
+    """
+    timings = sorted(CogsManager.load_timings.items(), key=lambda item: item[1], reverse=True)
+    if not timings:
+        await interaction.response.send_message("No module load timings recorded yet.", ephemeral=True)
+        return
+
+    message = "**⏱️ Module Load Timings:**\n\n"
+    for cog_name, seconds in timings:
+        message += f"• **{cog_name}**: {seconds:.2f}s\n"
+
+    await interaction.response.send_message(message, ephemeral=True)
+
+
+async def process_interaction_stats(interaction: discord.Interaction):
+    """
+    Show the latency and error count of each interaction handler, slowest first.
+
+    Args:
+        interaction (discord.Interaction): The interaction that triggered the command.
+
+    """
+    stats = sorted(InteractionRouter.get_stats().items(), key=lambda item: item[1].average_latency, reverse=True)
+    if not stats:
+        await interaction.response.send_message("No interactions handled yet.", ephemeral=True)
+        return
+
+    message = "**📊 Interaction Handler Stats:**\n\n"
+    for handler, handler_stats in stats:
+        message += (
+            f"• **{handler}**: {handler_stats.calls} calls, {handler_stats.errors} errors, "
+            f"{handler_stats.deferred} deferred, {handler_stats.late_failures} late, "
+            f"avg {handler_stats.average_latency * 1000:.0f}ms, max {handler_stats.max_latency * 1000:.0f}ms\n"
+        )
+
+    await interaction.response.send_message(message[:2000], ephemeral=True)
+
+
+async def process_open_tickets(interaction: discord.Interaction):
+    """
+    Show the open tickets from the ticket registry, oldest first.
+
+    Args:
+        interaction (discord.Interaction): The interaction that triggered the command.
+
+    """
+    tickets = list_open_tickets()
+    if not tickets:
+        await interaction.response.send_message("No open tickets.", ephemeral=True)
+        return
+
+    message = "**🎫 Open Tickets:**\n\n"
+    for ticket in tickets:
+        opened_at = discord.utils.format_dt(ticket.created_at.replace(tzinfo=timezone.utc), "R")
+        message += (
+            f"• **{ticket.ticket_type} #{ticket.ticket_number}**: <#{ticket.channel_id}> "
+            f"by <@{ticket.owner_id}>, opened {opened_at}\n"
+        )
+    message += f"\n**Total:** {len(tickets)} open ticket(s)"
+
+    await interaction.response.send_message(message[:2000], ephemeral=True)
+
+
 async def process_sync_commands(ctx: commands.Context):
     """
     Sync slash commands with Discord's API for this guild only.
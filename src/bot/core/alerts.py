@@ -10,6 +10,7 @@ from discord.ext import commands
 from bot.agents.instructions import AGENT_INSTRUCTIONS
 from bot.config.alerts import alerts_config
 from bot.core.command_center import handle_message_input
+from bot.utils.tracing import traced
 
 
 async def _send_service_alert(bot: commands.Bot, channel: discord.TextChannel, alert_type: str, message: str) -> None:
@@ -43,6 +44,7 @@ async def _send_service_alert(bot: commands.Bot, channel: discord.TextChannel, a
     await handle_message_input(bot, msg, is_alert=True)
 
 
+@traced("alerts.handle_webhook")
 async def handle_webhook_input(bot: commands.Bot, channel: discord.TextChannel, data: dict):
     """
     Entry point for webhook sent to the command center.
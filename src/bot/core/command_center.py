@@ -7,15 +7,27 @@ functions to start and close sessions and retrieve AI-generated
 responses based on user input.
 """
 
+import asyncio
 from datetime import datetime, timezone
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Set
 
 import discord
 from discord.ext import commands
 
-from bot.agents.command_center_agent import CommandCenterAgent
+from bot.config.command_center import command_center_config
 from bot.ui.embeds.embeds_manager import EmbedsManager
 from bot.ui.prompts.prompts_manager import PROMPT_ID_TO_TEXT_MAPPING, PromptsManager
+from bot.utils.console_logger import console_logger
+
+# the agent pulls in google-genai and mcp, which are only needed once the command center cog is loaded
+if TYPE_CHECKING:
+    from bot.agents.command_center_agent import CommandCenterAgent
+
+# threads with an agent run in progress, runs in a thread execute one at a time
+_active_threads: Set[int] = set()
+
+# inputs that arrived in a thread mid-run, merged into its next turn
+_pending_inputs: Dict[int, List[str]] = {}
 
 
 async def handle_prompt_input(interaction: discord.Interaction, custom_id: str) -> Optional[str]:
@@ -53,7 +65,23 @@ async def handle_message_input(bot: commands.Bot, message: discord.Message, is_a
     """
     cog = bot.get_cog("CommandCenter")
     if cog:
-        agent: CommandCenterAgent = cog.agent
+        agent: "CommandCenterAgent" = cog.agent
+
+    # the agent cannot answer until its mcp state has been loaded, alerts wait a while for it, users are asked to retry
+    if cog and cog.warming:
+        if not is_alert:
+            await message.channel.send("⏳ I'm still starting up, please try again in a moment.")
+            return
+        timeout = command_center_config.agent_alert_ready_timeout
+        try:
+            await asyncio.wait_for(cog.ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            console_logger.warning(f"⏱️ Command center was not ready after {timeout:.0f}s, skipping alert.")
+            return
+        if bot.get_cog("CommandCenter") is not cog:
+            console_logger.warning("🚫 Command center was unloaded while an alert waited for it, skipping alert.")
+            return
+
     user_request = message.content.replace(f"<@{bot.user.id}>", "").strip()
 
     # handles the case where the user just mentions the bot without any additional text
@@ -77,12 +105,56 @@ async def handle_message_input(bot: commands.Bot, message: discord.Message, is_a
         thread_name = f"🤖-{timestamp}"
         thread = await message.create_thread(name=thread_name)
 
+    if is_alert:
+        user_input = message.embeds[0].description
+    else:
+        user_input = message.content
+
+    # queue the input if the thread is already busy, the running loop picks it up in its next turn
+    if thread.id in _active_threads:
+        _pending_inputs.setdefault(thread.id, []).append(user_input)
+        return
+
+    # a failed turn does not stop the loop, so inputs queued during it are still answered
+    _active_threads.add(thread.id)
+    try:
+        while True:
+            try:
+                await _run_agent_turn(bot, message, agent, thread, user_input)
+            except Exception as e:
+                console_logger.error(f"❌ Agent turn failed in thread {thread.id}: {e}")
+                await thread.send("❌ Sorry, something went wrong while handling your request, please try again.")
+            pending = _pending_inputs.pop(thread.id, None)
+            if not pending:
+                break
+            user_input = "\n".join(pending)
+    finally:
+        _active_threads.discard(thread.id)
+        dropped = _pending_inputs.pop(thread.id, None)
+        if dropped:
+            console_logger.warning(f"🚫 Dropped {len(dropped)} queued input(s) in thread {thread.id}.")
+
+
+async def _run_agent_turn(
+    bot: commands.Bot,
+    message: discord.Message,
+    agent: "CommandCenterAgent",
+    thread: discord.Thread,
+    user_input: str,
+):
+    """
+    Run a single agent turn in a thread and send its actions and response.
+
+    Args:
+        bot (commands.Bot): The Discord bot instance.
+        message (discord.Message): The message that started the run.
+        agent (CommandCenterAgent): The command center agent.
+        thread (discord.Thread): The thread where the conversation is happening.
+        user_input (str): The user input for this turn.
+
+    """
     # lets agent handle the request and return a response text along with actions taken
     async with thread.typing():
-        if is_alert:
-            user_input = message.embeds[0].description
-        else:
-            user_input = message.content
         response_text, actions = await agent.get_agent_response(user_input, thread)
 
     # log the actions taken by the agent
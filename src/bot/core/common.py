@@ -8,8 +8,13 @@ contents. These handlers are triggered by Discord component interactions.
 
 import discord
 
-from bot.services.discord_svc import delete_channel, export_channel_contents
+from bot.config.ticket_archival import ticket_archival_config
+from bot.services.discord_svc import delete_channel, export_channel_contents, respond_to_interaction
+from bot.services.export_job_svc import is_export_running, start_export_job, wait_for_export
+from bot.services.ticket_registry_svc import close_ticket, closing_ticket_channel, is_closing_ticket_channel
+from bot.services.transcript_journal_svc import read_transcript
 from bot.ui.embeds.common.close_ticket_confirmation import CloseTicketConfirmationEmbed
+from bot.utils.console_logger import console_logger
 
 
 async def on_close_ticket(interaction: discord.Interaction):
@@ -30,39 +35,85 @@ async def on_export_ticket(interaction: discord.Interaction):
     """
     Handle the download ticket button click.
 
-    Exports the contents of the ticket channel and sends it to the user.
+    Starts a background export of the ticket channel, which sends the file to the
+    channel when it is done, and responds right away.
 
     Args:
         interaction (discord.Interaction): The interaction triggered by the button click.
 
     """
-    bot = interaction.client
-    await export_channel_contents(bot, interaction.channel_id, interaction.channel_id)
+    if is_closing_ticket_channel(interaction.channel_id):
+        await respond_to_interaction(interaction, "ℹ️ This ticket is being closed.", ephemeral=True)
+        return
+    if is_export_running(interaction.channel_id):
+        await respond_to_interaction(interaction, "ℹ️ This ticket is already being exported.", ephemeral=True)
+        return
+
+    await respond_to_interaction(
+        interaction, "📁 Exporting this ticket, the file will be posted here when it is ready.", ephemeral=True
+    )
+    await start_export_job(interaction.client, interaction.channel, interaction.channel_id)
 
 
 async def on_confirm_close_ticket(interaction: discord.Interaction):
     """
     Handle the confirm button interaction.
 
-    Deletes the ticket channel.
+    Waits for any export of the ticket channel to finish, sends the transcript of
+    the ticket (read from the transcript journal if the ticket was journaled) to
+    the archive channel, then deletes the ticket channel and closes its ticket in
+    the registry. The channel is kept if the transcript could not be sent.
 
     Args:
         interaction (discord.Interaction): The interaction that triggered the confirm.
 
     """
     bot = interaction.client
-    await delete_channel(bot, interaction.guild, interaction.channel_id)
+    channel_id = interaction.channel_id
+    if is_closing_ticket_channel(channel_id):
+        await respond_to_interaction(interaction, "ℹ️ This ticket is already being closed.", ephemeral=True)
+        return
+
+    await respond_to_interaction(interaction, "🗄️ Saving the transcript and closing this ticket...", ephemeral=True)
+
+    # new exports are refused while the channel is marked, so none can start after the wait
+    async with closing_ticket_channel(channel_id):
+        await wait_for_export(channel_id)
+
+        if ticket_archival_config.ticket_archive_channel_id:
+            exported = await export_channel_contents(
+                bot,
+                channel_id,
+                ticket_archival_config.ticket_archive_channel_id,
+                include_asset_urls=True,
+                messages=await read_transcript(channel_id),
+            )
+            if not exported:
+                console_logger.error(
+                    f"❌ Failed to export the transcript of ticket channel {channel_id}, not closing it."
+                )
+                await respond_to_interaction(
+                    interaction, "❌ Failed to save the transcript, the ticket was not closed.", ephemeral=True
+                )
+                return
+        else:
+            console_logger.warning("🚫 No ticket archive channel is configured, closing ticket without a transcript.")
+
+        if await delete_channel(bot, interaction.guild, channel_id):
+            await close_ticket(channel_id)
 
 
 async def on_cancel_close_ticket(interaction: discord.Interaction):
     """
     Handle the cancel button interaction.
 
-    Deletes the confirmation prompt without closing the channel.
+    Deletes the confirmation prompt without closing the channel. The handler is
+    registered without automatic deferral, so its deferred update makes the prompt
+    itself the original response that is deleted.
 
     Args:
         interaction (discord.Interaction): The interaction that triggered the cancel.
 
     """
-    await interaction.response.defer(ephemeral=True)
+    await interaction.response.defer()
     await interaction.delete_original_response()
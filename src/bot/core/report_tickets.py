@@ -8,23 +8,26 @@ permissions, sending ticket info embeds, and setting up the ticket
 system in a given channel.
 """
 
-from typing import Union
+from typing import Optional, Union
 
 import discord
 from discord.ext import commands
 
 from bot.config.common import common_config
 from bot.config.report_tickets import report_tickets_config
-from bot.database.mysql.ticket_counter import get_next_ticket_number
 from bot.services.discord_svc import (
     create_channel,
     set_member_channel_permissions,
     set_role_channel_permissions,
 )
+from bot.services.ticket_creation_svc import create_ticket_once
+from bot.services.ticket_registry_svc import register_ticket
+from bot.services.transcript_journal_svc import start_transcript_journal
 from bot.ui.embeds.report_tickets.main_menu import MainMenuEmbed
 from bot.ui.embeds.report_tickets.report_plugin_info import ReportPluginInfoEmbed
 from bot.ui.embeds.report_tickets.report_theme_info import ReportThemeInfoEmbed
 from bot.utils.console_logger import console_logger
+from bot.utils.tracing import traced
 
 
 async def on_report_theme(interaction: discord.Interaction):
@@ -93,6 +96,34 @@ async def _create_report_ticket(
     ctx_or_interaction: Union[commands.Context, discord.Interaction],
     report_type: str,
 ) -> bool:
+    """
+    Create a report ticket channel for the user, unless they have one open or being created.
+
+    Args:
+        user (discord.Member): The member creating the ticket.
+        ctx_or_interaction (Union[commands.Context, discord.Interaction]): The context or interaction source.
+        report_type (str): The type of report ("theme" or "plugin").
+
+    Returns:
+        bool: True if the ticket was created by this call, False otherwise.
+
+    """
+    return await create_ticket_once(
+        user,
+        ctx_or_interaction,
+        "report_tickets",
+        "report ticket",
+        lambda ticket_number: _open_report_ticket(user, ctx_or_interaction, report_type, ticket_number),
+    )
+
+
+@traced("ticket.create_report")
+async def _open_report_ticket(
+    user: discord.Member,
+    ctx_or_interaction: Union[commands.Context, discord.Interaction],
+    report_type: str,
+    ticket_number: int,
+) -> Optional[discord.TextChannel]:
     """
     Create a report ticket channel for the user.
 
@@ -103,9 +134,10 @@ async def _create_report_ticket(
         user (discord.Member): The member creating the ticket.
         ctx_or_interaction (Union[commands.Context, discord.Interaction]): The context or interaction source.
         report_type (str): The type of report ("theme" or "plugin").
+        ticket_number (int): The number reserved for the ticket.
 
     Returns:
-        bool: Whether the report ticket channel was created successfully.
+        Optional[discord.TextChannel]: The ticket channel, or None if it could not be created.
 
     """
     # Generate ticket details
@@ -114,7 +146,6 @@ async def _create_report_ticket(
     else:
         bot = ctx_or_interaction.client
 
-    ticket_number = await get_next_ticket_number("report_tickets")
     channel_name = f"📌-report-{ticket_number}"
 
     # Create private channel
@@ -129,7 +160,10 @@ async def _create_report_ticket(
     )
     if not channel:
         console_logger.error("❌ Failed to create a report ticket channel.")
-        return False
+        return None
+
+    await register_ticket("report_tickets", ticket_number, user.id, channel.id)
+    await start_transcript_journal(channel.id)
 
     # Add ticket creator to channel
     await set_member_channel_permissions(
@@ -160,4 +194,4 @@ async def _create_report_ticket(
         report_ticket_info_embed = ReportPluginInfoEmbed
 
     await report_ticket_info_embed.send(ctx_or_interaction, channel, ticket_number)
-    return True
+    return channel
@@ -4,15 +4,38 @@ SmartChat service module for handling AI interaction via HTTP.
 This module manages the lifecycle of an aiohttp session and defines
 logic for communicating with the external SmartChat API. It includes
 functions to start and close sessions and retrieve AI-generated
-responses based on user input.
+responses based on user input, as well as a local pre-filter that
+skips messages unlikely to need a response before they reach the API.
 """
 
-from typing import Optional
+import re
+import time
+from collections import Counter
+from typing import Dict, Optional
 
 import aiohttp
+import discord
 
 from bot.config.smart_chat import smart_chat_config
 
+# patterns stripped from a message before measuring how much actual text it contains
+URL_PATTERN = re.compile(r"https?://\S+")
+DISCORD_TOKEN_PATTERN = re.compile(r"<(?:@[!&]?|#|a?:\w+:)\d+>")
+NON_TEXT_PATTERN = re.compile(r"[\W_]+")
+
+# short acknowledgements that never need a response
+ACKNOWLEDGEMENT_PATTERN = re.compile(
+    r"^(?:thanks?|thank you|thx|ty|tysm|ok|okay|k|kk|lol|lmao|nice|cool|great|awesome|yes|no|yep|nope|np|gg)"
+    r"(?:\s+(?:so much|a lot|all|guys|everyone))?[\s!.]*$",
+    re.IGNORECASE,
+)
+
+# words that typically open a question
+QUESTION_PATTERN = re.compile(
+    r"\?|^(?:how|what|why|when|where|who|which|can|could|does|do|did|is|are|should|would|will|anyone|any)\b",
+    re.IGNORECASE,
+)
+
 
 async def start_session() -> aiohttp.ClientSession:
     """
@@ -63,3 +86,92 @@ async def get_ai_response(session: aiohttp.ClientSession, message_content: str)
     except Exception as e:
         print(f"SmartChat API request failed: {e}")
         return None
+
+
+class SmartChatFilter:
+    """
+    Local pre-filter deciding whether a message should be sent to the SmartChat API.
+
+    Applies user rules, length and acknowledgement checks, question heuristics and
+    a keyword index, followed by a per-user cooldown. Counters for forwarded and
+    skipped messages (by reason) are kept for observability.
+
+    Attributes:
+        counters (Counter): Count of messages per outcome, e.g. `passed` or `skipped_too_short`.
+
+    """
+
+    def __init__(self):
+        """
+        Initialize the filter and compile the keyword index from config.
+        """
+        self.counters: Counter = Counter()
+        self._last_forwarded_at: Dict[int, float] = {}
+        self._ignored_user_ids = set(smart_chat_config.smart_chat_ignored_user_ids)
+        keywords = sorted(smart_chat_config.smart_chat_keywords, key=len, reverse=True)
+        self._keyword_pattern = (
+            re.compile(r"\b(?:" + "|".join(re.escape(keyword) for keyword in keywords) + r")\b", re.IGNORECASE)
+            if keywords
+            else None
+        )
+
+    def should_forward(self, message: discord.Message) -> bool:
+        """
+        Check whether a message is likely a question worth sending to the API.
+
+        Args:
+            message (discord.Message): The message to check.
+
+        Returns:
+            bool: True if the message should be forwarded, False if it should be skipped.
+
+        """
+        reason = self._get_skip_reason(message)
+        if reason:
+            self.counters[f"skipped_{reason}"] += 1
+            return False
+
+        self._last_forwarded_at[message.author.id] = time.monotonic()
+        self.counters["passed"] += 1
+        return True
+
+    def _get_skip_reason(self, message: discord.Message) -> Optional[str]:
+        """
+        Determine why a message should be skipped, if at all.
+
+        Checks are ordered from cheapest to most expensive.
+
+        Args:
+            message (discord.Message): The message to check.
+
+        Returns:
+            Optional[str]: The reason for skipping, or None if the message should be forwarded.
+
+        """
+        if message.author.bot or message.webhook_id:
+            return "bot"
+
+        if message.author.id in self._ignored_user_ids:
+            return "ignored_user"
+
+        content = message.content.strip()
+        if content.startswith(("!", "/")):
+            return "command"
+
+        text = DISCORD_TOKEN_PATTERN.sub(" ", URL_PATTERN.sub(" ", content)).strip()
+        words = NON_TEXT_PATTERN.sub(" ", text).strip()
+        if len(words.replace(" ", "")) < smart_chat_config.smart_chat_min_length:
+            return "too_short"
+
+        if ACKNOWLEDGEMENT_PATTERN.match(words):
+            return "acknowledgement"
+
+        if not QUESTION_PATTERN.search(text) and not (self._keyword_pattern and self._keyword_pattern.search(text)):
+            return "not_question"
+
+        last_forwarded_at = self._last_forwarded_at.get(message.author.id)
+        cooldown = smart_chat_config.smart_chat_cooldown
+        if last_forwarded_at is not None and time.monotonic() - last_forwarded_at < cooldown:
+            return "cooldown"
+
+        return None
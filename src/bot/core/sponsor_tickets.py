@@ -8,19 +8,21 @@ sending appropriate information embeds depending on the sponsor-related
 action selected.
 """
 
-from typing import Union
+from typing import Optional, Union
 
 import discord
 from discord.ext import commands
 
 from bot.config.common import common_config
 from bot.config.sponsor_tickets import sponsor_tickets_config
-from bot.database.mysql.ticket_counter import get_next_ticket_number
 from bot.services.discord_svc import (
     create_channel,
     set_member_channel_permissions,
     set_role_channel_permissions,
 )
+from bot.services.ticket_creation_svc import create_ticket_once
+from bot.services.ticket_registry_svc import register_ticket
+from bot.services.transcript_journal_svc import start_transcript_journal
 from bot.ui.embeds.sponsor_tickets.become_sponsor_info import BecomeSponsorInfoEmbed
 from bot.ui.embeds.sponsor_tickets.claim_sponsor_role_info import (
     ClaimSponsorRoleInfoEmbed,
@@ -28,6 +30,7 @@ from bot.ui.embeds.sponsor_tickets.claim_sponsor_role_info import (
 from bot.ui.embeds.sponsor_tickets.main_menu import MainMenuEmbed
 from bot.ui.embeds.sponsor_tickets.submit_enquiry_info import SubmitEnquiryInfoEmbed
 from bot.utils.console_logger import console_logger
+from bot.utils.tracing import traced
 
 
 async def on_become_a_sponsor(interaction: discord.Interaction):
@@ -110,6 +113,34 @@ async def _create_sponsor_ticket(
     ctx_or_interaction: Union[commands.Context, discord.Interaction],
     action: str,
 ) -> bool:
+    """
+    Create a sponsor ticket channel for a user, unless they have one open or being created.
+
+    Args:
+        user (discord.Member): The user initiating the ticket.
+        ctx_or_interaction (Union[commands.Context, discord.Interaction]): The context or interaction.
+        action (str): The action type (e.g., "become_a_sponsor", "claim_sponsor_role", "submit_enquiry").
+
+    Returns:
+        bool: True if the ticket was created by this call, False otherwise.
+
+    """
+    return await create_ticket_once(
+        user,
+        ctx_or_interaction,
+        "sponsor_tickets",
+        "sponsor ticket",
+        lambda ticket_number: _open_sponsor_ticket(user, ctx_or_interaction, action, ticket_number),
+    )
+
+
+@traced("ticket.create_sponsor")
+async def _open_sponsor_ticket(
+    user: discord.Member,
+    ctx_or_interaction: Union[commands.Context, discord.Interaction],
+    action: str,
+    ticket_number: int,
+) -> Optional[discord.TextChannel]:
     """
     Create a sponsor ticket channel for a user.
 
@@ -120,9 +151,10 @@ async def _create_sponsor_ticket(
         user (discord.Member): The user initiating the ticket.
         ctx_or_interaction (Union[commands.Context, discord.Interaction]): The context or interaction.
         action (str): The action type (e.g., "become_a_sponsor", "claim_sponsor_role", "submit_enquiry").
+        ticket_number (int): The number reserved for the ticket.
 
     Returns:
-        bool: True if the channel was created successfully, False otherwise.
+        Optional[discord.TextChannel]: The ticket channel, or None if it could not be created.
 
     """
     if isinstance(ctx_or_interaction, commands.Context):
@@ -130,7 +162,6 @@ async def _create_sponsor_ticket(
     else:
         bot = ctx_or_interaction.client
 
-    ticket_number = await get_next_ticket_number("sponsor_tickets")
     channel_name = f"📌-sponsor-{ticket_number}"
 
     guild = user.guild
@@ -145,7 +176,10 @@ async def _create_sponsor_ticket(
     )
     if not channel:
         console_logger.error("❌ Failed to create a sponsor ticket channel.")
-        return False
+        return None
+
+    await register_ticket("sponsor_tickets", ticket_number, user.id, channel.id)
+    await start_transcript_journal(channel.id)
 
     await set_member_channel_permissions(
         channel,
@@ -175,4 +209,4 @@ async def _create_sponsor_ticket(
         sponsor_ticket_info_embed = SubmitEnquiryInfoEmbed
 
     await sponsor_ticket_info_embed.send(ctx_or_interaction, channel, ticket_number)
-    return True
+    return channel
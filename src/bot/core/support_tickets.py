@@ -8,25 +8,28 @@ naming, configures permissions, and sends relevant informational embeds
 to guide users through the support process.
 """
 
-from typing import List, Union
+from typing import List, Optional, Union
 
 import discord
 from discord.ext import commands
 
 from bot.config.common import common_config
 from bot.config.support_tickets import support_tickets_config
-from bot.database.mysql.ticket_counter import get_next_ticket_number
-from bot.models.sponsor_tier import SponsorTier
 from bot.services.discord_svc import (
     create_channel,
+    respond_to_interaction,
     set_member_channel_permissions,
     set_role_channel_permissions,
 )
 from bot.services.role_checker_svc import is_recurring_sponsor_user
+from bot.services.ticket_creation_svc import create_ticket_once
+from bot.services.ticket_registry_svc import register_ticket
+from bot.services.transcript_journal_svc import start_transcript_journal
 from bot.services.user_info_svc import get_user_recurring_sponsor_tiers
 from bot.ui.embeds.support_tickets.main_menu import MainMenuEmbed
 from bot.ui.embeds.support_tickets.new_ticket_info import NewTicketInfoEmbed
 from bot.utils.console_logger import console_logger
+from bot.utils.tracing import traced
 
 
 async def on_create_ticket(interaction: discord.Interaction):
@@ -43,7 +46,8 @@ async def on_create_ticket(interaction: discord.Interaction):
 
     """
     if not is_recurring_sponsor_user(interaction.user):
-        return await interaction.response.send_message(
+        return await respond_to_interaction(
+            interaction,
             "🚫 You must be a sponsor to create premium support tickets.",
             ephemeral=True,
         )
@@ -83,6 +87,32 @@ async def _create_support_ticket(
     user: discord.Member,
     ctx_or_interaction: Union[commands.Context, discord.Interaction],
 ) -> bool:
+    """
+    Create a support ticket channel for a recurring sponsor, unless they have one open or being created.
+
+    Args:
+        user (discord.Member): The user creating the ticket.
+        ctx_or_interaction (Union[commands.Context, discord.Interaction]): The context or interaction.
+
+    Returns:
+        bool: True if the ticket was created by this call, False otherwise.
+
+    """
+    return await create_ticket_once(
+        user,
+        ctx_or_interaction,
+        "support_tickets",
+        "support ticket",
+        lambda ticket_number: _open_support_ticket(user, ctx_or_interaction, ticket_number),
+    )
+
+
+@traced("ticket.create_support")
+async def _open_support_ticket(
+    user: discord.Member,
+    ctx_or_interaction: Union[commands.Context, discord.Interaction],
+    ticket_number: int,
+) -> Optional[discord.TextChannel]:
     """
     Create a support ticket channel for a recurring sponsor.
 
@@ -92,9 +122,10 @@ async def _create_support_ticket(
     Args:
         user (discord.Member): The user creating the ticket.
         ctx_or_interaction (Union[commands.Context, discord.Interaction]): The context or interaction.
+        ticket_number (int): The number reserved for the ticket.
 
     Returns:
-        bool: True if the ticket was created successfully, False otherwise.
+        Optional[discord.TextChannel]: The ticket channel, or None if it could not be created.
 
     """
     if isinstance(ctx_or_interaction, commands.Context):
@@ -102,8 +133,7 @@ async def _create_support_ticket(
     else:
         bot = ctx_or_interaction.client
 
-    ticket_number = await get_next_ticket_number("support_tickets")
-    sponsor_tiers: List[SponsorTier] = get_user_recurring_sponsor_tiers(user)
+    sponsor_tiers: List[str] = get_user_recurring_sponsor_tiers(user)
     top_tier = sponsor_tiers[0]
     channel_name = f"{common_config.recurring_sponsor_tiers[top_tier].emoji}-support-{ticket_number}"
 
@@ -119,7 +149,10 @@ async def _create_support_ticket(
     )
     if not channel:
         console_logger.error("❌ Failed to create a support ticket channel.")
-        return False
+        return None
+
+    await register_ticket("support_tickets", ticket_number, user.id, channel.id)
+    await start_transcript_journal(channel.id)
 
     await set_member_channel_permissions(
         channel,
@@ -142,4 +175,4 @@ async def _create_support_ticket(
     )
 
     await NewTicketInfoEmbed.send(ctx_or_interaction, channel, ticket_number)
-    return True
+    return channel
@@ -0,0 +1,136 @@
+"""
+Ticket archival handler module for archiving idle ticket channels.
+
+This module finds open tickets whose channel has had no new messages for
+longer than the configured idle threshold, exports their transcript to the
+archive channel, and then deletes their channel and records them as archived.
+Tickets are archived in small batches with a delay in between to stay within
+Discord's rate limits.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+import discord
+from discord.ext import commands
+
+from bot.config.ticket_archival import ticket_archival_config
+from bot.database.mysql.tickets import TICKET_STATUS_ARCHIVED, Ticket
+from bot.services.discord_svc import delete_channel, export_channel_contents
+from bot.services.export_job_svc import is_export_running
+from bot.services.ticket_registry_svc import (
+    close_ticket,
+    closing_ticket_channel,
+    is_closing_ticket_channel,
+    list_open_tickets,
+)
+from bot.services.transcript_journal_svc import read_transcript
+from bot.utils.console_logger import console_logger
+from bot.utils.tracing import traced
+
+
+@traced("ticket.archive_idle")
+async def archive_idle_tickets(bot: commands.Bot) -> int:
+    """
+    Archive all tickets that have been idle for longer than the configured threshold.
+
+    Args:
+        bot (commands.Bot): The bot instance.
+
+    Returns:
+        int: The number of tickets archived.
+
+    """
+    if not ticket_archival_config.ticket_archive_channel_id:
+        console_logger.warning("🚫 No ticket archive channel is configured, skipping ticket archival.")
+        return 0
+
+    idle_tickets = _find_idle_tickets(bot)
+    if not idle_tickets:
+        return 0
+
+    console_logger.info(f"🗄️ Archiving {len(idle_tickets)} idle ticket(s).")
+    archived = 0
+    batch_size = max(ticket_archival_config.ticket_archival_batch_size, 1)
+    for start in range(0, len(idle_tickets), batch_size):
+        if start:
+            await asyncio.sleep(ticket_archival_config.ticket_archival_batch_delay)
+        batch = idle_tickets[start : start + batch_size]
+        results = await asyncio.gather(*(_archive_ticket(bot, ticket) for ticket in batch))
+        archived += sum(results)
+
+    console_logger.info(f"✅ Archived {archived}/{len(idle_tickets)} idle ticket(s).")
+    return archived
+
+
+def _find_idle_tickets(bot: commands.Bot) -> List[Ticket]:
+    """
+    Find the open tickets whose channel has had no messages since the idle threshold.
+
+    The time of the last message is taken from the channel's last message ID, so no
+    messages have to be fetched from Discord. Tickets being exported are left for a
+    later sweep, so their channel is not deleted under the export.
+
+    Args:
+        bot (commands.Bot): The bot instance.
+
+    Returns:
+        List[Ticket]: The idle tickets, oldest first.
+
+    """
+    idle_since = datetime.now(timezone.utc) - timedelta(hours=ticket_archival_config.ticket_idle_hours)
+
+    idle_tickets = []
+    for ticket in list_open_tickets():
+        channel = bot.get_channel(ticket.channel_id)
+        if not isinstance(channel, discord.TextChannel) or is_export_running(ticket.channel_id):
+            continue
+        if channel.last_message_id:
+            last_activity = discord.utils.snowflake_time(channel.last_message_id)
+        else:
+            last_activity = ticket.created_at.replace(tzinfo=timezone.utc)
+        if last_activity < idle_since:
+            idle_tickets.append(ticket)
+    return idle_tickets
+
+
+async def _archive_ticket(bot: commands.Bot, ticket: Ticket) -> bool:
+    """
+    Export the transcript of a ticket to the archive channel, then delete its channel.
+
+    The transcript is read from the transcript journal if the ticket was journaled.
+
+    The channel is kept if the export fails, so the ticket is retried on the next sweep.
+
+    Args:
+        bot (commands.Bot): The bot instance.
+        ticket (Ticket): The ticket to archive.
+
+    Returns:
+        bool: True if the ticket was archived, False otherwise.
+
+    """
+    # an export or a close may have started since the ticket was found idle
+    channel = bot.get_channel(ticket.channel_id)
+    if channel is None or is_export_running(ticket.channel_id) or is_closing_ticket_channel(ticket.channel_id):
+        return False
+
+    # marked while exporting too, so a manual close does not run alongside, and the channel delete
+    # listener would otherwise close the ticket as 'closed' before it is archived
+    async with closing_ticket_channel(ticket.channel_id):
+        exported = await export_channel_contents(
+            bot,
+            ticket.channel_id,
+            ticket_archival_config.ticket_archive_channel_id,
+            include_asset_urls=True,
+            messages=await read_transcript(ticket.channel_id),
+        )
+        if not exported:
+            console_logger.error(f"❌ Failed to export {ticket.ticket_type} #{ticket.ticket_number}, not archiving it.")
+            return False
+
+        if not await delete_channel(bot, channel.guild, ticket.channel_id):
+            return False
+        await close_ticket(ticket.channel_id, TICKET_STATUS_ARCHIVED)
+    return True
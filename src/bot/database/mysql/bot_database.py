@@ -6,11 +6,13 @@ sessionmaker used by the Discord bot for database operations.
 Configuration is loaded via a Pydantic settings model.
 """
 
+import logging
+
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 
 from bot.config.database import DatabaseConfig, database_config
-from bot.utils.console_logger import console_logger
+from bot.utils.console_logger import console_logger, queue_handler
 
 Base = declarative_base()
 
@@ -43,7 +45,12 @@ class BotDatabase:
             f"mysql+aiomysql://{db_config.mysql_user}:{db_config.mysql_password}@"
             f"{db_config.mysql_host}:{db_config.mysql_port}/{db_config.mysql_database}"
         )
-        self.engine = create_async_engine(self.database_url, echo=True)
+        self.engine = create_async_engine(self.database_url)
+        if db_config.mysql_echo:
+            # same output as echo=True, but written through the non-blocking log queue
+            engine_logger = logging.getLogger("sqlalchemy.engine")
+            engine_logger.setLevel(logging.INFO)
+            engine_logger.addHandler(queue_handler)
         self.async_session = sessionmaker(self.engine, expire_on_commit=False, class_=AsyncSession)
 
     async def close(self):
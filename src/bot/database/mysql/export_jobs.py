@@ -0,0 +1,130 @@
+"""
+Export jobs module for persisting the progress of channel exports.
+
+This module defines a SQLAlchemy model for the `export_jobs` table, which
+records each background export of a channel's message history along with its
+status and a checkpoint of how far it got, and provides async functions to
+create jobs, save their progress and fetch the jobs left unfinished (e.g. by a
+restart) so they can be resumed.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, List
+
+from sqlalchemy import BigInteger, Boolean, Column, DateTime, Integer, String, select, update
+
+from bot.database.mysql.bot_database import Base, bot_database
+from bot.utils.tracing import traced
+
+EXPORT_STATUS_QUEUED = "queued"
+EXPORT_STATUS_RUNNING = "running"
+EXPORT_STATUS_COMPLETED = "completed"
+EXPORT_STATUS_FAILED = "failed"
+
+
+def _utcnow() -> datetime:
+    """
+    Get the current UTC time as a naive datetime, as stored by MySQL.
+
+    Returns:
+        datetime: The current UTC time.
+
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class ExportJob(Base):
+    """
+    SQLAlchemy model representing a background channel export.
+
+    Attributes:
+        id (int): The unique ID of the job.
+        channel_id (int): The Discord channel ID of the exported channel.
+        download_channel_id (int): The Discord channel ID where the export is sent.
+        include_asset_urls (bool): Whether URLs of attachments and embeds are included.
+        status (str): The status of the job (e.g., 'queued', 'running', 'completed', 'failed').
+        status_message_id (Optional[int]): The Discord message ID showing the job's progress.
+        last_message_id (Optional[int]): The ID of the last exported message (the checkpoint).
+        file_offset (int): The size of the export file at the checkpoint.
+        message_count (int): The number of messages exported up to the checkpoint.
+        created_at (datetime): When the job was created (UTC).
+        updated_at (datetime): When the job was last updated (UTC).
+
+    """
+
+    __tablename__ = "export_jobs"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    channel_id = Column(BigInteger, nullable=False, index=True)
+    download_channel_id = Column(BigInteger, nullable=False)
+    include_asset_urls = Column(Boolean, nullable=False, default=True)
+    status = Column(String(20), nullable=False, default=EXPORT_STATUS_QUEUED, index=True)
+    status_message_id = Column(BigInteger, nullable=True)
+    last_message_id = Column(BigInteger, nullable=True)
+    file_offset = Column(BigInteger, nullable=False, default=0)
+    message_count = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, nullable=False, default=_utcnow)
+    updated_at = Column(DateTime, nullable=False, default=_utcnow, onupdate=_utcnow)
+
+
+@traced("db.insert_export_job")
+async def insert_export_job(channel_id: int, download_channel_id: int, include_asset_urls: bool) -> ExportJob:
+    """
+    Insert a new queued export job.
+
+    Args:
+        channel_id (int): The Discord channel ID of the channel to export.
+        download_channel_id (int): The Discord channel ID where the export is sent.
+        include_asset_urls (bool): Whether URLs of attachments and embeds are included.
+
+    Returns:
+        ExportJob: The inserted job.
+
+    """
+    job = ExportJob(
+        channel_id=channel_id,
+        download_channel_id=download_channel_id,
+        include_asset_urls=include_asset_urls,
+        status=EXPORT_STATUS_QUEUED,
+        file_offset=0,
+        message_count=0,
+    )
+    async with bot_database.async_session() as session:
+        async with session.begin():
+            session.add(job)
+    return job
+
+
+@traced("db.update_export_job")
+async def update_export_job(job_id: int, **values: Any):
+    """
+    Update the columns of an export job.
+
+    Args:
+        job_id (int): The ID of the job.
+        **values (Any): The columns to update and their new values.
+
+    """
+    async with bot_database.async_session() as session:
+        async with session.begin():
+            await session.execute(
+                update(ExportJob).where(ExportJob.id == job_id).values(updated_at=_utcnow(), **values)
+            )
+
+
+@traced("db.get_unfinished_export_jobs")
+async def get_unfinished_export_jobs() -> List[ExportJob]:
+    """
+    Fetch the export jobs that are still queued or running.
+
+    Returns:
+        List[ExportJob]: The unfinished jobs, oldest first.
+
+    """
+    async with bot_database.async_session() as session:
+        result = await session.execute(
+            select(ExportJob)
+            .where(ExportJob.status.in_((EXPORT_STATUS_QUEUED, EXPORT_STATUS_RUNNING)))
+            .order_by(ExportJob.id)
+        )
+        return list(result.scalars().all())
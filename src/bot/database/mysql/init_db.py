@@ -8,7 +8,11 @@ database before usage.
 """
 
 from bot.database.mysql.bot_database import Base, bot_database
+from bot.database.mysql.export_jobs import ExportJob
+from bot.database.mysql.module_states import ModuleState
 from bot.database.mysql.ticket_counter import TicketCounter
+from bot.database.mysql.tickets import Ticket
+from bot.database.mysql.transcripts import TranscriptJournal, TranscriptMessage
 from bot.utils.console_logger import console_logger
 
 
@@ -18,9 +22,15 @@ async def init_db():
 
     This function connects to the database using the configured async
     engine, runs `Base.metadata.create_all()` to create any missing
-    tables, and logs confirmation that the TicketCounter table is
-    loaded.
+    tables, and logs confirmation that the TicketCounter, Ticket,
+    ExportJob, TranscriptJournal, TranscriptMessage and ModuleState tables
+    are loaded.
     """
     async with bot_database.engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     console_logger.info(f"{TicketCounter} table loaded.")
+    console_logger.info(f"{Ticket} table loaded.")
+    console_logger.info(f"{ExportJob} table loaded.")
+    console_logger.info(f"{TranscriptJournal} table loaded.")
+    console_logger.info(f"{TranscriptMessage} table loaded.")
+    console_logger.info(f"{ModuleState} table loaded.")
@@ -0,0 +1,74 @@
+"""
+Module states module for persisting which bot modules are enabled.
+
+This module defines a SQLAlchemy model for the `module_states` table, which
+records modules enabled or disabled at runtime with `/module enable|disable`,
+and provides async functions to read all states and save the state of a module,
+so the changes are kept across restarts.
+"""
+
+from datetime import datetime, timezone
+from typing import Dict
+
+from sqlalchemy import Boolean, Column, DateTime, String, select
+
+from bot.database.mysql.bot_database import Base, bot_database
+from bot.utils.tracing import traced
+
+
+def _utcnow() -> datetime:
+    """
+    Get the current UTC time as a naive datetime, as stored by MySQL.
+
+    Returns:
+        datetime: The current UTC time.
+
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class ModuleState(Base):
+    """
+    SQLAlchemy model representing the persisted state of a bot module.
+
+    Attributes:
+        module_name (str): The name of the module (e.g., 'smart_chat').
+        enabled (bool): Whether the module is enabled.
+        updated_at (datetime): When the state was last changed (UTC).
+
+    """
+
+    __tablename__ = "module_states"
+
+    module_name = Column(String(50), primary_key=True)
+    enabled = Column(Boolean, nullable=False)
+    updated_at = Column(DateTime, nullable=False, default=_utcnow, onupdate=_utcnow)
+
+
+@traced("db.get_module_states")
+async def get_module_states() -> Dict[str, bool]:
+    """
+    Fetch the persisted states of all modules.
+
+    Returns:
+        Dict[str, bool]: Whether each module with a persisted state is enabled, by module name.
+
+    """
+    async with bot_database.async_session() as session:
+        result = await session.execute(select(ModuleState))
+        return {state.module_name: state.enabled for state in result.scalars().all()}
+
+
+@traced("db.set_module_state")
+async def set_module_state(module_name: str, enabled: bool):
+    """
+    Save whether a module is enabled.
+
+    Args:
+        module_name (str): The name of the module (e.g., 'smart_chat').
+        enabled (bool): Whether the module is enabled.
+
+    """
+    async with bot_database.async_session() as session:
+        async with session.begin():
+            await session.merge(ModuleState(module_name=module_name, enabled=enabled, updated_at=_utcnow()))
@@ -10,6 +10,7 @@ from sqlalchemy import Column, Integer, String, select
 
 from bot.database.mysql.bot_database import Base, bot_database
 from bot.utils.console_logger import console_logger
+from bot.utils.tracing import traced
 
 
 class TicketCounter(Base):
@@ -30,6 +31,7 @@ class TicketCounter(Base):
     current_count = Column(Integer, nullable=False)
 
 
+@traced("db.initialize_ticket_counter_table")
 async def initialize_ticket_counter_table():
     """
     Initialize the ticket_counters table with default entries.
@@ -50,6 +52,7 @@ async def initialize_ticket_counter_table():
     console_logger.info("✅ Ticket counter database initialized!")
 
 
+@traced("db.get_next_ticket_number")
 async def get_next_ticket_number(ticket_type: str) -> int:
     """
     Fetch and increment the next ticket number for a given ticket type.
@@ -0,0 +1,130 @@
+"""
+Tickets module for persisting ticket channels and their status.
+
+This module defines a SQLAlchemy model for the `tickets` table, which records
+every ticket channel created by the bot along with its type, number, owner and
+status, and provides async functions to insert tickets, update their status and
+fetch the tickets that are still open.
+"""
+
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from sqlalchemy import BigInteger, Column, DateTime, Index, Integer, String, select
+
+from bot.database.mysql.bot_database import Base, bot_database
+from bot.utils.tracing import traced
+
+TICKET_STATUS_OPEN = "open"
+TICKET_STATUS_CLOSED = "closed"
+TICKET_STATUS_ARCHIVED = "archived"
+
+
+def _utcnow() -> datetime:
+    """
+    Get the current UTC time as a naive datetime, as stored by MySQL.
+
+    Returns:
+        datetime: The current UTC time.
+
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class Ticket(Base):
+    """
+    SQLAlchemy model representing a ticket channel.
+
+    Attributes:
+        id (int): The unique ID of the ticket.
+        ticket_type (str): The type of ticket (e.g., 'support_tickets').
+        ticket_number (int): The ticket number within its type.
+        owner_id (int): The Discord user ID of the member who opened the ticket.
+        channel_id (int): The Discord channel ID of the ticket.
+        status (str): The status of the ticket (e.g., 'open', 'closed', 'archived').
+        created_at (datetime): When the ticket was opened (UTC).
+        updated_at (datetime): When the ticket was last updated (UTC).
+        closed_at (Optional[datetime]): When the ticket was closed (UTC), if it was.
+
+    """
+
+    __tablename__ = "tickets"
+    __table_args__ = (Index("ix_tickets_owner_id_status", "owner_id", "status"),)
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    ticket_type = Column(String(50), nullable=False)
+    ticket_number = Column(Integer, nullable=False)
+    owner_id = Column(BigInteger, nullable=False)
+    channel_id = Column(BigInteger, nullable=False, index=True)
+    status = Column(String(20), nullable=False, default=TICKET_STATUS_OPEN)
+    created_at = Column(DateTime, nullable=False, default=_utcnow)
+    updated_at = Column(DateTime, nullable=False, default=_utcnow, onupdate=_utcnow)
+    closed_at = Column(DateTime, nullable=True)
+
+
+@traced("db.insert_ticket")
+async def insert_ticket(ticket_type: str, ticket_number: int, owner_id: int, channel_id: int) -> Ticket:
+    """
+    Insert a new open ticket.
+
+    Args:
+        ticket_type (str): The type of ticket (e.g., 'support_tickets').
+        ticket_number (int): The ticket number within its type.
+        owner_id (int): The Discord user ID of the ticket owner.
+        channel_id (int): The Discord channel ID of the ticket.
+
+    Returns:
+        Ticket: The inserted ticket.
+
+    """
+    ticket = Ticket(
+        ticket_type=ticket_type,
+        ticket_number=ticket_number,
+        owner_id=owner_id,
+        channel_id=channel_id,
+        status=TICKET_STATUS_OPEN,
+    )
+    async with bot_database.async_session() as session:
+        async with session.begin():
+            session.add(ticket)
+    return ticket
+
+
+@traced("db.update_ticket_status")
+async def update_ticket_status(channel_id: int, status: str) -> Optional[Ticket]:
+    """
+    Update the status of the ticket of a channel.
+
+    Args:
+        channel_id (int): The Discord channel ID of the ticket.
+        status (str): The new status of the ticket.
+
+    Returns:
+        Optional[Ticket]: The updated ticket, or None if the channel is not a ticket.
+
+    """
+    async with bot_database.async_session() as session:
+        async with session.begin():
+            result = await session.execute(select(Ticket).where(Ticket.channel_id == channel_id))
+            ticket = result.scalars().first()
+            if ticket:
+                ticket.status = status
+                if status in (TICKET_STATUS_CLOSED, TICKET_STATUS_ARCHIVED):
+                    ticket.closed_at = _utcnow()
+    return ticket
+
+
+@traced("db.get_open_tickets")
+async def get_open_tickets() -> List[Ticket]:
+    """
+    Fetch all tickets that are still open.
+
+    Returns:
+        List[Ticket]: The open tickets, oldest first.
+
+    """
+    async with bot_database.async_session() as session:
+        result = await session.execute(
+            select(Ticket).where(Ticket.status == TICKET_STATUS_OPEN).order_by(Ticket.created_at)
+        )
+        return list(result.scalars().all())
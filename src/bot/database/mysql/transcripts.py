@@ -0,0 +1,136 @@
+"""
+Transcripts module for journaling the messages of ticket channels.
+
+This module defines SQLAlchemy models for the `transcript_journals` table,
+which records the channels whose messages are journaled from their creation,
+and the `transcript_messages` table, which holds the current text of each
+journaled message. It provides async functions to start a journal, record or
+delete messages, and read a channel's transcript back in message order.
+"""
+
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from sqlalchemy import BigInteger, Column, DateTime, Text, delete, select
+from sqlalchemy.dialects.mysql import insert
+
+from bot.database.mysql.bot_database import Base, bot_database
+from bot.utils.tracing import traced
+
+
+class TranscriptJournal(Base):
+    """
+    SQLAlchemy model representing a channel whose messages are journaled.
+
+    Attributes:
+        channel_id (int): The Discord channel ID.
+        started_at (datetime): When journaling started (UTC).
+
+    """
+
+    __tablename__ = "transcript_journals"
+
+    channel_id = Column(BigInteger, primary_key=True, autoincrement=False)
+    started_at = Column(DateTime, nullable=False)
+
+
+class TranscriptMessage(Base):
+    """
+    SQLAlchemy model representing a journaled message.
+
+    Attributes:
+        channel_id (int): The Discord channel ID of the message.
+        message_id (int): The Discord message ID.
+        text (str): The message formatted for a transcript, as of its last edit.
+
+    """
+
+    __tablename__ = "transcript_messages"
+
+    channel_id = Column(BigInteger, primary_key=True, autoincrement=False)
+    message_id = Column(BigInteger, primary_key=True, autoincrement=False)
+    text = Column(Text, nullable=False)
+
+
+@traced("db.start_transcript_journal")
+async def start_journal(channel_id: int):
+    """
+    Start journaling the messages of a channel.
+
+    Args:
+        channel_id (int): The Discord channel ID.
+
+    """
+    started_at = datetime.now(timezone.utc).replace(tzinfo=None)
+    async with bot_database.async_session() as session:
+        async with session.begin():
+            await session.execute(
+                insert(TranscriptJournal)
+                .values(channel_id=channel_id, started_at=started_at)
+                .on_duplicate_key_update(started_at=started_at)
+            )
+
+
+@traced("db.record_transcript_message")
+async def record_message(channel_id: int, message_id: int, text: str):
+    """
+    Record a new or edited message.
+
+    The message is upserted in a single statement, so concurrent records of the
+    same message (e.g. a message and its embed unfurl edit) cannot collide.
+
+    Args:
+        channel_id (int): The Discord channel ID of the message.
+        message_id (int): The Discord message ID.
+        text (str): The message formatted for a transcript.
+
+    """
+    async with bot_database.async_session() as session:
+        async with session.begin():
+            await session.execute(
+                insert(TranscriptMessage)
+                .values(channel_id=channel_id, message_id=message_id, text=text)
+                .on_duplicate_key_update(text=text)
+            )
+
+
+@traced("db.delete_transcript_message")
+async def delete_message(channel_id: int, message_id: int):
+    """
+    Remove a deleted message from the journal.
+
+    Args:
+        channel_id (int): The Discord channel ID of the message.
+        message_id (int): The Discord message ID.
+
+    """
+    async with bot_database.async_session() as session:
+        async with session.begin():
+            await session.execute(
+                delete(TranscriptMessage).where(
+                    TranscriptMessage.channel_id == channel_id, TranscriptMessage.message_id == message_id
+                )
+            )
+
+
+@traced("db.read_transcript")
+async def read_transcript(channel_id: int) -> Optional[List[str]]:
+    """
+    Read the journaled messages of a channel in message order.
+
+    Args:
+        channel_id (int): The Discord channel ID.
+
+    Returns:
+        Optional[List[str]]: The formatted messages, or None if the channel is not journaled.
+
+    """
+    async with bot_database.async_session() as session:
+        if await session.get(TranscriptJournal, channel_id) is None:
+            return None
+        result = await session.execute(
+            select(TranscriptMessage.text)
+            .where(TranscriptMessage.channel_id == channel_id)
+            .order_by(TranscriptMessage.message_id)
+        )
+        return list(result.scalars().all())
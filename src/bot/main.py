@@ -7,11 +7,14 @@ sets up cogs, connects to the database, and launches the bot.
 Features:
 - Loads all cogs on startup
 - Loads all buttons (register callbacks/views)
-- Initializes database tables
+- Initializes database tables and loads the open ticket registry
 - Sets up slash commands
 - Logs bot readiness to the console
 """
 
+# the import profiler has to be imported first to time all other imports
+from bot.utils import import_profiler  # isort: split
+
 import asyncio
 import os
 
@@ -22,7 +25,14 @@ from dotenv import load_dotenv
 from bot.cogs.cogs_manager import CogsManager
 from bot.database.mysql.init_db import init_db
 from bot.database.mysql.ticket_counter import initialize_ticket_counter_table
+from bot.services.attachment_archive_svc import close_attachment_session
+from bot.services.category_pool_svc import setup_category_pool
+from bot.services.export_job_svc import resume_export_jobs
+from bot.services.member_roles_svc import setup_member_roles_cache
+from bot.services.ticket_registry_svc import load_ticket_registry, setup_ticket_registry
+from bot.services.transcript_journal_svc import setup_transcript_journal
 from bot.ui.buttons.buttons_manager import ButtonsManager
+from bot.ui.interaction_router import InteractionRouter
 from bot.ui.prompts.prompts_manager import PromptsManager
 from bot.utils.console_logger import console_logger
 from bot.web_server import WebServer
@@ -34,12 +44,27 @@ load_dotenv()
 intents = discord.Intents.all()
 bot = commands.Bot(command_prefix="!", intents=intents)
 
+# Set up the interaction router (dispatches buttons, selects and modals to registered handlers)
+InteractionRouter.setup(bot)
+
 # Set up all buttons (register callbacks)
 ButtonsManager.setup(bot)
 
 # Set up all prompts (register callbacks)
 PromptsManager.setup(bot)
 
+# Set up the member roles cache (invalidated when member roles change)
+setup_member_roles_cache(bot)
+
+# Set up the ticket registry (closes tickets whose channel is deleted)
+setup_ticket_registry(bot)
+
+# Set up the ticket category pools (tracks channel counts per category)
+setup_category_pool(bot)
+
+# Set up the transcript journal (records ticket messages as they arrive, if enabled)
+setup_transcript_journal(bot)
+
 # Initialize cog manager
 cogs_manager = CogsManager(bot)
 
@@ -60,9 +85,11 @@ async def on_ready():
     if not bot_startup_complete:
         console_logger.info(f"Logged in as {bot.user} (ID: {bot.user.id})")
 
-        # Initialize DB and ticket counters
+        # Initialize DB, ticket counters, the open ticket registry and unfinished exports
         await init_db()
         bot.loop.create_task(initialize_ticket_counter_table())
+        await load_ticket_registry(bot)
+        bot.loop.create_task(resume_export_jobs(bot))
 
         # Load all cogs
         await cogs_manager.load_all_cogs()
@@ -72,6 +99,9 @@ async def on_ready():
         for cmd in bot.tree.get_commands():
             console_logger.info(f"Command loaded: {cmd.name}")
 
+        # log the slowest imports of the startup if import profiling is enabled
+        import_profiler.log_summary()
+
         bot_startup_complete = True
     else:
         console_logger.info("Reconnected to Discord.")
@@ -83,7 +113,10 @@ async def main():
     """
     async with bot:
         await web_server.start()
-        await bot.start(os.getenv("DISCORD_BOT_TOKEN"))
+        try:
+            await bot.start(os.getenv("DISCORD_BOT_TOKEN"))
+        finally:
+            await close_attachment_session()
 
 
 if __name__ == "__main__":
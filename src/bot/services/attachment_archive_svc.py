@@ -0,0 +1,210 @@
+"""
+Attachment archive service module for keeping the attachments of exported messages.
+
+Attachment URLs in an export stop working once the channel they were sent in
+is deleted, so this module downloads the attachments of exported messages
+into a local content-addressed directory, where each file is stored under the
+SHA-256 of its content (so the same file sent twice is stored once). Downloads
+share one aiohttp session, run a few at a time and are capped in size.
+Exports then reference the archived file of each attachment next to its URL,
+and the archived files are uploaded along with the export, so readers of the
+export can open them after the original channel is gone.
+"""
+
+import asyncio
+import hashlib
+import os
+import re
+import uuid
+from typing import Dict, Iterable, List, Optional
+
+import aiofiles
+import aiohttp
+import discord
+
+from bot.config.exports import exports_config
+from bot.utils.console_logger import console_logger
+
+# size of the chunks attachments are downloaded in
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# maximum number of files Discord accepts in one message
+MAX_FILES_PER_MESSAGE = 10
+
+# matches the archived file names noted in exports (older exports note the whole path)
+_ARCHIVED_NOTE_PATTERN = re.compile(r"\(archived as (?:\S*/)?([0-9a-f]{64}[^\s)/]*)\)")
+
+_download_semaphore = asyncio.Semaphore(exports_config.export_attachment_max_concurrent)
+
+# shared by all downloads, created on first use and kept for the lifetime of the bot
+_session: Optional[aiohttp.ClientSession] = None
+
+
+async def archive_attachments(attachments: Iterable[discord.Attachment]) -> Dict[int, str]:
+    """
+    Download and archive attachments, skipping the ones that are too large or fail to download.
+
+    Does nothing if attachment archival is disabled.
+
+    Args:
+        attachments (Iterable[discord.Attachment]): The attachments to archive.
+
+    Returns:
+        Dict[int, str]: The archived path of each archived attachment, by attachment ID.
+
+    """
+    if not exports_config.export_archive_attachments:
+        return {}
+
+    unique_attachments = {attachment.id: attachment for attachment in attachments}
+    paths = await asyncio.gather(*(_archive_attachment(attachment) for attachment in unique_attachments.values()))
+    return {attachment_id: path for attachment_id, path in zip(unique_attachments, paths) if path}
+
+
+def archived_note(path: str) -> str:
+    """
+    Get the note added to an exported attachment that was archived.
+
+    Args:
+        path (str): The archived path of the attachment.
+
+    Returns:
+        str: The note, naming the archived file as it is uploaded along with the export.
+
+    """
+    return f" (archived as {os.path.basename(path)})"
+
+
+def find_archived_paths(messages: Iterable[str]) -> List[str]:
+    """
+    Find the archived attachments noted in exported messages.
+
+    Args:
+        messages (Iterable[str]): The exported messages.
+
+    Returns:
+        List[str]: The paths of the archived files that still exist, in order of first mention.
+
+    """
+    directory = exports_config.export_attachment_directory
+    paths: Dict[str, None] = {}
+    for message in messages:
+        for file_name in _ARCHIVED_NOTE_PATTERN.findall(message):
+            paths[os.path.join(directory, file_name[:2], file_name)] = None
+    return [path for path in paths if os.path.exists(path)]
+
+
+async def send_archived_attachments(channel: discord.abc.Messageable, messages: Iterable[str]):
+    """
+    Upload the archived attachments noted in exported messages, a few files per message.
+
+    Files larger than the upload limit of the channel's guild are skipped, as they
+    would be rejected by Discord.
+
+    Args:
+        channel (discord.abc.Messageable): The channel to upload the files in, where the export was sent.
+        messages (Iterable[str]): The exported messages.
+
+    """
+    limit = channel.guild.filesize_limit if getattr(channel, "guild", None) else 10 * 1024 * 1024
+    batches: List[List[str]] = []
+    batch_size = 0
+    for path in find_archived_paths(messages):
+        size = os.path.getsize(path)
+        if size > limit:
+            console_logger.warning(f"⚠️ Archived attachment {path} is larger than the upload limit, not uploading.")
+            continue
+        if not batches or len(batches[-1]) >= MAX_FILES_PER_MESSAGE or batch_size + size > limit:
+            batches.append([])
+            batch_size = 0
+        batches[-1].append(path)
+        batch_size += size
+
+    for number, batch in enumerate(batches, start=1):
+        try:
+            await channel.send(
+                f"📎 Archived attachments ({number}/{len(batches)})",
+                files=[discord.File(path) for path in batch],
+            )
+        except discord.HTTPException as e:
+            console_logger.error(f"❌ Failed to upload archived attachments {batch}: {e}")
+
+
+async def close_attachment_session():
+    """
+    Close the shared download session, if it was created.
+    """
+    if _session is not None:
+        await _session.close()
+
+
+async def _archive_attachment(attachment: discord.Attachment) -> Optional[str]:
+    """
+    Download an attachment into the archive directory, once a download slot is free.
+
+    Args:
+        attachment (discord.Attachment): The attachment to archive.
+
+    Returns:
+        Optional[str]: The archived path of the attachment, or None if it was not archived.
+
+    """
+    max_bytes = exports_config.export_attachment_max_bytes
+    if attachment.size > max_bytes:
+        console_logger.warning(f"⚠️ Attachment {attachment.filename} is larger than {max_bytes} bytes, not archiving.")
+        return None
+
+    directory = exports_config.export_attachment_directory
+    os.makedirs(directory, exist_ok=True)
+    partial_path = os.path.join(directory, f".{uuid.uuid4().hex}.part")
+    try:
+        async with _download_semaphore:
+            digest = await _download(attachment.url, partial_path, max_bytes)
+        if digest is None:
+            console_logger.warning(f"⚠️ Attachment {attachment.filename} exceeded {max_bytes} bytes, not archiving.")
+            return None
+
+        _, extension = os.path.splitext(attachment.filename)
+        path = os.path.join(directory, digest[:2], digest + extension.lower())
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # the same content is only stored once
+        if not os.path.exists(path):
+            os.replace(partial_path, path)
+        return path
+    except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as e:
+        console_logger.error(f"❌ Failed to archive attachment {attachment.filename}: {e}")
+        return None
+    finally:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+
+
+async def _download(url: str, file_path: str, max_bytes: int) -> Optional[str]:
+    """
+    Download a file, hashing it as it is written.
+
+    Args:
+        url (str): The URL of the file.
+        file_path (str): The path to write the file to.
+        max_bytes (int): The maximum size of the file in bytes.
+
+    Returns:
+        Optional[str]: The SHA-256 of the file as a hex string, or None if the file is larger than the maximum size.
+
+    """
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=300))
+
+    sha256 = hashlib.sha256()
+    size = 0
+    async with _session.get(url) as response:
+        response.raise_for_status()
+        async with aiofiles.open(file_path, mode="wb") as file:
+            async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if size > max_bytes:
+                    return None
+                sha256.update(chunk)
+                await file.write(chunk)
+    return sha256.hexdigest()
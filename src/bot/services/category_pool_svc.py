@@ -0,0 +1,286 @@
+"""
+Category pool service module for spreading channels over overflow categories.
+
+Discord allows at most 50 channels per category. This module treats each
+configured ticket category as a pool made of the category itself and its
+overflow categories (named like the category, followed by the overflow
+number, e.g. 'Support Tickets (2)'). New channels are placed in the least
+full category of the pool, and an overflow category with the same permissions
+is created when every category is full. The channels in each category are
+kept up to date from gateway events, and channels created through the pool are
+recorded right away, so the pool never lags behind its own creations.
+"""
+
+import asyncio
+import re
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional, Set
+
+import discord
+from discord.ext import commands
+
+from bot.utils.console_logger import console_logger
+
+# the maximum number of channels in a category
+CATEGORY_CHANNEL_LIMIT = 50
+
+# categories in each pool, keyed by the configured category id (listed first)
+_pools: Dict[int, List[int]] = {}
+
+# ids of the channels in each pooled category (sets, so a channel recorded both on creation and
+# from its gateway event is only counted once)
+_category_channels: Dict[int, Set[int]] = {}
+
+# number of channels being created in each pooled category
+_reserved_counts: Dict[int, int] = {}
+
+_pool_locks: Dict[int, asyncio.Lock] = {}
+
+
+def setup_category_pool(bot: commands.Bot):
+    """
+    Register the listeners that keep the channel counts of pooled categories up to date.
+
+    Args:
+        bot (commands.Bot): The bot to register the listeners on.
+
+    """
+
+    @bot.listen("on_guild_channel_create")
+    async def on_pooled_channel_create(channel: discord.abc.GuildChannel):
+        """
+        Count a channel created in a pooled category.
+
+        Args:
+            channel (discord.abc.GuildChannel): The created channel.
+
+        """
+        _add_channel(channel.category_id, channel.id)
+
+    @bot.listen("on_guild_channel_delete")
+    async def on_pooled_channel_delete(channel: discord.abc.GuildChannel):
+        """
+        Uncount a channel deleted from a pooled category, or drop a deleted pooled category.
+
+        Args:
+            channel (discord.abc.GuildChannel): The deleted channel.
+
+        """
+        _discard_channel(channel.category_id, channel.id)
+        if channel.id in _category_channels:
+            _remove_category(channel.id)
+
+    @bot.listen("on_guild_channel_update")
+    async def on_pooled_channel_update(before: discord.abc.GuildChannel, after: discord.abc.GuildChannel):
+        """
+        Move the count of a channel that was moved between categories.
+
+        Args:
+            before (discord.abc.GuildChannel): The channel before the update.
+            after (discord.abc.GuildChannel): The channel after the update.
+
+        """
+        if before.category_id != after.category_id:
+            _discard_channel(before.category_id, before.id)
+            _add_channel(after.category_id, after.id)
+
+
+@asynccontextmanager
+async def reserve_category(
+    bot: commands.Bot, guild: discord.Guild, category_id: int
+) -> AsyncIterator[Optional[discord.CategoryChannel]]:
+    """
+    Reserve a place for a new channel in the least full category of a pool.
+
+    The place stays reserved until the context exits, so concurrent channel
+    creations do not overfill a category. A channel created in the category must
+    be recorded with `record_pooled_channel` before the context exits, so it is
+    counted even if its gateway event has not arrived yet.
+
+    Args:
+        bot (commands.Bot): The bot instance.
+        guild (discord.Guild): The guild of the category.
+        category_id (int): The ID of the configured category of the pool.
+
+    Yields:
+        Optional[discord.CategoryChannel]: The category to create the channel in, or None if there is none.
+
+    """
+    category = await _pick_category(bot, guild, category_id)
+    try:
+        yield category
+    finally:
+        if category is not None:
+            _reserved_counts[category.id] -= 1
+
+
+def record_pooled_channel(channel: discord.abc.GuildChannel):
+    """
+    Count a channel just created in a pooled category, ahead of its gateway event.
+
+    Args:
+        channel (discord.abc.GuildChannel): The created channel.
+
+    """
+    _add_channel(channel.category_id, channel.id)
+
+
+async def _pick_category(
+    bot: commands.Bot, guild: discord.Guild, category_id: int
+) -> Optional[discord.CategoryChannel]:
+    """
+    Pick the least full category of a pool and reserve a place in it.
+
+    Args:
+        bot (commands.Bot): The bot instance.
+        guild (discord.Guild): The guild of the category.
+        category_id (int): The ID of the configured category of the pool.
+
+    Returns:
+        Optional[discord.CategoryChannel]: The category, or None if the pool has no usable category.
+
+    """
+    base_category = await _get_category(bot, guild, category_id)
+    if base_category is None:
+        return None
+
+    async with _pool_locks.setdefault(category_id, asyncio.Lock()):
+        if category_id not in _pools:
+            _build_pool(guild, base_category)
+
+        loads = {
+            pooled_id: len(_category_channels[pooled_id]) + _reserved_counts[pooled_id]
+            for pooled_id in _pools[category_id]
+        }
+        pooled_id = min(loads, key=loads.get)
+        if loads[pooled_id] < CATEGORY_CHANNEL_LIMIT:
+            category = guild.get_channel(pooled_id)
+        else:
+            category = await _create_overflow_category(guild, base_category)
+        if category is None:
+            return None
+
+        _reserved_counts[category.id] += 1
+        return category
+
+
+def _build_pool(guild: discord.Guild, base_category: discord.CategoryChannel):
+    """
+    Build the pool of a configured category from its existing overflow categories.
+
+    Args:
+        guild (discord.Guild): The guild of the category.
+        base_category (discord.CategoryChannel): The configured category.
+
+    """
+    overflow_name = re.compile(re.escape(base_category.name) + r" \((\d+)\)")
+    pool = [base_category] + [category for category in guild.categories if overflow_name.fullmatch(category.name)]
+
+    _pools[base_category.id] = [category.id for category in pool]
+    for category in pool:
+        _category_channels[category.id] = {channel.id for channel in category.channels}
+        _reserved_counts.setdefault(category.id, 0)
+
+
+async def _create_overflow_category(
+    guild: discord.Guild, base_category: discord.CategoryChannel
+) -> Optional[discord.CategoryChannel]:
+    """
+    Create an overflow category with the same permissions as the configured category.
+
+    Args:
+        guild (discord.Guild): The guild of the category.
+        base_category (discord.CategoryChannel): The configured category.
+
+    Returns:
+        Optional[discord.CategoryChannel]: The overflow category, or None on failure.
+
+    """
+    pool = _pools[base_category.id]
+    existing_names = {category.name for category in guild.categories}
+    overflow_number = len(pool) + 1
+    while f"{base_category.name} ({overflow_number})" in existing_names:
+        overflow_number += 1
+    name = f"{base_category.name} ({overflow_number})"
+    last_category = guild.get_channel(pool[-1]) or base_category
+    try:
+        category = await guild.create_category(
+            name=name, overwrites=base_category.overwrites, position=last_category.position + 1
+        )
+    except discord.HTTPException as e:
+        console_logger.error(f"❌ Error creating overflow category {name}: {e}")
+        return None
+
+    pool.append(category.id)
+    _category_channels[category.id] = set()
+    _reserved_counts[category.id] = 0
+    console_logger.info(f"✅ Created overflow category {name} for full category {base_category.name}")
+    return category
+
+
+async def _get_category(bot: commands.Bot, guild: discord.Guild, category_id: int) -> Optional[discord.CategoryChannel]:
+    """
+    Fetch a category channel by its ID.
+
+    Args:
+        bot (commands.Bot): The bot instance.
+        guild (discord.Guild): The guild of the category.
+        category_id (int): The ID of the category.
+
+    Returns:
+        Optional[discord.CategoryChannel]: The category channel, or None if not found or invalid.
+
+    """
+    category = guild.get_channel(category_id)
+    if category is None:
+        try:
+            category = await bot.fetch_channel(category_id)
+        except Exception:
+            return None
+    if not isinstance(category, discord.CategoryChannel):
+        return None
+    return category
+
+
+def _add_channel(category_id: Optional[int], channel_id: int):
+    """
+    Count a channel in a category if it is pooled.
+
+    Args:
+        category_id (Optional[int]): The ID of the category, if any.
+        channel_id (int): The ID of the channel.
+
+    """
+    if category_id in _category_channels:
+        _category_channels[category_id].add(channel_id)
+
+
+def _discard_channel(category_id: Optional[int], channel_id: int):
+    """
+    Uncount a channel from a category if it is pooled.
+
+    Args:
+        category_id (Optional[int]): The ID of the category, if any.
+        channel_id (int): The ID of the channel.
+
+    """
+    if category_id in _category_channels:
+        _category_channels[category_id].discard(channel_id)
+
+
+def _remove_category(category_id: int):
+    """
+    Remove a deleted category from its pool.
+
+    Args:
+        category_id (int): The ID of the deleted category.
+
+    """
+    for base_category_id, pool in list(_pools.items()):
+        if category_id == base_category_id:
+            # rebuilt from the guild on the next use, in case the configured category is recreated
+            for pooled_id in _pools.pop(base_category_id):
+                _category_channels.pop(pooled_id, None)
+        elif category_id in pool:
+            pool.remove(category_id)
+            _category_channels.pop(category_id, None)
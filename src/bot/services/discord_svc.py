@@ -8,15 +8,27 @@ permission overwrites for roles and members in dynamically generated
 channels.
 """
 
+import asyncio
+import os
+import uuid
 from typing import Any, Dict, List, Optional, Union
 
 import aiofiles
 import discord
 from discord.ext import commands
 
+from bot.config.exports import exports_config
+from bot.services.attachment_archive_svc import archive_attachments, archived_note, send_archived_attachments
+from bot.services.category_pool_svc import record_pooled_channel, reserve_category
 from bot.utils.console_logger import console_logger
 
 
+class TransientChannelError(Exception):
+    """
+    Raised when a channel could not be created because of a transient Discord error, so it can be retried.
+    """
+
+
 async def create_channel(
     bot: commands.Bot,
     ctx_or_interaction: Union[commands.Context, discord.Interaction],
@@ -27,6 +39,8 @@ async def create_channel(
     """
     Create a new text channel in the specified category.
 
+    The category is treated as a pool: the channel is placed in the least full of
+    the category and its overflow categories, which are created as needed.
     Optionally makes the channel private by restricting access to @everyone.
 
     Args:
@@ -39,18 +53,47 @@ async def create_channel(
     Returns:
         Optional[discord.TextChannel]: The created channel, or None on failure.
 
+    Raises:
+        TransientChannelError: If the channel could not be created because of a rate limit, or because
+            of a Discord server error or a timeout and it was confirmed not to exist.
+
     """
     guild = ctx_or_interaction.guild
-    category = await _get_category(bot, ctx_or_interaction, category_id)
-    if not category:
-        return None
+    async with reserve_category(bot, guild, category_id) as category:
+        if not category:
+            return None
 
-    bot_member = guild.get_member(bot.user.id)
-    if not category.permissions_for(bot_member).manage_channels:
-        return None
+        bot_member = guild.get_member(bot.user.id)
+        if not category.permissions_for(bot_member).manage_channels:
+            return None
+
+        try:
+            channel = await guild.create_text_channel(name=base_name, category=category)
+        except (discord.HTTPException, asyncio.TimeoutError) as e:
+            console_logger.error(f"❌ Error creating channel: {str(e)}")
+            if isinstance(e, discord.HTTPException) and e.status == 429:
+                # rate limited requests are never applied, so they are safe to retry
+                raise TransientChannelError(str(e)) from e
+            if isinstance(e, discord.HTTPException) and e.status < 500:
+                return None
+            # the channel may have been created despite a timeout or server error
+            try:
+                channel = await _find_created_channel(guild, base_name)
+            except (discord.HTTPException, asyncio.TimeoutError) as lookup_error:
+                # retrying could open a duplicate channel
+                console_logger.error(f"❌ Could not check whether channel {base_name} was created: {lookup_error}")
+                return None
+            if channel is None:
+                raise TransientChannelError(str(e)) from e
+            console_logger.info(f"ℹ️ Channel {channel.name} was created despite the error, using it.")
+        except Exception as e:
+            console_logger.error(f"❌ Error creating channel: {str(e)}")
+            return None
+
+        # count the channel before its reservation is released, its gateway event may arrive later
+        record_pooled_channel(channel)
 
     try:
-        channel = await guild.create_text_channel(name=base_name, category=category)
         if private:
             await set_role_channel_permissions(
                 channel,
@@ -68,6 +111,78 @@ async def create_channel(
         return None
 
 
+async def _find_created_channel(guild: discord.Guild, name: str) -> Optional[discord.TextChannel]:
+    """
+    Look up a text channel by name from Discord, after its creation may have failed.
+
+    Args:
+        guild (discord.Guild): The guild of the channel.
+        name (str): The name the channel was created with.
+
+    Returns:
+        Optional[discord.TextChannel]: The channel, or None if it does not exist.
+
+    """
+    for channel in await guild.fetch_channels():
+        if isinstance(channel, discord.TextChannel) and channel.name == name:
+            return channel
+    return None
+
+
+async def respond_to_interaction(
+    interaction: discord.Interaction, content: Optional[str] = None, **kwargs: Any
+) -> Optional[discord.Message]:
+    """
+    Respond to an interaction, using a followup if it was already responded to.
+
+    Interactions may have been deferred by the interaction router while their
+    handler was still running, in which case the response is sent as a followup.
+
+    Args:
+        interaction (discord.Interaction): The interaction to respond to.
+        content (Optional[str]): The message content.
+        **kwargs (Any): Other arguments for the message (e.g. embed, view, ephemeral).
+
+    Returns:
+        Optional[discord.Message]: The followup message, or None if sent as the initial response.
+
+    Raises:
+        discord.HTTPException: If sending the initial response fails for another reason.
+
+    """
+    if not interaction.response.is_done():
+        try:
+            await interaction.response.send_message(content, **kwargs)
+            return None
+        except discord.InteractionResponded:
+            pass
+        except discord.HTTPException as e:
+            # 40060: the interaction was acknowledged concurrently (e.g. deferred by the router)
+            if e.code != 40060:
+                raise
+    return await interaction.followup.send(content, **kwargs)
+
+
+async def send_response(
+    ctx_or_interaction: Union[commands.Context, discord.Interaction], content: str, **kwargs: Any
+) -> Optional[discord.Message]:
+    """
+    Send a message in response to a command context or an interaction.
+
+    Args:
+        ctx_or_interaction (Union[commands.Context, discord.Interaction]): The context or interaction.
+        content (str): The message content.
+        **kwargs (Any): Other arguments for the message (e.g. ephemeral).
+
+    Returns:
+        Optional[discord.Message]: The sent message, or None if sent as the initial interaction response.
+
+    """
+    if isinstance(ctx_or_interaction, commands.Context):
+        return await ctx_or_interaction.send(content, **kwargs)
+    return await respond_to_interaction(ctx_or_interaction, content, **kwargs)
+
+
 async def delete_channel(
     bot: commands.Bot,
     guild: discord.Guild,
@@ -171,7 +286,8 @@ async def export_channel_contents(
     target_channel_id: int,
     download_channel_id: int,
     include_asset_urls: Optional[bool] = True,
-) -> None:
+    messages: Optional[List[str]] = None,
+) -> bool:
     """
     Export and send the message history of a channel as a text file.
 
@@ -180,6 +296,11 @@ async def export_channel_contents(
         target_channel_id (int): The ID of the channel to export.
         download_channel_id (int): The ID of the channel to send the file in.
         include_asset_urls (Optional[bool]): Whether to include URLs for attachments and embeds.
+        messages (Optional[List[str]]): Already formatted messages (e.g. from the transcript journal)
+            to export instead of reading the channel history.
+
+    Returns:
+        bool: True if the channel was exported (or had no messages), False otherwise.
 
     """
     target_channel = bot.get_channel(target_channel_id)
@@ -187,84 +308,116 @@ async def export_channel_contents(
 
     if not target_channel or not download_channel:
         console_logger.error("❌ Invalid target or download channel ID provided.")
-        return
+        return False
 
-    messages = []
     try:
-        async for message in target_channel.history(limit=None, oldest_first=True):
-            msg_text = f"[{message.created_at}] {message.author.display_name}: {message.content}"
-
-            if message.attachments and include_asset_urls:
-                attachment_urls = [f"\n- Attachment: {a.url}" for a in message.attachments]
-                msg_text += "\n" + "\n".join(attachment_urls)
-
-            if message.embeds and include_asset_urls:
-                for i, embed in enumerate(message.embeds):
-                    msg_text += f"\n- Embed {i + 1}:"
-                    if embed.title:
-                        msg_text += f"\n  Title: {embed.title}"
-                    if embed.description:
-                        msg_text += f"\n  Description: {embed.description}"
-                    for field in embed.fields:
-                        msg_text += f"\n  Field - {field.name}: {field.value}"
-                    if embed.image:
-                        msg_text += f"\n  Image: {embed.image.url}"
-                    if embed.thumbnail:
-                        msg_text += f"\n  Thumbnail: {embed.thumbnail.url}"
-
-            messages.append(msg_text)
+        if messages is None:
+            history = [message async for message in target_channel.history(limit=None, oldest_first=True)]
+            archived_paths = (
+                await archive_attachments(a for message in history for a in message.attachments)
+                if include_asset_urls
+                else {}
+            )
+            messages = [format_export_message(message, include_asset_urls, archived_paths) for message in history]
 
         if not messages:
             await download_channel.send("ℹ️ No messages found in the target channel.")
-            return
+            return True
 
-        file_name = f"chat_history_{target_channel.name}.txt"
-        async with aiofiles.open(file_name, mode="w", encoding="utf-8") as file:
-            await file.write("\n\n".join(messages))
+        # written under a unique name in the export directory, and removed once sent
+        os.makedirs(exports_config.export_directory, exist_ok=True)
+        file_path = os.path.join(exports_config.export_directory, f".chat_history_{uuid.uuid4().hex}.txt")
+        try:
+            async with aiofiles.open(file_path, mode="w", encoding="utf-8") as file:
+                await file.write("\n\n".join(messages))
 
-        await download_channel.send(
-            f"📁 Here is the chat history of **#{target_channel.name}**:"
-            + (
-                "\n⚠️ **Note:** This log includes URLs to attachments and images. "
-                "Please download any important files now, as they will become inaccessible when the channel is deleted."
-                if include_asset_urls
-                else ""
-            ),
-            file=discord.File(file_name),
-        )
+            await download_channel.send(
+                export_file_caption(target_channel.name, include_asset_urls),
+                file=discord.File(file_path, filename=f"chat_history_{target_channel.name}.txt"),
+            )
+        finally:
+            if os.path.exists(file_path):
+                os.remove(file_path)
+        if include_asset_urls:
+            await send_archived_attachments(download_channel, messages)
 
         console_logger.info(f"✅ Successfully exported chat history from {target_channel.name}")
+        return True
 
     except discord.Forbidden:
         console_logger.error("🚫 Missing permissions to read messages or send files.")
     except Exception as e:
         console_logger.error(f"❌ Error exporting chat history: {e}")
 
+    return False
 
-async def _get_category(
-    bot: commands.Bot,
-    ctx: Union[commands.Context, discord.Interaction],
-    category_id: int,
-) -> Optional[discord.CategoryChannel]:
+
+def format_export_message(
+    message: discord.Message,
+    include_asset_urls: Optional[bool] = True,
+    archived_paths: Optional[Dict[int, str]] = None,
+) -> str:
     """
-    Fetch a category channel by its ID.
+    Format a message for a channel export.
 
     Args:
-        bot (commands.Bot): The bot instance.
-        ctx (Union[commands.Context, discord.Interaction]): The context or interaction object.
-        category_id (int): The ID of the category.
+        message (discord.Message): The message to format.
+        include_asset_urls (Optional[bool]): Whether to include URLs for attachments and embeds.
+        archived_paths (Optional[Dict[int, str]]): The archived paths of the message's attachments, by attachment ID.
 
     Returns:
-        Optional[discord.CategoryChannel]: The category channel, or None if not found or invalid.
+        str: The formatted message.
 
     """
-    guild = ctx.guild
-    category = guild.get_channel(category_id)
-    if category is None:
-        try:
-            category = await bot.fetch_channel(category_id)
-        except Exception:
-            return None
-    if not isinstance(category, discord.CategoryChannel):
-        return None
-    return category
+    msg_text = f"[{message.created_at}] {message.author.display_name}: {message.content}"
+
+    if message.attachments and include_asset_urls:
+        archived_paths = archived_paths or {}
+        attachment_urls = [
+            f"\n- Attachment: {a.url}" + (archived_note(archived_paths[a.id]) if a.id in archived_paths else "")
+            for a in message.attachments
+        ]
+        msg_text += "\n" + "\n".join(attachment_urls)
+
+    if message.embeds and include_asset_urls:
+        for i, embed in enumerate(message.embeds):
+            msg_text += f"\n- Embed {i + 1}:"
+            if embed.title:
+                msg_text += f"\n  Title: {embed.title}"
+            if embed.description:
+                msg_text += f"\n  Description: {embed.description}"
+            for field in embed.fields:
+                msg_text += f"\n  Field - {field.name}: {field.value}"
+            if embed.image:
+                msg_text += f"\n  Image: {embed.image.url}"
+            if embed.thumbnail:
+                msg_text += f"\n  Thumbnail: {embed.thumbnail.url}"
+
+    return msg_text
+
+
+def export_file_caption(channel_name: str, include_asset_urls: Optional[bool] = True) -> str:
+    """
+    Get the message sent along with a channel export file.
+
+    Args:
+        channel_name (str): The name of the exported channel.
+        include_asset_urls (Optional[bool]): Whether the export includes URLs for attachments and embeds.
+
+    Returns:
+        str: The message content.
+
+    """
+    if not include_asset_urls:
+        return f"📁 Here is the chat history of **#{channel_name}**:"
+    if exports_config.export_archive_attachments:
+        return (
+            f"📁 Here is the chat history of **#{channel_name}**:"
+            "\n📎 **Note:** Attachments are archived by the bot, at the path shown next to their URL. "
+            "Images in embeds are not archived and will become inaccessible when the channel is deleted."
+        )
+    return (
+        f"📁 Here is the chat history of **#{channel_name}**:"
+        "\n⚠️ **Note:** This log includes URLs to attachments and images. "
+        "Please download any important files now, as they will become inaccessible when the channel is deleted."
+    )
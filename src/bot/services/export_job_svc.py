@@ -0,0 +1,333 @@
+"""
+Export job service module for exporting channels in the background.
+
+This module runs exports of a channel's message history as background jobs
+instead of inside the interaction that requested them. Each job is recorded
+in the `export_jobs` table, shows its progress by editing a status message,
+and saves a checkpoint (the last exported message and the size of the export
+file) every few hundred messages, so a job interrupted by a restart resumes
+where it left off. The number of exports running at once is capped. Tickets
+recorded by the transcript journal are exported from the journal instead.
+Closing a ticket waits for the export of its channel to finish first.
+Attachments are archived in batches along with each checkpoint, and uploaded
+after the export file.
+"""
+
+import asyncio
+import os
+import time
+from typing import Dict, List, Optional, Set
+
+import aiofiles
+import discord
+from discord.ext import commands
+
+from bot.config.exports import exports_config
+from bot.database.mysql.export_jobs import (
+    EXPORT_STATUS_COMPLETED,
+    EXPORT_STATUS_FAILED,
+    EXPORT_STATUS_RUNNING,
+    ExportJob,
+    get_unfinished_export_jobs,
+    insert_export_job,
+    update_export_job,
+)
+from bot.services.attachment_archive_svc import archive_attachments, send_archived_attachments
+from bot.services.discord_svc import export_file_caption, format_export_message
+from bot.services.transcript_journal_svc import read_transcript
+from bot.utils.console_logger import console_logger
+from bot.utils.tracing import span
+
+# separator between messages in an export file
+MESSAGE_SEPARATOR = b"\n\n"
+
+_export_semaphore = asyncio.Semaphore(exports_config.export_max_concurrent)
+
+# events set when the export of each channel being exported finishes, by channel id
+_exporting_channels: Dict[int, asyncio.Event] = {}
+
+# references to running export tasks, so they are not garbage collected
+_export_tasks: Set[asyncio.Task] = set()
+
+
+def is_export_running(channel_id: int) -> bool:
+    """
+    Check if a channel is being exported.
+
+    Args:
+        channel_id (int): The Discord channel ID.
+
+    Returns:
+        bool: True if an export of the channel is queued or running, False otherwise.
+
+    """
+    return channel_id in _exporting_channels
+
+
+async def wait_for_export(channel_id: int):
+    """
+    Wait until the export of a channel, if any, has finished.
+
+    Args:
+        channel_id (int): The Discord channel ID.
+
+    """
+    finished = _exporting_channels.get(channel_id)
+    if finished is not None:
+        await finished.wait()
+
+
+async def start_export_job(
+    bot: commands.Bot,
+    channel: discord.TextChannel,
+    download_channel_id: int,
+    include_asset_urls: bool = True,
+) -> Optional[int]:
+    """
+    Start a background export of a channel.
+
+    Args:
+        bot (commands.Bot): The bot instance.
+        channel (discord.TextChannel): The channel to export.
+        download_channel_id (int): The ID of the channel to send the export and its progress in.
+        include_asset_urls (bool): Whether to include URLs for attachments and embeds. Defaults to True.
+
+    Returns:
+        Optional[int]: The ID of the job, or None if the channel is already being exported.
+
+    """
+    if is_export_running(channel.id):
+        return None
+
+    _exporting_channels[channel.id] = asyncio.Event()
+    started = False
+    try:
+        job = await insert_export_job(channel.id, download_channel_id, include_asset_urls)
+        download_channel = bot.get_channel(download_channel_id)
+        if download_channel:
+            status_message = await download_channel.send(f"⏳ Export #{job.id} of **#{channel.name}** is queued.")
+            job.status_message_id = status_message.id
+            await update_export_job(job.id, status_message_id=status_message.id)
+        _spawn(bot, job)
+        started = True
+    finally:
+        # the job releases the channel when it finishes, unless it could not be started
+        if not started:
+            _release(channel.id)
+
+    return job.id
+
+
+async def resume_export_jobs(bot: commands.Bot):
+    """
+    Resume the export jobs left unfinished, e.g. by a restart.
+
+    Args:
+        bot (commands.Bot): The bot instance.
+
+    """
+    resumed: List[ExportJob] = []
+    for job in await get_unfinished_export_jobs():
+        if is_export_running(job.channel_id):
+            continue
+        _exporting_channels[job.channel_id] = asyncio.Event()
+        _spawn(bot, job)
+        resumed.append(job)
+
+    if resumed:
+        console_logger.info(f"✅ Resumed {len(resumed)} unfinished export job(s).")
+
+
+def _spawn(bot: commands.Bot, job: ExportJob):
+    """
+    Run an export job in the background.
+
+    Args:
+        bot (commands.Bot): The bot instance.
+        job (ExportJob): The job to run.
+
+    """
+    task = asyncio.create_task(_run_export_job(bot, job))
+    _export_tasks.add(task)
+    task.add_done_callback(_export_tasks.discard)
+
+
+async def _run_export_job(bot: commands.Bot, job: ExportJob):
+    """
+    Run an export job once a slot is free, marking it failed if it raises.
+
+    Args:
+        bot (commands.Bot): The bot instance.
+        job (ExportJob): The job to run.
+
+    """
+    try:
+        async with _export_semaphore:
+            with span("export.run_job", job_id=job.id, channel_id=job.channel_id):
+                await _export(bot, job)
+    except Exception as e:
+        console_logger.error(f"❌ Export job #{job.id} failed: {e}")
+        await update_export_job(job.id, status=EXPORT_STATUS_FAILED)
+        await _set_status(bot, job, f"❌ Export #{job.id} failed, please try again.")
+    finally:
+        _release(job.channel_id)
+
+
+def _release(channel_id: int):
+    """
+    Mark the export of a channel as finished, waking up anything waiting for it.
+
+    Args:
+        channel_id (int): The Discord channel ID.
+
+    """
+    finished = _exporting_channels.pop(channel_id, None)
+    if finished is not None:
+        finished.set()
+
+
+async def _export(bot: commands.Bot, job: ExportJob):
+    """
+    Export the messages of a job's channel from its checkpoint and send the export file.
+
+    Args:
+        bot (commands.Bot): The bot instance.
+        job (ExportJob): The job to run.
+
+    """
+    channel = bot.get_channel(job.channel_id)
+    download_channel = bot.get_channel(job.download_channel_id)
+    if not channel or not download_channel:
+        console_logger.error(f"❌ Export job #{job.id} has an invalid target or download channel.")
+        await update_export_job(job.id, status=EXPORT_STATUS_FAILED)
+        return
+
+    os.makedirs(exports_config.export_directory, exist_ok=True)
+    file_path = os.path.join(exports_config.export_directory, f"export_{job.id}_{channel.name}.txt")
+
+    # the journal keeps messages with their asset urls, so exports without them read the channel history
+    journaled_messages = await read_transcript(job.channel_id) if job.include_asset_urls else None
+    if journaled_messages is not None:
+        job.file_offset, job.message_count = 0, len(journaled_messages)
+        async with aiofiles.open(file_path, mode="wb") as file:
+            await file.write(MESSAGE_SEPARATOR.join(text.encode("utf-8") for text in journaled_messages))
+        await _finish(bot, job, channel, download_channel, file_path)
+        return
+
+    # resume from the checkpoint, dropping anything written after it
+    if job.last_message_id and os.path.exists(file_path):
+        os.truncate(file_path, job.file_offset)
+    else:
+        job.last_message_id, job.file_offset, job.message_count = None, 0, 0
+        open(file_path, "wb").close()
+
+    await update_export_job(job.id, status=EXPORT_STATUS_RUNNING)
+    await _set_status(bot, job, f"⏳ Export #{job.id} of **#{channel.name}** is running...")
+
+    after = discord.Object(job.last_message_id) if job.last_message_id else None
+    pending_messages: List[discord.Message] = []
+    last_message_id = job.last_message_id
+    last_progress_at = time.monotonic()
+
+    async with aiofiles.open(file_path, mode="ab") as file:
+
+        async def checkpoint():
+            """
+            Append the pending messages to the export file and save the checkpoint.
+            """
+            archived_paths = (
+                await archive_attachments(a for message in pending_messages for a in message.attachments)
+                if job.include_asset_urls
+                else {}
+            )
+            chunk = MESSAGE_SEPARATOR.join(
+                format_export_message(message, job.include_asset_urls, archived_paths).encode("utf-8")
+                for message in pending_messages
+            )
+            if job.file_offset:
+                chunk = MESSAGE_SEPARATOR + chunk
+            await file.write(chunk)
+            await file.flush()
+
+            job.file_offset += len(chunk)
+            job.message_count += len(pending_messages)
+            job.last_message_id = last_message_id
+            pending_messages.clear()
+            await update_export_job(
+                job.id,
+                last_message_id=job.last_message_id,
+                file_offset=job.file_offset,
+                message_count=job.message_count,
+            )
+
+        async for message in channel.history(limit=None, after=after, oldest_first=True):
+            pending_messages.append(message)
+            last_message_id = message.id
+            if len(pending_messages) < exports_config.export_checkpoint_interval:
+                continue
+
+            await checkpoint()
+            if time.monotonic() - last_progress_at >= exports_config.export_progress_interval:
+                last_progress_at = time.monotonic()
+                await _set_status(
+                    bot, job, f"⏳ Export #{job.id} of **#{channel.name}**: {job.message_count} messages exported..."
+                )
+
+        if pending_messages:
+            await checkpoint()
+
+    await _finish(bot, job, channel, download_channel, file_path)
+
+
+async def _finish(
+    bot: commands.Bot,
+    job: ExportJob,
+    channel: discord.TextChannel,
+    download_channel: discord.TextChannel,
+    file_path: str,
+):
+    """
+    Send the export file of a job, with the attachments it archived, and mark the job completed.
+
+    Args:
+        bot (commands.Bot): The bot instance.
+        job (ExportJob): The job.
+        channel (discord.TextChannel): The exported channel.
+        download_channel (discord.TextChannel): The channel to send the export file in.
+        file_path (str): The path of the export file.
+
+    """
+    if job.message_count:
+        await download_channel.send(
+            export_file_caption(channel.name, job.include_asset_urls), file=discord.File(file_path)
+        )
+        if job.include_asset_urls:
+            async with aiofiles.open(file_path, mode="r", encoding="utf-8") as file:
+                await send_archived_attachments(download_channel, [await file.read()])
+        await _set_status(bot, job, f"✅ Export #{job.id} of **#{channel.name}** is complete.")
+    else:
+        await _set_status(bot, job, "ℹ️ No messages found in the target channel.")
+
+    await update_export_job(job.id, status=EXPORT_STATUS_COMPLETED)
+    os.remove(file_path)
+    console_logger.info(f"✅ Successfully exported chat history from {channel.name} (job #{job.id})")
+
+
+async def _set_status(bot: commands.Bot, job: ExportJob, content: str):
+    """
+    Show the status of an export job by editing its status message.
+
+    Args:
+        bot (commands.Bot): The bot instance.
+        job (ExportJob): The job.
+        content (str): The status to show.
+
+    """
+    download_channel = bot.get_channel(job.download_channel_id)
+    if not download_channel or not job.status_message_id:
+        return
+    try:
+        await download_channel.get_partial_message(job.status_message_id).edit(content=content)
+    except discord.HTTPException:
+        # the status message may have been deleted, which should not fail the export
+        pass
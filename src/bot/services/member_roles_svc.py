@@ -0,0 +1,134 @@
+"""
+Member roles service module for resolving admin and sponsor roles in one pass.
+
+This module precomputes an index of the configured recurring sponsor role IDs
+to their tier rank, so the roles of a member are resolved with a single pass
+over the member's roles instead of one lookup per tier. The result holds the
+member's recurring sponsor tiers sorted from highest to lowest along with the
+admin flag, and can optionally be cached per member until their roles change.
+"""
+
+from typing import Dict, List, NamedTuple, Tuple
+
+import discord
+from discord.ext import commands
+
+from bot.config.common import common_config
+
+
+class MemberRoles(NamedTuple):
+    """
+    The admin and sponsor roles of a member.
+
+    Attributes:
+        recurring_sponsor_tiers (List[str]): The recurring sponsor tiers of the member, highest first.
+        is_admin (bool): Whether the member has the admin role.
+
+    """
+
+    recurring_sponsor_tiers: List[str]
+    is_admin: bool
+
+
+# recurring sponsor role id -> (rank, tier), tiers are configured from lowest to highest
+RECURRING_SPONSOR_TIER_RANKS: Dict[int, Tuple[int, str]] = {
+    tier.role_id: (rank, tier_name)
+    for rank, (tier_name, tier) in enumerate(common_config.recurring_sponsor_tiers.items())
+}
+
+# resolved roles keyed by (guild id, member id), only filled if the cache is enabled
+_member_roles_cache: Dict[Tuple[int, int], MemberRoles] = {}
+
+
+def resolve_member_roles(member: discord.Member) -> MemberRoles:
+    """
+    Resolve the recurring sponsor tiers and admin flag of a member.
+
+    Args:
+        member (discord.Member): The member to resolve.
+
+    Returns:
+        MemberRoles: The sponsor tiers (highest first) and admin flag of the member.
+
+    """
+    key = (member.guild.id, member.id)
+    if common_config.member_roles_cache_enabled:
+        cached = _member_roles_cache.get(key)
+        if cached is not None:
+            return cached
+
+    is_admin = False
+    ranked_tiers = []
+    for role in member.roles:
+        if role.id == common_config.admin_role_id:
+            is_admin = True
+        ranked_tier = RECURRING_SPONSOR_TIER_RANKS.get(role.id)
+        if ranked_tier:
+            ranked_tiers.append(ranked_tier)
+
+    ranked_tiers.sort(reverse=True)
+    member_roles = MemberRoles([tier_name for _, tier_name in ranked_tiers], is_admin)
+
+    if common_config.member_roles_cache_enabled:
+        _member_roles_cache[key] = member_roles
+    return member_roles
+
+
+def invalidate_member_roles(member: discord.Member):
+    """
+    Drop the cached roles of a member.
+
+    Args:
+        member (discord.Member): The member whose roles changed.
+
+    """
+    _member_roles_cache.pop((member.guild.id, member.id), None)
+
+
+def setup_member_roles_cache(bot: commands.Bot):
+    """
+    Register the listeners that keep the member roles cache up to date.
+
+    Does nothing if the cache is disabled.
+
+    Args:
+        bot (commands.Bot): The bot to register the listeners on.
+
+    """
+    if not common_config.member_roles_cache_enabled:
+        return
+
+    @bot.listen("on_member_update")
+    async def on_member_roles_update(before: discord.Member, after: discord.Member):
+        """
+        Drop the cached roles of a member whose roles changed.
+
+        Args:
+            before (discord.Member): The member before the update.
+            after (discord.Member): The member after the update.
+
+        """
+        if before.roles != after.roles:
+            invalidate_member_roles(after)
+
+    @bot.listen("on_member_remove")
+    async def on_member_roles_remove(member: discord.Member):
+        """
+        Drop the cached roles of a member who left the server.
+
+        Args:
+            member (discord.Member): The member who left.
+
+        """
+        invalidate_member_roles(member)
+
+    @bot.listen("on_guild_role_delete")
+    async def on_member_roles_role_delete(role: discord.Role):
+        """
+        Clear the cache when a role is deleted, since members lose it without an update event.
+
+        Args:
+            role (discord.Role): The deleted role.
+
+        """
+        _member_roles_cache.clear()
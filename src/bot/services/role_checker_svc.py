@@ -8,7 +8,7 @@ uses configured role IDs from the bot's settings to perform the checks.
 
 import discord
 
-from bot.config.common import common_config
+from bot.services.member_roles_svc import resolve_member_roles
 
 
 def is_admin_user(member: discord.Member) -> bool:
@@ -22,16 +22,14 @@ def is_admin_user(member: discord.Member) -> bool:
         bool: True if the user has the admin role, False otherwise.
 
     """
-    user_roles = {role.id for role in member.roles}
-    return common_config.admin_role_id in user_roles
+    return resolve_member_roles(member).is_admin
 
 
 def is_recurring_sponsor_user(member: discord.Member) -> bool:
     """
     Check if a user has any recurring sponsor role.
 
-    Iterates through all configured recurring sponsor tiers and checks
-    if the member has a matching role.
+    Looks up the member's roles in the precomputed sponsor role index.
 
     Args:
         member (discord.Member): The member to check.
@@ -40,10 +38,4 @@ def is_recurring_sponsor_user(member: discord.Member) -> bool:
         bool: True if the user has a recurring sponsor role, False otherwise.
 
     """
-    user_roles = {role.id for role in member.roles}
-
-    for tier in common_config.recurring_sponsor_tiers.values():
-        if tier.role_id in user_roles:
-            return True
-
-    return False
+    return bool(resolve_member_roles(member).recurring_sponsor_tiers)
@@ -0,0 +1,358 @@
+"""
+Ticket creation service module for creating tickets once and at a bounded rate.
+
+This module coordinates ticket creation across the support, sponsor and
+report ticket flows. Creations are tracked per member and ticket type while
+they are in flight, so a repeated click (e.g. a double-click on a ticket
+button) waits for the ticket already being created and points the member to
+its channel instead of using up another ticket number and channel.
+
+To stay within Discord's channel creation limits during bursts, tickets are
+created by a small pool of workers from a bounded queue, paced by a global
+token bucket, and each member can only create a few tickets in a short time.
+Members waiting in the queue are told their position, creations that fail with
+a transient Discord error are retried with exponential backoff (reusing the
+ticket number reserved for them), and members are told if their ticket could
+not be created in the end.
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+import discord
+from discord.ext import commands
+
+from bot.config.ticket_creation import ticket_creation_config
+from bot.database.mysql.ticket_counter import get_next_ticket_number
+from bot.services.discord_svc import TransientChannelError, send_response
+from bot.services.ticket_registry_svc import find_open_ticket
+from bot.utils.console_logger import console_logger
+
+# channels of the tickets being created, keyed by (member id, ticket type)
+_in_flight: Dict[Tuple[int, str], "asyncio.Future[Optional[discord.abc.GuildChannel]]"] = {}
+
+
+class TokenBucket:
+    """
+    Token bucket rate limiter.
+
+    Attributes:
+        capacity (float): The maximum number of tokens, i.e. the burst size.
+        refill_rate (float): The number of tokens added per second.
+
+    """
+
+    def __init__(self, capacity: float, refill_rate: float):
+        """
+        Initialize a full TokenBucket.
+
+        Args:
+            capacity (float): The maximum number of tokens, i.e. the burst size.
+            refill_rate (float): The number of tokens added per second.
+
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+
+    @property
+    def is_full(self) -> bool:
+        """
+        Check if the bucket has refilled completely.
+
+        Returns:
+            bool: True if the bucket is full, False otherwise.
+
+        """
+        self._refill()
+        return self._tokens >= self.capacity
+
+    def try_acquire(self) -> bool:
+        """
+        Take a token if one is available.
+
+        Returns:
+            bool: True if a token was taken, False otherwise.
+
+        """
+        self._refill()
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def time_until_available(self) -> float:
+        """
+        Get the number of seconds until a token is available.
+
+        Returns:
+            float: The seconds to wait, 0 if a token is available now.
+
+        """
+        self._refill()
+        return max(1 - self._tokens, 0) / self.refill_rate
+
+    async def acquire(self):
+        """
+        Take a token, waiting until one is available.
+        """
+        while not self.try_acquire():
+            await asyncio.sleep(self.time_until_available())
+
+    def _refill(self):
+        """
+        Add the tokens accumulated since the last refill.
+        """
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.refill_rate)
+        self._updated_at = now
+
+
+class TicketCreationQueue:
+    """
+    Bounded queue of ticket creations processed by a pool of workers.
+
+    Attributes:
+        workers (int): The number of tickets created concurrently.
+        rate_limiter (TokenBucket): Paces ticket creations across all users.
+
+    """
+
+    def __init__(self, workers: int, max_size: int, rate_limiter: TokenBucket):
+        """
+        Initialize the TicketCreationQueue.
+
+        Workers are started on the first submission, since they need a running event loop.
+
+        Args:
+            workers (int): The number of tickets created concurrently.
+            max_size (int): The maximum number of tickets waiting to be created.
+            rate_limiter (TokenBucket): Paces ticket creations across all users.
+
+        """
+        self.workers = workers
+        self.rate_limiter = rate_limiter
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_size)
+        self._worker_tasks: List[asyncio.Task] = []
+        self._busy = 0
+
+    @property
+    def is_full(self) -> bool:
+        """
+        Check if no more ticket creations can be queued.
+
+        Returns:
+            bool: True if the queue is full, False otherwise.
+
+        """
+        return self._queue.full()
+
+    async def submit(
+        self,
+        ctx_or_interaction: Union[commands.Context, discord.Interaction],
+        ticket_type: str,
+        ticket_label: str,
+        create: Callable[[int], Awaitable[Optional[discord.TextChannel]]],
+    ) -> Optional[discord.TextChannel]:
+        """
+        Queue a ticket creation and wait for its channel.
+
+        The member is told their position if the creation cannot start right away.
+        Callers should check `is_full` first.
+
+        Args:
+            ctx_or_interaction (Union[commands.Context, discord.Interaction]): The context or interaction.
+            ticket_type (str): The type of ticket (e.g., 'support_tickets').
+            ticket_label (str): The name of the ticket shown to the member (e.g., 'support ticket').
+            create (Callable[[int], Awaitable[Optional[discord.TextChannel]]]): Creates the ticket with the given
+                number and returns its channel.
+
+        Returns:
+            Optional[discord.TextChannel]: The ticket channel, or None if it could not be created.
+
+        """
+        if not self._worker_tasks:
+            self._worker_tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+        # creations ahead of this one that are not picked up by an idle worker
+        position = self._queue.qsize() + 1 - (self.workers - self._busy)
+        future: "asyncio.Future[Optional[discord.TextChannel]]" = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((ticket_type, create, future))
+
+        if position > 0:
+            await send_response(
+                ctx_or_interaction,
+                f"⏳ You're #{position} in the queue, your {ticket_label} will be created shortly.",
+                ephemeral=True,
+            )
+
+        return await future
+
+    async def _worker(self):
+        """
+        Create queued tickets one at a time, paced by the rate limiter.
+        """
+        while True:
+            ticket_type, create, future = await self._queue.get()
+            self._busy += 1
+            try:
+                await self.rate_limiter.acquire()
+                channel = await self._create_with_retries(ticket_type, create)
+                if not future.done():
+                    future.set_result(channel)
+            except Exception as e:
+                console_logger.error(f"❌ Error creating ticket: {e}")
+                if not future.done():
+                    future.set_result(None)
+            finally:
+                self._busy -= 1
+                self._queue.task_done()
+
+    async def _create_with_retries(
+        self, ticket_type: str, create: Callable[[int], Awaitable[Optional[discord.TextChannel]]]
+    ) -> Optional[discord.TextChannel]:
+        """
+        Create a ticket, retrying with exponential backoff if its channel hit a transient error.
+
+        The ticket number is reserved once and reused by every attempt, so failed attempts
+        do not use up ticket numbers. Permanent failures (e.g. missing permissions or a
+        missing category) are not retried, and neither are other exceptions, since the
+        channel may already have been created.
+
+        Args:
+            ticket_type (str): The type of ticket (e.g., 'support_tickets').
+            create (Callable[[int], Awaitable[Optional[discord.TextChannel]]]): Creates the ticket with the given
+                number and returns its channel.
+
+        Returns:
+            Optional[discord.TextChannel]: The ticket channel, or None if all attempts failed.
+
+        """
+        ticket_number = await get_next_ticket_number(ticket_type)
+        max_retries = ticket_creation_config.ticket_creation_max_retries
+        for attempt in range(max_retries + 1):
+            try:
+                return await create(ticket_number)
+            except TransientChannelError:
+                if attempt == max_retries:
+                    break
+            delay = ticket_creation_config.ticket_creation_retry_backoff * 2**attempt
+            console_logger.warning(f"⏱️ Ticket creation hit a transient error, retrying in {delay:.0f}s.")
+            await asyncio.sleep(delay)
+            await self.rate_limiter.acquire()
+        return None
+
+
+ticket_creation_queue = TicketCreationQueue(
+    ticket_creation_config.ticket_creation_workers,
+    ticket_creation_config.ticket_creation_queue_size,
+    TokenBucket(ticket_creation_config.ticket_creation_burst, ticket_creation_config.ticket_creation_rate),
+)
+
+# per-user rate limiters, keyed by member id
+_user_rate_limiters: Dict[int, TokenBucket] = {}
+
+
+def _get_user_rate_limiter(user_id: int) -> TokenBucket:
+    """
+    Get the rate limiter of a member, dropping those of members who have fully recovered.
+
+    Args:
+        user_id (int): The Discord user ID of the member.
+
+    Returns:
+        TokenBucket: The rate limiter of the member.
+
+    """
+    rate_limiter = _user_rate_limiters.get(user_id)
+    if rate_limiter is None:
+        for other_user_id in [other for other, bucket in _user_rate_limiters.items() if bucket.is_full]:
+            del _user_rate_limiters[other_user_id]
+        rate_limiter = TokenBucket(
+            ticket_creation_config.ticket_creation_user_burst,
+            1 / ticket_creation_config.ticket_creation_user_interval,
+        )
+        _user_rate_limiters[user_id] = rate_limiter
+    return rate_limiter
+
+
+async def create_ticket_once(
+    user: discord.Member,
+    ctx_or_interaction: Union[commands.Context, discord.Interaction],
+    ticket_type: str,
+    ticket_label: str,
+    create: Callable[[int], Awaitable[Optional[discord.TextChannel]]],
+) -> bool:
+    """
+    Create a ticket unless the member already has one open or being created.
+
+    Args:
+        user (discord.Member): The member creating the ticket.
+        ctx_or_interaction (Union[commands.Context, discord.Interaction]): The context or interaction.
+        ticket_type (str): The type of ticket (e.g., 'support_tickets').
+        ticket_label (str): The name of the ticket shown to the member (e.g., 'support ticket').
+        create (Callable[[int], Awaitable[Optional[discord.TextChannel]]]): Creates the ticket with the given
+            number and returns its channel.
+
+    Returns:
+        bool: True if a ticket was created by this call, False otherwise.
+
+    """
+    key = (user.id, ticket_type)
+    in_flight = _in_flight.get(key)
+    if in_flight is not None:
+        # shield the shared creation so a cancelled repeat does not cancel it for the original
+        channel = await asyncio.shield(in_flight)
+        if channel is not None:
+            await send_response(
+                ctx_or_interaction,
+                f"ℹ️ Your {ticket_label} has already been created: {channel.mention}",
+                ephemeral=True,
+            )
+        return False
+
+    future: "asyncio.Future[Optional[discord.abc.GuildChannel]]" = asyncio.get_running_loop().create_future()
+    _in_flight[key] = future
+    channel = None
+    try:
+        existing_ticket = await find_open_ticket(user, ticket_type)
+        if existing_ticket:
+            channel = user.guild.get_channel(existing_ticket.channel_id)
+            await send_response(
+                ctx_or_interaction,
+                f"ℹ️ You already have an open {ticket_label}: <#{existing_ticket.channel_id}>",
+                ephemeral=True,
+            )
+            return False
+
+        if ticket_creation_queue.is_full:
+            await send_response(
+                ctx_or_interaction,
+                "🚫 Too many tickets are being created right now, please try again in a few minutes.",
+                ephemeral=True,
+            )
+            return False
+
+        user_rate_limiter = _get_user_rate_limiter(user.id)
+        if not user_rate_limiter.try_acquire():
+            await send_response(
+                ctx_or_interaction,
+                f"⏱️ You're creating tickets too quickly, please try again in "
+                f"{user_rate_limiter.time_until_available():.0f} seconds.",
+                ephemeral=True,
+            )
+            return False
+
+        channel = await ticket_creation_queue.submit(ctx_or_interaction, ticket_type, ticket_label, create)
+        if channel is None:
+            await send_response(
+                ctx_or_interaction,
+                f"❌ Sorry, your {ticket_label} could not be created. Please try again later.",
+                ephemeral=True,
+            )
+        return channel is not None
+    finally:
+        del _in_flight[key]
+        future.set_result(channel)
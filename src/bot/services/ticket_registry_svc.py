@@ -0,0 +1,228 @@
+"""
+Ticket registry service module for looking up open tickets.
+
+This module keeps an in-memory mirror of the open tickets in the `tickets`
+table, indexed by owner and ticket type as well as by channel, so checking
+whether a member already has an open ticket or whether a channel is a ticket
+does not require a database query or a scan of the server's channels. The
+mirror is loaded once at startup and updated as tickets are opened and closed.
+"""
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
+
+import discord
+from discord.ext import commands
+
+from bot.database.mysql.tickets import (
+    TICKET_STATUS_CLOSED,
+    Ticket,
+    get_open_tickets,
+    insert_ticket,
+    update_ticket_status,
+)
+from bot.utils.console_logger import console_logger
+
+# open tickets keyed by (owner id, ticket type)
+_open_tickets_by_owner: Dict[Tuple[int, str], Ticket] = {}
+
+# open tickets keyed by channel id
+_open_tickets_by_channel: Dict[int, Ticket] = {}
+
+# channels of tickets the bot is closing itself, left alone by the channel delete listener
+_closing_channels: Set[int] = set()
+
+
+async def load_ticket_registry(bot: commands.Bot):
+    """
+    Load the open tickets into the registry.
+
+    Tickets whose channel no longer exists (e.g. deleted while the bot was
+    offline) are closed instead.
+
+    Args:
+        bot (commands.Bot): The bot instance, used to check that ticket channels still exist.
+
+    """
+    _open_tickets_by_owner.clear()
+    _open_tickets_by_channel.clear()
+
+    for ticket in await get_open_tickets():
+        if bot.get_channel(ticket.channel_id) is None:
+            await update_ticket_status(ticket.channel_id, TICKET_STATUS_CLOSED)
+            continue
+        _add(ticket)
+
+    console_logger.info(f"✅ Ticket registry loaded with {len(_open_tickets_by_channel)} open ticket(s)!")
+
+
+def setup_ticket_registry(bot: commands.Bot):
+    """
+    Register the listener that closes tickets whose channel was deleted.
+
+    Args:
+        bot (commands.Bot): The bot to register the listener on.
+
+    """
+
+    @bot.listen("on_guild_channel_delete")
+    async def on_ticket_channel_delete(channel: discord.abc.GuildChannel):
+        """
+        Close the ticket of a deleted channel, unless the bot is closing it itself.
+
+        Args:
+            channel (discord.abc.GuildChannel): The deleted channel.
+
+        """
+        if channel.id in _open_tickets_by_channel and channel.id not in _closing_channels:
+            await close_ticket(channel.id)
+
+
+@asynccontextmanager
+async def closing_ticket_channel(channel_id: int) -> AsyncIterator[None]:
+    """
+    Mark a ticket channel as being closed by the bot while the context is active.
+
+    The ticket is not closed when its channel is deleted within the context, so the
+    caller can close it with its own status (e.g. 'archived') once the channel is gone.
+
+    Args:
+        channel_id (int): The Discord channel ID of the ticket.
+
+    Yields:
+        None: Control while the channel is marked.
+
+    """
+    _closing_channels.add(channel_id)
+    try:
+        yield
+    finally:
+        _closing_channels.discard(channel_id)
+
+
+def is_closing_ticket_channel(channel_id: int) -> bool:
+    """
+    Check if the bot is closing the ticket of a channel.
+
+    Args:
+        channel_id (int): The Discord channel ID.
+
+    Returns:
+        bool: True if the ticket of the channel is being closed, False otherwise.
+
+    """
+    return channel_id in _closing_channels
+
+
+def get_open_ticket(owner_id: int, ticket_type: str) -> Optional[Ticket]:
+    """
+    Get the open ticket of a member for a ticket type.
+
+    Args:
+        owner_id (int): The Discord user ID of the member.
+        ticket_type (str): The type of ticket (e.g., 'support_tickets').
+
+    Returns:
+        Optional[Ticket]: The open ticket, or None if the member has none.
+
+    """
+    return _open_tickets_by_owner.get((owner_id, ticket_type))
+
+
+async def find_open_ticket(member: discord.Member, ticket_type: str) -> Optional[Ticket]:
+    """
+    Find the open ticket of a member for a ticket type, closing it if its channel is gone.
+
+    Args:
+        member (discord.Member): The member to check.
+        ticket_type (str): The type of ticket (e.g., 'support_tickets').
+
+    Returns:
+        Optional[Ticket]: The open ticket, or None if the member has none.
+
+    """
+    ticket = get_open_ticket(member.id, ticket_type)
+    if ticket and member.guild.get_channel(ticket.channel_id) is None:
+        await close_ticket(ticket.channel_id)
+        return None
+    return ticket
+
+
+def get_ticket_by_channel(channel_id: int) -> Optional[Ticket]:
+    """
+    Get the open ticket of a channel.
+
+    Args:
+        channel_id (int): The Discord channel ID.
+
+    Returns:
+        Optional[Ticket]: The open ticket, or None if the channel is not an open ticket.
+
+    """
+    return _open_tickets_by_channel.get(channel_id)
+
+
+def list_open_tickets(ticket_type: Optional[str] = None) -> List[Ticket]:
+    """
+    List the open tickets, oldest first.
+
+    Args:
+        ticket_type (Optional[str]): Only list tickets of this type, defaults to all types.
+
+    Returns:
+        List[Ticket]: The open tickets.
+
+    """
+    tickets = [ticket for ticket in _open_tickets_by_channel.values() if ticket_type in (None, ticket.ticket_type)]
+    return sorted(tickets, key=lambda ticket: ticket.created_at)
+
+
+async def register_ticket(ticket_type: str, ticket_number: int, owner_id: int, channel_id: int) -> Ticket:
+    """
+    Record a newly opened ticket.
+
+    Args:
+        ticket_type (str): The type of ticket (e.g., 'support_tickets').
+        ticket_number (int): The ticket number within its type.
+        owner_id (int): The Discord user ID of the ticket owner.
+        channel_id (int): The Discord channel ID of the ticket.
+
+    Returns:
+        Ticket: The recorded ticket.
+
+    """
+    ticket = await insert_ticket(ticket_type, ticket_number, owner_id, channel_id)
+    _add(ticket)
+    return ticket
+
+
+async def close_ticket(channel_id: int, status: str = TICKET_STATUS_CLOSED) -> Optional[Ticket]:
+    """
+    Close the ticket of a channel.
+
+    Args:
+        channel_id (int): The Discord channel ID of the ticket.
+        status (str): The status to close the ticket with (e.g., 'closed', 'archived'). Defaults to 'closed'.
+
+    Returns:
+        Optional[Ticket]: The closed ticket, or None if the channel was not an open ticket.
+
+    """
+    ticket = _open_tickets_by_channel.pop(channel_id, None)
+    if ticket is None:
+        return None
+
+    _open_tickets_by_owner.pop((ticket.owner_id, ticket.ticket_type), None)
+    return await update_ticket_status(channel_id, status)
+
+
+def _add(ticket: Ticket):
+    """
+    Add an open ticket to the in-memory indexes.
+
+    Args:
+        ticket (Ticket): The open ticket.
+
+    """
+    _open_tickets_by_owner[(ticket.owner_id, ticket.ticket_type)] = ticket
+    _open_tickets_by_channel[ticket.channel_id] = ticket
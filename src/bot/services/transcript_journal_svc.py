@@ -0,0 +1,332 @@
+"""
+Transcript journal service module for capturing ticket messages as they arrive.
+
+When enabled, this module journals the messages of ticket channels from the
+moment the ticket is opened, applying edits and deletes as they happen, either
+in MySQL or in an append-only file per channel. Transcripts of journaled
+tickets are then read from the journal instead of paging through the channel
+history on Discord, so they are fast to produce and remain available after the
+channel is deleted. Attachments are archived as their messages are journaled,
+while their URLs still work. The operations of a channel are applied one at a
+time in the order of their events, so a slow attachment download cannot let a
+stale record overwrite a later edit or delete.
+"""
+
+import asyncio
+import json
+import os
+from typing import Awaitable, Dict, List, Optional
+
+import aiofiles
+import discord
+from discord.ext import commands
+
+from bot.config.transcripts import transcripts_config
+from bot.database.mysql import transcripts
+from bot.services.attachment_archive_svc import archive_attachments
+from bot.services.discord_svc import format_export_message
+from bot.services.ticket_registry_svc import get_ticket_by_channel
+from bot.utils.console_logger import console_logger
+
+
+class MysqlTranscriptJournal:
+    """
+    Transcript journal stored in the `transcript_messages` table.
+    """
+
+    async def start(self, channel_id: int):
+        """
+        Start journaling the messages of a channel.
+
+        Args:
+            channel_id (int): The Discord channel ID.
+
+        """
+        await transcripts.start_journal(channel_id)
+
+    async def record(self, channel_id: int, message_id: int, text: str):
+        """
+        Record a new or edited message.
+
+        Args:
+            channel_id (int): The Discord channel ID of the message.
+            message_id (int): The Discord message ID.
+            text (str): The message formatted for a transcript.
+
+        """
+        await transcripts.record_message(channel_id, message_id, text)
+
+    async def delete(self, channel_id: int, message_id: int):
+        """
+        Remove a deleted message.
+
+        Args:
+            channel_id (int): The Discord channel ID of the message.
+            message_id (int): The Discord message ID.
+
+        """
+        await transcripts.delete_message(channel_id, message_id)
+
+    async def read(self, channel_id: int) -> Optional[List[str]]:
+        """
+        Read the journaled messages of a channel in message order.
+
+        Args:
+            channel_id (int): The Discord channel ID.
+
+        Returns:
+            Optional[List[str]]: The formatted messages, or None if the channel is not journaled.
+
+        """
+        return await transcripts.read_transcript(channel_id)
+
+
+class FileTranscriptJournal:
+    """
+    Transcript journal stored as an append-only file of operations per channel.
+
+    Each line of a channel's file is a JSON operation ('start', 'message' for new
+    and edited messages, or 'delete'), which are replayed in order when reading.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Initialize the FileTranscriptJournal.
+
+        Args:
+            directory (str): The directory of the journal files.
+
+        """
+        self.directory = directory
+        self._locks: Dict[int, asyncio.Lock] = {}
+
+    async def start(self, channel_id: int):
+        """
+        Start journaling the messages of a channel.
+
+        Args:
+            channel_id (int): The Discord channel ID.
+
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        await self._append(channel_id, {"op": "start"})
+
+    async def record(self, channel_id: int, message_id: int, text: str):
+        """
+        Record a new or edited message.
+
+        Args:
+            channel_id (int): The Discord channel ID of the message.
+            message_id (int): The Discord message ID.
+            text (str): The message formatted for a transcript.
+
+        """
+        await self._append(channel_id, {"op": "message", "id": message_id, "text": text})
+
+    async def delete(self, channel_id: int, message_id: int):
+        """
+        Record a deleted message.
+
+        Args:
+            channel_id (int): The Discord channel ID of the message.
+            message_id (int): The Discord message ID.
+
+        """
+        await self._append(channel_id, {"op": "delete", "id": message_id})
+
+    async def read(self, channel_id: int) -> Optional[List[str]]:
+        """
+        Replay the journal of a channel into its messages in message order.
+
+        Args:
+            channel_id (int): The Discord channel ID.
+
+        Returns:
+            Optional[List[str]]: The formatted messages, or None if the channel is not journaled.
+
+        """
+        path = self._path(channel_id)
+        if not os.path.exists(path):
+            return None
+
+        messages: Dict[int, str] = {}
+        started = False
+        async with aiofiles.open(path, mode="r", encoding="utf-8") as file:
+            async for line in file:
+                operation = json.loads(line)
+                if operation["op"] == "start":
+                    started = True
+                elif operation["op"] == "message":
+                    messages[operation["id"]] = operation["text"]
+                else:
+                    messages.pop(operation["id"], None)
+
+        if not started:
+            return None
+        return [messages[message_id] for message_id in sorted(messages)]
+
+    async def _append(self, channel_id: int, operation: Dict):
+        """
+        Append an operation to the journal of a channel.
+
+        Appends to a channel are serialized, so they are written in the order of their events.
+
+        Args:
+            channel_id (int): The Discord channel ID.
+            operation (Dict): The operation to append.
+
+        """
+        async with self._locks.setdefault(channel_id, asyncio.Lock()):
+            async with aiofiles.open(self._path(channel_id), mode="a", encoding="utf-8") as file:
+                await file.write(json.dumps(operation) + "\n")
+
+    def _path(self, channel_id: int) -> str:
+        """
+        Get the path of the journal file of a channel.
+
+        Args:
+            channel_id (int): The Discord channel ID.
+
+        Returns:
+            str: The path of the journal file.
+
+        """
+        return os.path.join(self.directory, f"{channel_id}.jsonl")
+
+
+if transcripts_config.transcript_journal_backend == "mysql":
+    _journal = MysqlTranscriptJournal()
+elif transcripts_config.transcript_journal_backend == "file":
+    _journal = FileTranscriptJournal(transcripts_config.transcript_journal_directory)
+else:
+    _journal = None
+
+# serialize the journal operations of each channel, from archiving attachments to writing
+_channel_locks: Dict[int, asyncio.Lock] = {}
+
+
+def setup_transcript_journal(bot: commands.Bot):
+    """
+    Register the listeners that journal the messages of ticket channels.
+
+    Does nothing if the journal is disabled.
+
+    Args:
+        bot (commands.Bot): The bot to register the listeners on.
+
+    """
+    if _journal is None:
+        return
+
+    @bot.listen("on_message")
+    async def on_ticket_message(message: discord.Message):
+        """
+        Journal a message sent in a ticket channel.
+
+        Args:
+            message (discord.Message): The message.
+
+        """
+        if get_ticket_by_channel(message.channel.id):
+            await _run(_record(message))
+
+    @bot.listen("on_message_edit")
+    async def on_ticket_message_edit(before: discord.Message, after: discord.Message):
+        """
+        Journal an edit of a message in a ticket channel.
+
+        Args:
+            before (discord.Message): The message before the edit.
+            after (discord.Message): The message after the edit.
+
+        """
+        if get_ticket_by_channel(after.channel.id):
+            await _run(_record(after))
+
+    @bot.listen("on_raw_message_delete")
+    async def on_ticket_message_delete(payload: discord.RawMessageDeleteEvent):
+        """
+        Journal the deletion of a message in a ticket channel.
+
+        Args:
+            payload (discord.RawMessageDeleteEvent): The deleted message's IDs.
+
+        """
+        if get_ticket_by_channel(payload.channel_id):
+            await _run(_delete(payload.channel_id, payload.message_id))
+
+
+async def start_transcript_journal(channel_id: int):
+    """
+    Start journaling the messages of a newly opened ticket channel.
+
+    Does nothing if the journal is disabled.
+
+    Args:
+        channel_id (int): The Discord channel ID of the ticket.
+
+    """
+    if _journal is not None:
+        async with _channel_locks.setdefault(channel_id, asyncio.Lock()):
+            await _run(_journal.start(channel_id))
+
+
+async def read_transcript(channel_id: int) -> Optional[List[str]]:
+    """
+    Read the transcript of a channel from the journal.
+
+    Args:
+        channel_id (int): The Discord channel ID.
+
+    Returns:
+        Optional[List[str]]: The formatted messages, or None if the channel was not journaled since it was opened.
+
+    """
+    if _journal is None:
+        return None
+    try:
+        return await _journal.read(channel_id)
+    except Exception as e:
+        console_logger.error(f"❌ Error reading transcript journal of channel {channel_id}: {e}")
+        return None
+
+
+async def _record(message: discord.Message):
+    """
+    Record a new or edited message, archiving its attachments first.
+
+    Args:
+        message (discord.Message): The message.
+
+    """
+    # taken before any other await, so operations queue on the lock in the order of their events
+    async with _channel_locks.setdefault(message.channel.id, asyncio.Lock()):
+        archived_paths = await archive_attachments(message.attachments)
+        await _journal.record(message.channel.id, message.id, format_export_message(message, True, archived_paths))
+
+
+async def _delete(channel_id: int, message_id: int):
+    """
+    Remove a deleted message, after the operations of its channel queued before it.
+
+    Args:
+        channel_id (int): The Discord channel ID of the message.
+        message_id (int): The Discord message ID.
+
+    """
+    async with _channel_locks.setdefault(channel_id, asyncio.Lock()):
+        await _journal.delete(channel_id, message_id)
+
+
+async def _run(operation: Awaitable):
+    """
+    Run a journal operation, logging instead of raising on failure.
+
+    Args:
+        operation (Awaitable): The journal operation.
+
+    """
+    try:
+        await operation
+    except Exception as e:
+        console_logger.error(f"❌ Error writing transcript journal: {e}")
@@ -10,7 +10,7 @@ from typing import List
 
 import discord
 
-from bot.config.common import common_config
+from bot.services.member_roles_svc import resolve_member_roles
 
 
 def get_user_recurring_sponsor_tiers(member: discord.Member) -> List[str]:
@@ -18,22 +18,14 @@ def get_user_recurring_sponsor_tiers(member: discord.Member) -> List[str]:
     Retrieve all recurring sponsor tiers a user belongs to.
 
     This function checks the member's roles against all configured recurring sponsor tiers
-    and returns a list of tier names the user matches. Note: the result is not sorted
-    by tier rank.
+    and returns a list of tier names the user matches, sorted from the highest tier to the
+    lowest.
 
     Args:
         member (discord.Member): The Discord member to check.
 
     Returns:
-        List[str]: A list of sponsor tier names the user is part of.
+        List[str]: A list of sponsor tier names the user is part of, highest first.
 
     """
-    user_roles = {role.id for role in member.roles}
-
-    user_sponsor_tiers = []
-    # TODO: Sort result from highest sponsor to lowest sponsor tier
-    for tier in common_config.recurring_sponsor_tiers:
-        if common_config.recurring_sponsor_tiers[tier].role_id in user_roles:
-            user_sponsor_tiers.append(tier)
-
-    return user_sponsor_tiers
+    return resolve_member_roles(member).recurring_sponsor_tiers
@@ -5,11 +5,12 @@ This module handles button view creation, interaction callbacks, and
 persistent registration of views for the bot.
 """
 
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import discord
 from discord.ext import commands
 
+from bot.ui.interaction_router import InteractionRouter
 from bot.utils.console_logger import console_logger
 
 
@@ -69,8 +70,7 @@ class ButtonsManager:
     Register persistent button views and interaction callbacks.
     """
 
-    _registered_view_ids: Set[frozenset] = set()
-    _button_callbacks: Dict[str, Callable] = {}
+    _registered_views: Dict[Tuple[Tuple[str, str, str], ...], ButtonView] = {}
     _bot: Optional[commands.Bot] = None
 
     @classmethod
@@ -79,49 +79,23 @@ class ButtonsManager:
         Initialize the manager with the bot instance.
 
         Args:
-            bot (commands.Bot): The bot to register listeners on.
+            bot (commands.Bot): The bot to register persistent views on.
 
         """
         cls._bot = bot
 
-        @bot.listen("on_interaction")
-        async def on_button_interaction(interaction: discord.Interaction):
-            """
-            Route a button interaction to its callback.
-
-            Args:
-                interaction (discord.Interaction): The interaction from Discord.
-
-            """
-            if not interaction.data:
-                return
-
-            component_type = interaction.data.get("component_type")
-
-            # handle buttons only
-            if component_type != discord.ComponentType.button.value:
-                return
-
-            custom_id = interaction.data["custom_id"]
-            if custom_id in cls._button_callbacks:
-                await cls._button_callbacks[custom_id](interaction)
-            else:
-                await interaction.response.send_message(
-                    "⚠️ This feature is disabled or unavailable.",
-                    ephemeral=True,
-                )
-
     @classmethod
-    def register_callback(cls, custom_id: str, callback: Callable):
+    def register_callback(cls, custom_id: str, callback: Callable, auto_defer: bool = True):
         """
         Register a button callback.
 
         Args:
             custom_id (str): The button's custom ID.
             callback (Callable): The function to invoke.
+            auto_defer (bool): Whether the router defers the interaction if the callback is slow to respond.
 
         """
-        cls._button_callbacks[custom_id] = callback
+        InteractionRouter.register("button", custom_id, callback, auto_defer)
 
     @classmethod
     def unregister_callback(cls, custom_id: str):
@@ -132,24 +106,32 @@ class ButtonsManager:
             custom_id (str): The ID to remove.
 
         """
-        cls._button_callbacks.pop(custom_id, None)
+        InteractionRouter.unregister("button", custom_id)
 
     @classmethod
-    def register_view(cls, buttons: List[Dict[str, Any]], persistent: Optional[bool] = True):
+    def register_view(cls, buttons: List[Dict[str, Any]], persistent: Optional[bool] = True) -> Optional[ButtonView]:
         """
         Register a persistent view if not already added.
 
+        The view is built and added to the bot once per set of buttons, later calls
+        return the registered view so it can be reused when sending messages.
+
         Args:
             buttons (List[Dict[str, Any]]): The buttons to register.
             persistent (Optional[bool]): Whether the view is persistent.
 
+        Returns:
+            Optional[ButtonView]: The registered view, or None if the buttons cannot be persisted.
+
         """
-        view_id = frozenset((btn.get("custom_id", ""), btn.get("label", "")) for btn in buttons if btn.get("custom_id"))
+        view_id = tuple((btn.get("custom_id", ""), btn.get("label", ""), btn.get("url", "")) for btn in buttons)
 
-        if view_id and view_id in cls._registered_view_ids:
-            return
+        view = cls._registered_views.get(view_id)
+        if view is not None:
+            return view
 
         if persistent and any(btn.get("custom_id") for btn in buttons):
             view = ButtonView(buttons, persistent)
             cls._bot.add_view(view)
-            cls._registered_view_ids.add(view_id)
+            cls._registered_views[view_id] = view
+        return view
@@ -0,0 +1,24 @@
+"""
+Embed templates for confirmation messages.
+
+This module defines the ephemeral confirmation embeds shown to users after
+a ticket is created or a ticket system is set up in a channel.
+"""
+
+import discord
+
+from bot.ui.embeds.embed_template import EmbedTemplate
+
+ticket_created_template = EmbedTemplate(
+    "common#ticket_created",
+    title="Ticket Created",
+    description="✅ {ticket_kind} created: {channel_mention}",
+    color=discord.Color.green().value,
+)
+
+setup_complete_template = EmbedTemplate(
+    "common#setup_complete",
+    title="Setup Complete",
+    description="✅ {system} has been set up in {channel_mention}",
+    color=discord.Color.green().value,
+)
@@ -0,0 +1,117 @@
+"""
+Embed template module for prebuilt embeds and their button views.
+
+This module defines templates for embeds that are sent repeatedly, such as
+the ticket main menus and ticket info embeds. Each template builds its
+`discord.Embed` once when it is defined, and its persistent button view once
+on first use. Sending a template only fills in the placeholders (e.g. the
+ticket number) of the text fields that contain any. Templates are kept in a
+registry keyed by name.
+"""
+
+from typing import Any, Dict, List, Optional
+
+import discord
+
+from bot.ui.buttons.buttons_manager import ButtonsManager, ButtonView
+
+
+class EmbedTemplate:
+    """
+    A prebuilt embed with optional buttons and `str.format` placeholders.
+
+    Attributes:
+        name (str): The unique name of the template (e.g. 'support_tickets#main_menu').
+        buttons (List[Dict[str, Any]]): The buttons shown below the embed.
+        persistent (bool): Whether the buttons persist after a restart.
+
+    """
+
+    # all templates, keyed by name
+    registry: Dict[str, "EmbedTemplate"] = {}
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        color: Optional[int] = discord.Color.blue().value,
+        footer_text: Optional[str] = None,
+        buttons: Optional[List[Dict[str, Any]]] = None,
+        persistent: bool = True,
+    ):
+        """
+        Build the template and add it to the registry.
+
+        Args:
+            name (str): The unique name of the template.
+            title (Optional[str]): The embed title, may contain placeholders.
+            description (Optional[str]): The embed description, may contain placeholders.
+            color (Optional[int]): The embed color. Defaults to blue.
+            footer_text (Optional[str]): The embed footer text, may contain placeholders.
+            buttons (Optional[List[Dict[str, Any]]]): The buttons shown below the embed.
+            persistent (bool): Whether the buttons persist after a restart. Defaults to True.
+
+        """
+        self.name = name
+        self.buttons = buttons or []
+        self.persistent = persistent
+        self._title = title
+        self._description = description
+        self._footer_text = footer_text
+        self._view: Optional[ButtonView] = None
+
+        self._embed = discord.Embed(title=title, description=description, color=color)
+        if footer_text:
+            self._embed.set_footer(text=footer_text)
+
+        # only text fields with placeholders need to be formatted when sending
+        self._dynamic = any("{" in (text or "") for text in (title, description, footer_text))
+
+        EmbedTemplate.registry[name] = self
+
+    def render(self, **values: Any) -> discord.Embed:
+        """
+        Get the embed with its placeholders filled in.
+
+        Templates without placeholders return the prebuilt embed as is.
+
+        Args:
+            **values (Any): The values of the placeholders.
+
+        Returns:
+            discord.Embed: The embed to send.
+
+        """
+        if not self._dynamic:
+            return self._embed
+
+        embed = self._embed.copy()
+        if self._title:
+            embed.title = self._title.format(**values)
+        if self._description:
+            embed.description = self._description.format(**values)
+        if self._footer_text:
+            embed.set_footer(text=self._footer_text.format(**values))
+        return embed
+
+    def get_view(self) -> Optional[ButtonView]:
+        """
+        Get the button view of the template.
+
+        Persistent views are built and registered once and then reused, since views
+        can only be created while the event loop is running.
+
+        Returns:
+            Optional[ButtonView]: The view, or None if the template has no buttons.
+
+        """
+        if not self.buttons:
+            return None
+        if not self.persistent:
+            return ButtonView(self.buttons, persistent=False)
+        if self._view is None:
+            view = ButtonsManager.register_view(self.buttons, self.persistent) if ButtonsManager._bot else None
+            self._view = view or ButtonView(self.buttons)
+        return self._view
@@ -4,7 +4,8 @@ Embed manager module for handling embeds and button callbacks.
 This module provides an interface for sending embeds with dynamic and
 persistent buttons in Discord. It handles view registration, interaction
 dispatching, and responds appropriately to context or interaction
-sources.
+sources. Embeds that are sent repeatedly are sent from prebuilt templates
+(see embed_template.py).
 """
 
 from typing import Any, Dict, List, Optional, Union
@@ -12,60 +13,9 @@ from typing import Any, Dict, List, Optional, Union
 import discord
 from discord.ext import commands
 
-from bot.ui.buttons.buttons_manager import ButtonsManager
-from bot.utils.console_logger import console_logger
-
-
-class ButtonView(discord.ui.View):
-    """
-    A dynamic Discord UI view for handling interactive buttons.
-    """
-
-    def __init__(self, buttons: List[Dict[str, Any]], persistent: Optional[bool] = True):
-        """
-        Initialize the view with a list of buttons.
-
-        Args:
-            buttons (List[Dict[str, Any]]): A list of button configurations.
-            persistent (Optional[bool]): Whether the buttons should persist
-                after bot restart. Defaults to True.
-
-        """
-        super().__init__(timeout=None if persistent else 180)
-        self.add_buttons(buttons, persistent)
-
-    def add_buttons(self, buttons: List[Dict[str, Any]], persistent: bool):
-        """
-        Dynamically add buttons to the view.
-
-        Args:
-            buttons (List[Dict[str, Any]]): A list of button configurations.
-            persistent (bool): Whether the buttons should persist after restart.
-
-        """
-        for btn in buttons:
-            if "url" in btn and btn["url"]:
-                button = discord.ui.Button(
-                    style=btn.get("style", discord.ButtonStyle.link),
-                    label=btn.get("label", "Link"),
-                    url=btn["url"],
-                    emoji=btn.get("emoji", None),
-                    disabled=btn.get("disabled", False),
-                )
-                self.add_item(button)
-            else:
-                custom_id = btn.get("custom_id")
-                if not custom_id and persistent:
-                    console_logger.error(f"❌ Missing custom_id for persistent button: {btn}")
-                    continue
-                button = discord.ui.Button(
-                    style=btn.get("style", discord.ButtonStyle.secondary),
-                    label=btn.get("label", "Button"),
-                    custom_id=custom_id,
-                    emoji=btn.get("emoji", None),
-                    disabled=btn.get("disabled", False),
-                )
-                self.add_item(button)
+from bot.services.discord_svc import respond_to_interaction
+from bot.ui.buttons.buttons_manager import ButtonsManager, ButtonView
+from bot.ui.embeds.embed_template import EmbedTemplate
 
 
 class EmbedsManager:
@@ -120,10 +70,6 @@ class EmbedsManager:
             discord.Message: The message object containing the embed.
 
         """
-        # If buttons are provided and persistence is desired, register the view via ButtonsManager.
-        if buttons and persistent and ButtonsManager._bot:
-            ButtonsManager.register_view(buttons, persistent)
-
         # Build the embed.
         embed = discord.Embed(title=title, description=description, color=color)
         if thumbnail_url:
@@ -142,9 +88,70 @@ class EmbedsManager:
                     inline=field.get("inline", False),
                 )
 
-        # Create a view if buttons were provided.
-        view = ButtonView(buttons, persistent) if buttons else None
+        # If buttons are provided and persistence is desired, reuse the view registered via ButtonsManager.
+        view = None
+        if buttons and persistent and ButtonsManager._bot:
+            view = ButtonsManager.register_view(buttons, persistent)
+        if buttons and view is None:
+            view = ButtonView(buttons, persistent)
+
+        return await cls._dispatch(ctx_or_interaction, channel, embed, view, ephemeral, file)
 
+    @classmethod
+    async def send_template(
+        cls,
+        ctx_or_interaction: Union[commands.Context, discord.Interaction],
+        template: EmbedTemplate,
+        *,
+        channel: Optional[discord.TextChannel] = None,
+        ephemeral: Optional[bool] = False,
+        **values: Any,
+    ) -> discord.Message:
+        """
+        Send a prebuilt embed template, filling in its placeholders.
+
+        Args:
+            ctx_or_interaction (Union[commands.Context, discord.Interaction]):
+                The context or interaction from which to send the embed.
+            template (EmbedTemplate): The template to send.
+            channel (Optional[discord.TextChannel], optional): Channel to send to, overrides default.
+            ephemeral (Optional[bool]): Whether response is ephemeral. Defaults to False.
+            **values (Any): The values of the template's placeholders (e.g. ticket_number).
+
+        Returns:
+            discord.Message: The message object containing the embed.
+
+        """
+        return await cls._dispatch(
+            ctx_or_interaction, channel, template.render(**values), template.get_view(), ephemeral, None
+        )
+
+    @classmethod
+    async def _dispatch(
+        cls,
+        ctx_or_interaction: Union[commands.Context, discord.Interaction],
+        channel: Optional[discord.TextChannel],
+        embed: discord.Embed,
+        view: Optional[discord.ui.View],
+        ephemeral: Optional[bool],
+        file: Optional[discord.File],
+    ) -> discord.Message:
+        """
+        Send an embed to a channel, or as a response to the context or interaction.
+
+        Args:
+            ctx_or_interaction (Union[commands.Context, discord.Interaction]):
+                The context or interaction from which to send the embed.
+            channel (Optional[discord.TextChannel]): Channel to send to, overrides default.
+            embed (discord.Embed): The embed to send.
+            view (Optional[discord.ui.View]): The view to attach.
+            ephemeral (Optional[bool]): Whether response is ephemeral.
+            file (Optional[discord.File]): File to send with the embed.
+
+        Returns:
+            discord.Message: The message object containing the embed.
+
+        """
         # Dispatch the embed message based on context type.
         if channel:
             kwargs = {"embed": embed}
@@ -163,7 +170,4 @@ class EmbedsManager:
         if isinstance(ctx_or_interaction, commands.Context):
             return await ctx_or_interaction.send(**kwargs)
 
-        try:
-            await ctx_or_interaction.response.send_message(**kwargs)
-        except Exception:
-            return await ctx_or_interaction.followup.send(**kwargs)
+        return await respond_to_interaction(ctx_or_interaction, **kwargs)
@@ -12,9 +12,24 @@ import discord
 from discord.ext import commands
 
 from bot.ui.buttons.report_tickets.main_menu import report_plugin_btn, report_theme_btn
+from bot.ui.embeds.common.confirmations import setup_complete_template
+from bot.ui.embeds.embed_template import EmbedTemplate
 from bot.ui.embeds.embeds_manager import EmbedsManager
 from bot.utils.console_logger import console_logger
 
+main_menu_template = EmbedTemplate(
+    "report_tickets#main_menu",
+    title="📩 Report Ticket System",
+    description=(
+        "Spotted a malicious plugin, or perhaps an offensive theme? "
+        "Help inform us by creating a report!\n\n"
+        "Note that this is **not for bug reports**."
+    ),
+    color=discord.Color.blue().value,
+    footer_text="Report Ticket System",
+    buttons=[report_theme_btn, report_plugin_btn],
+)
+
 
 class MainMenuEmbed:
     """
@@ -35,27 +50,15 @@ class MainMenuEmbed:
         target_channel = channel or ctx.channel
         try:
             # Send the main report ticket embed
-            await EmbedsManager.send_embed(
-                ctx,
-                channel=target_channel,
-                title="📩 Report Ticket System",
-                description=(
-                    "Spotted a malicious plugin, or perhaps an offensive theme? "
-                    "Help inform us by creating a report!\n\n"
-                    "Note that this is **not for bug reports**."
-                ),
-                color=discord.Color.blue().value,
-                footer_text="Report Ticket System",
-                buttons=[report_theme_btn, report_plugin_btn],
-            )
+            await EmbedsManager.send_template(ctx, main_menu_template, channel=target_channel)
 
             # Notify user of successful setup
-            await EmbedsManager.send_embed(
+            await EmbedsManager.send_template(
                 ctx,
-                title="Setup Complete",
-                description=f"✅ Report ticket system has been set up in {target_channel.mention}",
-                color=discord.Color.green().value,
+                setup_complete_template,
                 ephemeral=True,
+                system="Report ticket system",
+                channel_mention=target_channel.mention,
             )
 
         except Exception as e:
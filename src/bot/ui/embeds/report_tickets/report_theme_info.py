@@ -10,9 +10,29 @@ import discord
 
 from bot.ui.buttons.common.close_ticket import close_ticket_btn
 from bot.ui.buttons.common.export_ticket import export_ticket_btn
+from bot.ui.embeds.common.confirmations import ticket_created_template
+from bot.ui.embeds.embed_template import EmbedTemplate
 from bot.ui.embeds.embeds_manager import EmbedsManager
 from bot.utils.console_logger import console_logger
 
+report_theme_info_template = EmbedTemplate(
+    "report_tickets#report_theme_info",
+    title="📕 Report a Theme",
+    description=(
+        "Hello there! Please describe the theme that you are reporting.\n\n"
+        "**🔹 Below is a suggested template:**\n"
+        "1️⃣ **Link to theme**\n"
+        "2️⃣ **Report description** (e.g. the theme is offensive)\n"
+        "3️⃣ **Urgency** (e.g. low priority, very urgent)\n\n"
+        "📌 **Note:** Tickets will be addressed as soon as possible.\n"
+        "You will typically get a **first response within 24 hours**, "
+        "but resolution time may vary. Thank you for your understanding!"
+    ),
+    color=discord.Color.blue().value,
+    footer_text="Ticket #{ticket_number}",
+    buttons=[close_ticket_btn, export_ticket_btn],
+)
+
 
 class ReportThemeInfoEmbed:
     """
@@ -38,31 +58,19 @@ class ReportThemeInfoEmbed:
 
         """
         try:
-            await EmbedsManager.send_embed(
+            await EmbedsManager.send_template(
                 ctx_or_interaction,
+                report_theme_info_template,
                 channel=channel,
-                title="📕 Report a Theme",
-                description=(
-                    "Hello there! Please describe the theme that you are reporting.\n\n"
-                    "**🔹 Below is a suggested template:**\n"
-                    "1️⃣ **Link to theme**\n"
-                    "2️⃣ **Report description** (e.g. the theme is offensive)\n"
-                    "3️⃣ **Urgency** (e.g. low priority, very urgent)\n\n"
-                    "📌 **Note:** Tickets will be addressed as soon as possible.\n"
-                    "You will typically get a **first response within 24 hours**, "
-                    "but resolution time may vary. Thank you for your understanding!"
-                ),
-                color=discord.Color.blue().value,
-                footer_text=f"Ticket #{ticket_number}",
-                buttons=[close_ticket_btn, export_ticket_btn],
+                ticket_number=ticket_number,
             )
 
-            await EmbedsManager.send_embed(
+            await EmbedsManager.send_template(
                 ctx_or_interaction,
-                title="Ticket Created",
-                description=f"✅ Report ticket (theme) created: {channel.mention}",
-                color=discord.Color.green().value,
+                ticket_created_template,
                 ephemeral=True,
+                ticket_kind="Report ticket (theme)",
+                channel_mention=channel.mention,
             )
 
             return True
@@ -10,9 +10,25 @@ import discord
 
 from bot.ui.buttons.common.close_ticket import close_ticket_btn
 from bot.ui.buttons.common.export_ticket import export_ticket_btn
+from bot.ui.embeds.common.confirmations import ticket_created_template
+from bot.ui.embeds.embed_template import EmbedTemplate
 from bot.ui.embeds.embeds_manager import EmbedsManager
 from bot.utils.console_logger import console_logger
 
+become_sponsor_info_template = EmbedTemplate(
+    "sponsor_tickets#become_sponsor_info",
+    title="📕 Become a Sponsor",
+    description=(
+        "Interested to sponsor the project? Check out the link here: https://gallery.react-chatbotify.com/sponsors\n\n"
+        "📌 **Note:** Tickets will be addressed as soon as possible.\n"
+        "You will typically get a **first response within 24 hours**, "
+        "but resolution time may vary. Thank you for your understanding!"
+    ),
+    color=discord.Color.blue().value,
+    footer_text="Ticket #{ticket_number}",
+    buttons=[close_ticket_btn, export_ticket_btn],
+)
+
 
 class BecomeSponsorInfoEmbed:
     """
@@ -38,27 +54,19 @@ class BecomeSponsorInfoEmbed:
 
         """
         try:
-            await EmbedsManager.send_embed(
+            await EmbedsManager.send_template(
                 ctx_or_interaction,
+                become_sponsor_info_template,
                 channel=channel,
-                title="📕 Become a Sponsor",
-                description=(
-                    "Interested to sponsor the project? Check out the link here: https://gallery.react-chatbotify.com/sponsors\n\n"
-                    "📌 **Note:** Tickets will be addressed as soon as possible.\n"
-                    "You will typically get a **first response within 24 hours**, "
-                    "but resolution time may vary. Thank you for your understanding!"
-                ),
-                color=discord.Color.blue().value,
-                footer_text=f"Ticket #{ticket_number}",
-                buttons=[close_ticket_btn, export_ticket_btn],
+                ticket_number=ticket_number,
             )
 
-            await EmbedsManager.send_embed(
+            await EmbedsManager.send_template(
                 ctx_or_interaction,
-                title="Ticket Created",
-                description=f"✅ Sponsor ticket created: {channel.mention}",
-                color=discord.Color.green().value,
+                ticket_created_template,
                 ephemeral=True,
+                ticket_kind="Sponsor ticket",
+                channel_mention=channel.mention,
             )
 
             return True
@@ -10,9 +10,30 @@ import discord
 
 from bot.ui.buttons.common.close_ticket import close_ticket_btn
 from bot.ui.buttons.common.export_ticket import export_ticket_btn
+from bot.ui.embeds.common.confirmations import ticket_created_template
+from bot.ui.embeds.embed_template import EmbedTemplate
 from bot.ui.embeds.embeds_manager import EmbedsManager
 from bot.utils.console_logger import console_logger
 
+claim_sponsor_role_info_template = EmbedTemplate(
+    "sponsor_tickets#claim_sponsor_role_info",
+    title="📕 Claim Sponsor Role",
+    description=(
+        "Sponsored the project and looking to claim your sponsor role? \n\n"
+        "**🔹 Do provide the details below:**\n"
+        "1️⃣ **Date sponsored** (e.g. 12/20/2025)\n"
+        "2️⃣ **Email used**\n"
+        "3️⃣ **Platform used** (e.g. GitHub)\n\n"
+        "⚠️ **Feel free to provide any additional screenshots!**\n\n"
+        "📌 **Note:** Tickets will be addressed as soon as possible.\n"
+        "You will typically get a **first response within 24 hours**, "
+        "but resolution time may vary. Thank you for your understanding!"
+    ),
+    color=discord.Color.blue().value,
+    footer_text="Ticket #{ticket_number}",
+    buttons=[close_ticket_btn, export_ticket_btn],
+)
+
 
 class ClaimSponsorRoleInfoEmbed:
     """
@@ -38,32 +59,19 @@ class ClaimSponsorRoleInfoEmbed:
 
         """
         try:
-            await EmbedsManager.send_embed(
+            await EmbedsManager.send_template(
                 ctx_or_interaction,
+                claim_sponsor_role_info_template,
                 channel=channel,
-                title="📕 Claim Sponsor Role",
-                description=(
-                    "Sponsored the project and looking to claim your sponsor role? \n\n"
-                    "**🔹 Do provide the details below:**\n"
-                    "1️⃣ **Date sponsored** (e.g. 12/20/2025)\n"
-                    "2️⃣ **Email used**\n"
-                    "3️⃣ **Platform used** (e.g. GitHub)\n\n"
-                    "⚠️ **Feel free to provide any additional screenshots!**\n\n"
-                    "📌 **Note:** Tickets will be addressed as soon as possible.\n"
-                    "You will typically get a **first response within 24 hours**, "
-                    "but resolution time may vary. Thank you for your understanding!"
-                ),
-                color=discord.Color.blue().value,
-                footer_text=f"Ticket #{ticket_number}",
-                buttons=[close_ticket_btn, export_ticket_btn],
+                ticket_number=ticket_number,
             )
 
-            await EmbedsManager.send_embed(
+            await EmbedsManager.send_template(
                 ctx_or_interaction,
-                title="Ticket Created",
-                description=f"✅ Sponsor ticket created: {channel.mention}",
-                color=discord.Color.green().value,
+                ticket_created_template,
                 ephemeral=True,
+                ticket_kind="Sponsor ticket",
+                channel_mention=channel.mention,
             )
 
             return True
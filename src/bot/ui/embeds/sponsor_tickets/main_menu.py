@@ -16,9 +16,27 @@ from bot.ui.buttons.sponsor_tickets.main_menu import (
     claim_sponsor_role_btn,
     submit_enquiry_btn,
 )
+from bot.ui.embeds.common.confirmations import setup_complete_template
+from bot.ui.embeds.embed_template import EmbedTemplate
 from bot.ui.embeds.embeds_manager import EmbedsManager
 from bot.utils.console_logger import console_logger
 
+main_menu_template = EmbedTemplate(
+    "sponsor_tickets#main_menu",
+    title="📩 Sponsor Ticket System",
+    description=(
+        "Looking to become a sponsor, have enquiries about sponsoring or claiming your sponsor role? "
+        "This is the place!\n\n"
+    ),
+    color=discord.Color.blue().value,
+    footer_text="Sponsor Ticket System",
+    buttons=[
+        become_a_sponsor_btn,
+        submit_enquiry_btn,
+        claim_sponsor_role_btn,
+    ],
+)
+
 
 class MainMenuEmbed:
     """
@@ -39,30 +57,15 @@ class MainMenuEmbed:
         target_channel = channel or ctx.channel
         try:
             # Send the main sponsor ticket embed
-            await EmbedsManager.send_embed(
-                ctx,
-                channel=target_channel,
-                title="📩 Sponsor Ticket System",
-                description=(
-                    "Looking to become a sponsor, have enquiries about sponsoring or claiming your sponsor role? "
-                    "This is the place!\n\n"
-                ),
-                color=discord.Color.blue().value,
-                footer_text="Sponsor Ticket System",
-                buttons=[
-                    become_a_sponsor_btn,
-                    submit_enquiry_btn,
-                    claim_sponsor_role_btn,
-                ],
-            )
+            await EmbedsManager.send_template(ctx, main_menu_template, channel=target_channel)
 
             # Send setup confirmation to the user
-            await EmbedsManager.send_embed(
+            await EmbedsManager.send_template(
                 ctx,
-                title="Setup Complete",
-                description=f"✅ Sponsor ticket system has been set up in {target_channel.mention}",
-                color=discord.Color.green().value,
+                setup_complete_template,
                 ephemeral=True,
+                system="Sponsor ticket system",
+                channel_mention=target_channel.mention,
             )
 
         except Exception as e:
@@ -10,9 +10,27 @@ import discord
 
 from bot.ui.buttons.common.close_ticket import close_ticket_btn
 from bot.ui.buttons.common.export_ticket import export_ticket_btn
+from bot.ui.embeds.common.confirmations import ticket_created_template
+from bot.ui.embeds.embed_template import EmbedTemplate
 from bot.ui.embeds.embeds_manager import EmbedsManager
 from bot.utils.console_logger import console_logger
 
+submit_enquiry_info_template = EmbedTemplate(
+    "sponsor_tickets#submit_enquiry_info",
+    title="📕 Submit Enquiry",
+    description=(
+        "Hello there! Have enquiries about sponsorship? "
+        "Perhaps you're exploring interesting ways to sponsor "
+        "or contribute to the project? Feel free to let us know!\n\n"
+        "📌 **Note:** Tickets will be addressed as soon as possible.\n"
+        "You will typically get a **first response within 24 hours**, "
+        "but resolution time may vary. Thank you for your understanding!"
+    ),
+    color=discord.Color.blue().value,
+    footer_text="Ticket #{ticket_number}",
+    buttons=[close_ticket_btn, export_ticket_btn],
+)
+
 
 class SubmitEnquiryInfoEmbed:
     """
@@ -38,29 +56,19 @@ class SubmitEnquiryInfoEmbed:
 
         """
         try:
-            await EmbedsManager.send_embed(
+            await EmbedsManager.send_template(
                 ctx_or_interaction,
+                submit_enquiry_info_template,
                 channel=channel,
-                title="📕 Submit Enquiry",
-                description=(
-                    "Hello there! Have enquiries about sponsorship? "
-                    "Perhaps you're exploring interesting ways to sponsor "
-                    "or contribute to the project? Feel free to let us know!\n\n"
-                    "📌 **Note:** Tickets will be addressed as soon as possible.\n"
-                    "You will typically get a **first response within 24 hours**, "
-                    "but resolution time may vary. Thank you for your understanding!"
-                ),
-                color=discord.Color.blue().value,
-                footer_text=f"Ticket #{ticket_number}",
-                buttons=[close_ticket_btn, export_ticket_btn],
+                ticket_number=ticket_number,
             )
 
-            await EmbedsManager.send_embed(
+            await EmbedsManager.send_template(
                 ctx_or_interaction,
-                title="Ticket Created",
-                description=f"✅ Sponsor ticket created: {channel.mention}",
-                color=discord.Color.green().value,
+                ticket_created_template,
                 ephemeral=True,
+                ticket_kind="Sponsor ticket",
+                channel_mention=channel.mention,
             )
 
             return True
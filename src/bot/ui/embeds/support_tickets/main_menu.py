@@ -12,9 +12,24 @@ import discord
 from discord.ext import commands
 
 from bot.ui.buttons.support_tickets.main_menu import create_ticket_btn
+from bot.ui.embeds.common.confirmations import setup_complete_template
+from bot.ui.embeds.embed_template import EmbedTemplate
 from bot.ui.embeds.embeds_manager import EmbedsManager
 from bot.utils.console_logger import console_logger
 
+main_menu_template = EmbedTemplate(
+    "support_tickets#main_menu",
+    title="📩 Support Ticket System",
+    description=(
+        "Looking to expedite your issue, seeking suggestions, or perhaps another opinion? "
+        "Click the button below to open a premium support ticket!\n\n"
+        "Available for **Lite, Plus, Pro, and Ultra Sponsors**."
+    ),
+    color=discord.Color.blue().value,
+    footer_text="Support Ticket System",
+    buttons=[create_ticket_btn],
+)
+
 
 class MainMenuEmbed:
     """
@@ -37,26 +52,14 @@ class MainMenuEmbed:
         """
         target_channel = channel or ctx.channel
         try:
-            await EmbedsManager.send_embed(
-                ctx,
-                channel=target_channel,
-                title="📩 Support Ticket System",
-                description=(
-                    "Looking to expedite your issue, seeking suggestions, or perhaps another opinion? "
-                    "Click the button below to open a premium support ticket!\n\n"
-                    "Available for **Lite, Plus, Pro, and Ultra Sponsors**."
-                ),
-                color=discord.Color.blue().value,
-                footer_text="Support Ticket System",
-                buttons=[create_ticket_btn],
-            )
+            await EmbedsManager.send_template(ctx, main_menu_template, channel=target_channel)
 
-            await EmbedsManager.send_embed(
+            await EmbedsManager.send_template(
                 ctx,
-                title="Setup Complete",
-                description=f"✅ Support ticket system has been set up in {target_channel.mention}",
-                color=discord.Color.green().value,
+                setup_complete_template,
                 ephemeral=True,
+                system="Support ticket system",
+                channel_mention=target_channel.mention,
             )
 
         except Exception as e:
@@ -10,9 +10,30 @@ import discord
 
 from bot.ui.buttons.common.close_ticket import close_ticket_btn
 from bot.ui.buttons.common.export_ticket import export_ticket_btn
+from bot.ui.embeds.common.confirmations import ticket_created_template
+from bot.ui.embeds.embed_template import EmbedTemplate
 from bot.ui.embeds.embeds_manager import EmbedsManager
 from bot.utils.console_logger import console_logger
 
+new_ticket_info_template = EmbedTemplate(
+    "support_tickets#new_ticket_info",
+    title="🗳 Support Ticket Opened",
+    description=(
+        "Hello there! Please describe your issue(s) in as much detail as possible.\n\n"
+        "**🔹 Below is a suggested template:**\n"
+        "1️⃣ **Type of issue** (e.g. bug, clarification required)\n"
+        "2️⃣ **Issue description** (e.g. button does not work)\n"
+        "3️⃣ **Urgency** (e.g. low priority, very urgent)\n\n"
+        "⚠️ **If reaching out for help with a bug, provide steps to reproduce it.**\n\n"
+        "📌 **Note:** Tickets will be addressed as soon as possible.\n"
+        "You will typically get a **first response within 24 hours**, "
+        "but resolution time may vary. Thank you for your understanding!"
+    ),
+    color=discord.Color.blue().value,
+    footer_text="Ticket #{ticket_number}",
+    buttons=[close_ticket_btn, export_ticket_btn],
+)
+
 
 class NewTicketInfoEmbed:
     """
@@ -38,32 +59,19 @@ class NewTicketInfoEmbed:
 
         """
         try:
-            await EmbedsManager.send_embed(
+            await EmbedsManager.send_template(
                 ctx_or_interaction,
+                new_ticket_info_template,
                 channel=channel,
-                title="🗳 Support Ticket Opened",
-                description=(
-                    "Hello there! Please describe your issue(s) in as much detail as possible.\n\n"
-                    "**🔹 Below is a suggested template:**\n"
-                    "1️⃣ **Type of issue** (e.g. bug, clarification required)\n"
-                    "2️⃣ **Issue description** (e.g. button does not work)\n"
-                    "3️⃣ **Urgency** (e.g. low priority, very urgent)\n\n"
-                    "⚠️ **If reaching out for help with a bug, provide steps to reproduce it.**\n\n"
-                    "📌 **Note:** Tickets will be addressed as soon as possible.\n"
-                    "You will typically get a **first response within 24 hours**, "
-                    "but resolution time may vary. Thank you for your understanding!"
-                ),
-                color=discord.Color.blue().value,
-                footer_text=f"Ticket #{ticket_number}",
-                buttons=[close_ticket_btn, export_ticket_btn],
+                ticket_number=ticket_number,
             )
 
-            await EmbedsManager.send_embed(
+            await EmbedsManager.send_template(
                 ctx_or_interaction,
-                title="Ticket Created",
-                description=f"✅ Support ticket created: {channel.mention}",
-                color=discord.Color.green().value,
+                ticket_created_template,
                 ephemeral=True,
+                ticket_kind="Support ticket",
+                channel_mention=channel.mention,
             )
 
             return True
@@ -0,0 +1,281 @@
+"""
+Interaction router module for dispatching Discord component interactions.
+
+This module provides a single `on_interaction` listener that routes button,
+select and modal interactions to registered handlers. Handlers are looked up
+by component kind and custom id, falling back to the namespace of the custom id
+(the part before `#`, e.g. `common` in `common#close_ticket.close_ticket`), so
+every lookup is a constant-time dictionary access. The latency and error count
+of each handler are recorded for diagnostics.
+
+Discord requires interactions to be responded to within 3 seconds. Handlers that
+have not responded within a budget are deferred automatically and are expected
+to respond through a followup (see `respond_to_interaction` in discord_svc).
+Handlers that always respond right away themselves can opt out of this.
+"""
+
+import asyncio
+import time
+from typing import Callable, Dict, Optional, Set, Tuple
+
+import discord
+from discord.ext import commands
+
+from bot.config.interactions import interactions_config
+from bot.utils.console_logger import console_logger
+from bot.utils.tracing import span
+
+# discord error code for an interaction that expired before it was responded to
+UNKNOWN_INTERACTION = 10062
+
+# component kinds that can be routed, keyed by their discord component type
+COMPONENT_KINDS = {
+    discord.ComponentType.button.value: "button",
+    discord.ComponentType.select.value: "select",
+}
+
+
+class HandlerStats:
+    """
+    Latency and error statistics of an interaction handler.
+
+    Attributes:
+        calls (int): The number of times the handler was called.
+        errors (int): The number of calls that raised an exception.
+        total_latency (float): The total seconds spent in the handler.
+        max_latency (float): The longest single call in seconds.
+        deferred (int): The number of calls that were deferred automatically.
+        late_failures (int): The number of calls whose interaction expired before a response.
+
+    """
+
+    def __init__(self):
+        """
+        Initialize empty HandlerStats.
+        """
+        self.calls = 0
+        self.errors = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.deferred = 0
+        self.late_failures = 0
+
+    @property
+    def average_latency(self) -> float:
+        """
+        Get the average latency of the handler.
+
+        Returns:
+            float: The average seconds per call.
+
+        """
+        return self.total_latency / self.calls if self.calls else 0.0
+
+    def record(self, latency: float, failed: bool):
+        """
+        Record a call of the handler.
+
+        Args:
+            latency (float): The seconds spent in the call.
+            failed (bool): Whether the call raised an exception.
+
+        """
+        self.calls += 1
+        self.errors += int(failed)
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+
+
+class InteractionRouter:
+    """
+    Route component interactions to their handlers.
+    """
+
+    _handlers: Dict[Tuple[str, str], Callable] = {}
+    _no_auto_defer: Set[Tuple[str, str]] = set()
+    _stats: Dict[str, HandlerStats] = {}
+    _bot: Optional[commands.Bot] = None
+
+    @classmethod
+    def setup(cls, bot: commands.Bot):
+        """
+        Initialize the router with the bot instance.
+
+        Args:
+            bot (commands.Bot): The bot to register the listener on.
+
+        """
+        cls._bot = bot
+
+        @bot.listen("on_interaction")
+        async def on_component_interaction(interaction: discord.Interaction):
+            """
+            Route a component interaction to its handler.
+
+            Args:
+                interaction (discord.Interaction): The interaction from Discord.
+
+            """
+            await cls.dispatch(interaction)
+
+    @classmethod
+    def register(cls, kind: str, custom_id: str, handler: Callable, auto_defer: bool = True):
+        """
+        Register a handler for a custom id or a namespace of custom ids.
+
+        Args:
+            kind (str): The component kind, one of 'button', 'select' or 'modal'.
+            custom_id (str): The custom id, or a namespace ending with '#' to handle all its custom ids.
+            handler (Callable): The coroutine function called with the interaction.
+            auto_defer (bool): Whether the interaction is deferred if the handler is slow to respond. Handlers
+                that respond right away themselves should disable it, so the two do not race to respond.
+
+        """
+        cls._handlers[(kind, custom_id)] = handler
+        if auto_defer:
+            cls._no_auto_defer.discard((kind, custom_id))
+        else:
+            cls._no_auto_defer.add((kind, custom_id))
+
+    @classmethod
+    def unregister(cls, kind: str, custom_id: str):
+        """
+        Unregister the handler of a custom id or namespace.
+
+        Args:
+            kind (str): The component kind, one of 'button', 'select' or 'modal'.
+            custom_id (str): The custom id or namespace to remove.
+
+        """
+        cls._handlers.pop((kind, custom_id), None)
+        cls._no_auto_defer.discard((kind, custom_id))
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, HandlerStats]:
+        """
+        Get the statistics of all handlers that were called.
+
+        Returns:
+            Dict[str, HandlerStats]: The statistics keyed by 'kind:custom_id'.
+
+        """
+        return dict(cls._stats)
+
+    @classmethod
+    async def dispatch(cls, interaction: discord.Interaction):
+        """
+        Dispatch a component interaction to its handler.
+
+        Interactions without a handler get a single "unavailable" reply.
+
+        Args:
+            interaction (discord.Interaction): The interaction from Discord.
+
+        Raises:
+            Exception: Re-raises any exception from the handler after recording it.
+
+        """
+        if not interaction.data:
+            return
+
+        if interaction.type == discord.InteractionType.modal_submit:
+            kind = "modal"
+        else:
+            kind = COMPONENT_KINDS.get(interaction.data.get("component_type"))
+        custom_id = interaction.data.get("custom_id")
+        if not kind or not custom_id:
+            return
+
+        key = (kind, custom_id)
+        handler = cls._handlers.get(key)
+        if handler is None and "#" in custom_id:
+            key = (kind, custom_id.split("#", 1)[0] + "#")
+            handler = cls._handlers.get(key)
+
+        if handler is None:
+            if not interaction.response.is_done():
+                await interaction.response.send_message(
+                    "⚠️ This feature is disabled or unavailable.",
+                    ephemeral=True,
+                )
+            return
+
+        stats = cls._stats.setdefault(f"{key[0]}:{key[1]}", HandlerStats())
+        start = time.perf_counter()
+        failed = False
+        try:
+            with span("interaction.dispatch", kind=kind, custom_id=custom_id):
+                if key in cls._no_auto_defer:
+                    await handler(interaction)
+                else:
+                    await cls._run_with_deadline(interaction, handler, stats)
+        except Exception as e:
+            failed = True
+            if isinstance(e, discord.NotFound) and e.code == UNKNOWN_INTERACTION:
+                stats.late_failures += 1
+            console_logger.error(f"❌ Interaction handler for {kind} {custom_id} failed.")
+            raise
+        finally:
+            stats.record(time.perf_counter() - start, failed)
+
+    @classmethod
+    async def _run_with_deadline(cls, interaction: discord.Interaction, handler: Callable, stats: HandlerStats):
+        """
+        Run a handler, deferring the interaction if it has not responded within the budget.
+
+        Args:
+            interaction (discord.Interaction): The interaction from Discord.
+            handler (Callable): The handler of the interaction.
+            stats (HandlerStats): The statistics of the handler.
+
+        """
+        age = (discord.utils.utcnow() - interaction.created_at).total_seconds()
+        remaining_budget = interactions_config.interaction_defer_budget - age
+
+        # with no budget left, defer before the handler starts, so the two cannot race to respond
+        deferred = False
+        if remaining_budget <= 0:
+            deferred = await cls._defer(interaction, stats)
+            task = asyncio.create_task(handler(interaction))
+        else:
+            task = asyncio.create_task(handler(interaction))
+            done, _ = await asyncio.wait({task}, timeout=remaining_budget)
+            if not done and not interaction.response.is_done():
+                deferred = await cls._defer(interaction, stats)
+
+        await task
+
+        # the handler may have answered in the channel instead of a followup, leaving the thinking message behind
+        if deferred:
+            try:
+                original_response = await interaction.original_response()
+                if original_response.flags.loading:
+                    await interaction.delete_original_response()
+            except discord.HTTPException:
+                pass
+
+    @classmethod
+    async def _defer(cls, interaction: discord.Interaction, stats: HandlerStats) -> bool:
+        """
+        Defer an interaction with an ephemeral thinking state.
+
+        Args:
+            interaction (discord.Interaction): The interaction to defer.
+            stats (HandlerStats): The statistics of the handler.
+
+        Returns:
+            bool: True if the interaction was deferred, False otherwise.
+
+        """
+        try:
+            await interaction.response.defer(ephemeral=True, thinking=True)
+        except discord.NotFound as e:
+            if e.code == UNKNOWN_INTERACTION:
+                stats.late_failures += 1
+            return False
+        except (discord.InteractionResponded, discord.HTTPException):
+            # the handler responded in the meantime
+            return False
+
+        stats.deferred += 1
+        return True
@@ -12,11 +12,16 @@ import discord
 from discord.ext import commands
 
 from bot.models.prompt import Prompt
+from bot.services.discord_svc import respond_to_interaction
+from bot.ui.interaction_router import InteractionRouter
 from bot.utils.console_logger import console_logger
 
 # maps the id of a prompt to the text content it shows
 PROMPT_ID_TO_TEXT_MAPPING = {}
 
+# custom id of the select menu that shows prompt suggestions
+PROMPT_SELECT_ID = "prompt_suggestion_select"
+
 
 class PromptView(discord.ui.View):
     """
@@ -38,7 +43,7 @@ class PromptView(discord.ui.View):
             discord.ui.Select(
                 placeholder="Click Me!",
                 options=options,
-                custom_id="prompt_suggestion_select",
+                custom_id=PROMPT_SELECT_ID,
             )
         )
 
@@ -57,38 +62,31 @@ class PromptsManager:
         Initialize the manager with the bot instance.
 
         Args:
-            bot (commands.Bot): The bot to register listeners on.
+            bot (commands.Bot): The bot instance.
 
         """
         cls._bot = bot
 
-        @bot.listen("on_interaction")
-        async def on_prompt_interaction(interaction: discord.Interaction):
-            """
-            Route a prompt interaction to its callback.
-
-            Args:
-                interaction (discord.Interaction): The interaction from Discord.
+        # prompts share one select menu, the selected value identifies the prompt
+        InteractionRouter.register("select", PROMPT_SELECT_ID, cls.on_prompt_selected)
 
-            """
-            if not interaction.data:
-                return
-
-            component_type = interaction.data.get("component_type")
+    @classmethod
+    async def on_prompt_selected(cls, interaction: discord.Interaction):
+        """
+        Route a selected prompt to its callback.
 
-            # handle prompts only
-            if component_type != discord.ComponentType.select.value:
-                return
+        Args:
+            interaction (discord.Interaction): The interaction from Discord.
 
-            custom_id = interaction.data["values"][0]
-            if custom_id in cls._prompt_callbacks and not interaction.response.is_done():
+        """
+        custom_id = interaction.data["values"][0]
+        if custom_id in cls._prompt_callbacks:
+            # the router may already have deferred the interaction if it arrived late
+            if not interaction.response.is_done():
                 await interaction.response.defer()
-                await cls._prompt_callbacks[custom_id](interaction, custom_id)
-            else:
-                await interaction.response.send_message(
-                    "⚠️ This feature is disabled or unavailable.",
-                    ephemeral=True,
-                )
+            await cls._prompt_callbacks[custom_id](interaction, custom_id)
+        else:
+            await respond_to_interaction(interaction, "⚠️ This feature is disabled or unavailable.", ephemeral=True)
 
     @classmethod
     def register_callback(cls, custom_id: str, text: str, callback: Callable):
@@ -113,6 +111,7 @@ class PromptsManager:
             custom_id (str): The ID to remove.
 
         """
+        PROMPT_ID_TO_TEXT_MAPPING.pop(custom_id, None)
         cls._prompt_callbacks.pop(custom_id, None)
 
     @classmethod
@@ -3,13 +3,84 @@ Logger configuration module for console output with OTEL integration.
 
 This module sets up the standard console logger and attaches the OTEL handler
 (from otel_handler.py) so that logs are both printed to the console and sent
-to the OpenTelemetry Collector in a structured format.
+to the OpenTelemetry Collector in a structured format. The OTEL handler is only
+imported when OTEL is enabled, since its exporter dependencies are slow to import.
+
+Log records are put on a queue by the logger and handled by a listener on a
+background thread, so formatting and writing logs never blocks the event loop.
 """
 
+import atexit
+import copy
+import json
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
 from bot.config.logging import logging_config
-from bot.utils.otel_handler import otel_handler
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formatter that outputs each log record as a single line of JSON.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Format a log record as JSON.
+
+        Args:
+            record (logging.LogRecord): The log record to format.
+
+        Returns:
+            str: The JSON encoded log record.
+
+        """
+        entry = {
+            "timestamp": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        # records from the queue carry their traceback already formatted in exc_text
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class TracebackQueueHandler(QueueHandler):
+    """
+    Queue handler that keeps the traceback of a record apart from its message.
+
+    The standard QueueHandler merges the traceback into the message and drops the
+    exception info, so formatters on the other side of the queue cannot tell them
+    apart. Here the traceback is formatted into `exc_text` instead, which both the
+    JSON formatter and the standard formatter output.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Prepare a record for the queue, keeping its traceback in `exc_text`.
+
+        Args:
+            record (logging.LogRecord): The record to prepare.
+
+        Returns:
+            logging.LogRecord: A copy of the record with its message and traceback formatted.
+
+        """
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        # the traceback object is not needed anymore and would keep its frames alive
+        record.exc_info = None
+        return record
+
 
 # creates logger
 console_logger = logging.getLogger(logging_config.logger_prefix)
@@ -19,16 +90,28 @@ log_level_num = getattr(logging, logging_config.logger_level.upper(), logging.IN
 console_logger.setLevel(log_level_num)
 
 # formats logger output
-formatter = logging.Formatter(logging_config.logger_format)
+formatter = JsonFormatter() if logging_config.logger_json_enabled else logging.Formatter(logging_config.logger_format)
+handlers = []
 
 # sets the otel formatter and handler
 if logging_config.otel_enabled:
+    from bot.utils.otel_handler import otel_handler
+
     otel_handler.setFormatter(formatter)
-    console_logger.addHandler(otel_handler)
+    handlers.append(otel_handler)
 
 # sets the stream formatter and handler
 stream_handler = logging.StreamHandler()
 stream_handler.setFormatter(formatter)
-console_logger.addHandler(stream_handler)
+handlers.append(stream_handler)
+
+# routes records through a queue, the handlers above run on the listener's background thread
+log_queue = queue.SimpleQueue()
+queue_handler = TracebackQueueHandler(log_queue)
+console_logger.addHandler(queue_handler)
+
+queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+queue_listener.start()
+atexit.register(queue_listener.stop)
 
 console_logger.info("✅ Logger is successfully configured.")
@@ -0,0 +1,78 @@
+"""
+Import profiler module for measuring module import times at startup.
+
+When the IMPORT_PROFILING_ENABLED environment variable is set, every import made
+after this module is loaded is timed, similar to running python with
+`-X importtime`, and a summary of the slowest imports can be logged once the bot
+is ready. This module must be imported before anything else to see all imports,
+and it deliberately avoids importing config or logging modules at load time.
+"""
+
+import builtins
+import os
+import sys
+import time
+from typing import Dict
+
+# number of slowest imports shown in the summary
+SUMMARY_SIZE = 15
+
+enabled = os.getenv("IMPORT_PROFILING_ENABLED", "false").lower() in ("1", "true", "yes")
+
+# cumulative seconds spent importing each module (including its own imports)
+import_timings: Dict[str, float] = {}
+
+_original_import = builtins.__import__
+_depth = 0
+_total_time = 0.0
+
+
+def _timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+    """
+    Import a module like the builtin `__import__`, timing it if it is not yet loaded.
+
+    Args:
+        name: The name of the module to import.
+        globals: The globals of the importing module.
+        locals: The locals of the importing module.
+        fromlist: The names imported from the module.
+        level: The level of a relative import.
+
+    Returns:
+        module: The imported module.
+
+    """
+    global _depth, _total_time
+    if level or name in sys.modules:
+        return _original_import(name, globals, locals, fromlist, level)
+
+    start = time.perf_counter()
+    _depth += 1
+    try:
+        return _original_import(name, globals, locals, fromlist, level)
+    finally:
+        _depth -= 1
+        elapsed = time.perf_counter() - start
+        import_timings[name] = import_timings.get(name, 0.0) + elapsed
+        if _depth == 0:
+            _total_time += elapsed
+
+
+def log_summary():
+    """
+    Log the total import time and the slowest imports, then stop profiling.
+    """
+    if not enabled:
+        return
+
+    builtins.__import__ = _original_import
+
+    from bot.utils.console_logger import console_logger
+
+    console_logger.info(f"⏱️ Imports took {_total_time:.2f}s, slowest imports (cumulative):")
+    for name, seconds in sorted(import_timings.items(), key=lambda item: item[1], reverse=True)[:SUMMARY_SIZE]:
+        console_logger.info(f"⏱️ {seconds * 1000:8.1f}ms  {name}")
+
+
+if enabled:
+    builtins.__import__ = _timed_import
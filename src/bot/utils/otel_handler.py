@@ -3,7 +3,9 @@ OpenTelemetry Logging Handler Module.
 
 Sets up the OpenTelemetry LoggerProvider, exporter, and processor.
 Defines OTELHandler for Python's logging module that forwards logs
-to the OTEL Collector in structured format.
+to the OTEL Collector in structured format. Also sets up the
+TracerProvider that exports spans created through utils/tracing.py to
+the same collector. This module is only imported when OTEL is enabled.
 
 The code snippet below is taken from the otel python example here:
 https://github.com/open-telemetry/opentelemetry-python/tree/main/docs/examples/logs
@@ -16,27 +18,28 @@ from opentelemetry._logs import set_logger_provider
 from opentelemetry.exporter.otlp.proto.grpc._log_exporter import (
     OTLPLogExporter,
 )
+from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
 from opentelemetry.sdk._logs import LoggerProvider, LoggingHandler
 from opentelemetry.sdk._logs.export import BatchLogRecordProcessor
 from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import (
-    BatchSpanProcessor,
-    ConsoleSpanExporter,
-)
+from opentelemetry.sdk.trace.export import BatchSpanProcessor
 
 from bot.config.logging import logging_config
 
-trace.set_tracer_provider(TracerProvider())
-trace.get_tracer_provider().add_span_processor(BatchSpanProcessor(ConsoleSpanExporter()))
+resource = Resource.create(
+    {
+        "service.name": "rcb-discord-bot",
+    }
+)
 
-logger_provider = LoggerProvider(
-    resource=Resource.create(
-        {
-            "service.name": "rcb-discord-bot",
-        }
-    ),
+tracer_provider = TracerProvider(resource=resource)
+tracer_provider.add_span_processor(
+    BatchSpanProcessor(OTLPSpanExporter(endpoint=logging_config.otel_endpoint, insecure=True))
 )
+trace.set_tracer_provider(tracer_provider)
+
+logger_provider = LoggerProvider(resource=resource)
 set_logger_provider(logger_provider)
 
 exporter = OTLPLogExporter(endpoint=logging_config.otel_endpoint, insecure=True)
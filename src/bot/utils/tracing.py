@@ -0,0 +1,68 @@
+"""
+Tracing module providing a small facade over OpenTelemetry spans.
+
+Spans are only recorded when OTEL is enabled; otherwise `span` returns a no-op
+context manager and `traced` returns the decorated function unchanged, so
+tracing the hot paths costs nothing when it is turned off. The tracer provider
+and exporter are set up in otel_handler.py.
+"""
+
+from contextlib import nullcontext
+from functools import wraps
+from typing import Any, Callable, ContextManager, Optional
+
+from bot.config.logging import logging_config
+
+if logging_config.otel_enabled:
+    from opentelemetry import trace
+
+    tracer = trace.get_tracer("rcb-discord-bot")
+else:
+    tracer = None
+
+
+def span(name: str, **attributes: Any) -> ContextManager:
+    """
+    Start a span around a block of code.
+
+    Args:
+        name (str): The name of the span (e.g. 'mcp.call_tool').
+        **attributes (Any): Attributes to set on the span, None values are skipped.
+
+    Returns:
+        ContextManager: The span context, or a no-op context when tracing is disabled.
+
+    """
+    if tracer is None:
+        return nullcontext()
+    return tracer.start_as_current_span(
+        name, attributes={key: value for key, value in attributes.items() if value is not None}
+    )
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """
+    Decorate an async function to run inside a span.
+
+    Args:
+        name (Optional[str]): The name of the span, defaults to the function's qualified name.
+
+    Returns:
+        Callable: The decorator, which leaves functions unchanged when tracing is disabled.
+
+    """
+
+    def decorator(func: Callable) -> Callable:
+        if tracer is None:
+            return func
+
+        span_name = name or f"{func.__module__}.{func.__qualname__}"
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            with tracer.start_as_current_span(span_name):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
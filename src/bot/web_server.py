@@ -11,6 +11,7 @@ from aiohttp import web
 
 from bot.config.alerts import alerts_config
 from bot.utils.console_logger import console_logger
+from bot.utils.tracing import traced
 
 
 class WebServer:
@@ -36,6 +37,7 @@ class WebServer:
         # todo: maybe move api version into a separate file or abstract urls to a constant file
         self.app.add_routes([web.post("/api/v1/webhooks/service", self.handle_request)])
 
+    @traced("webhook.handle_request")
     async def handle_request(self, request):
         """
         Handle incoming POST requests by parsing JSON data and dispatching it.